@@ -1,15 +1,14 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
-import argparse
 import base64
 import csv
 import datetime as dt
+import functools
 import json
 import math
 import mimetypes
 import os
-import plistlib
 import random
 import re
 import signal
@@ -21,17 +20,20 @@ import subprocess
 import sys
 import threading
 import time
-import uuid
 import zlib
+from concurrent.futures import FIRST_EXCEPTION, Future, ThreadPoolExecutor, wait
 from contextlib import contextmanager
 from dataclasses import dataclass, field, replace
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
-from typing import Any, Callable, Iterable, cast
+from typing import TYPE_CHECKING, Any, Callable, Iterable, cast
 from urllib import error as urllib_error
 from urllib import request as urllib_request
 from urllib.parse import parse_qs, urlencode, urlparse
 
+if TYPE_CHECKING:
+    import argparse
+
 try:
     import tomllib
 except ModuleNotFoundError as exc:  # pragma: no cover
@@ -44,7 +46,15 @@ try:
 except ModuleNotFoundError:  # pragma: no cover
     fcntl = None  # type: ignore[assignment]
 
+try:
+    import orjson  # type: ignore[import-not-found]
+except ModuleNotFoundError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
 INFO_SUFFIX = ".info.json"
+INFO_SUFFIX_LEN = len(INFO_SUFFIX)
+DESCRIPTION_SUFFIX = ".description"
+DESCRIPTION_SUFFIX_LEN = len(DESCRIPTION_SUFFIX)
 DEFAULT_CONFIG = Path("config/sources.toml")
 DEFAULT_LEDGER_DB = Path("data/master_ledger.sqlite")
 DEFAULT_LEDGER_CSV = Path("data/master_ledger.csv")
@@ -67,11 +77,43 @@ DEFAULT_DICT_ENCODING = "utf-8"
 DEFAULT_DICT_PATH = Path("data/eijiro-1449.utf8.txt")
 DEFAULT_DICT_LOOKUP_LIMIT = 8
 DICT_INDEX_BATCH_SIZE = 2000
+SQLITE_IN_CLAUSE_BATCH_SIZE = 900
 DEFAULT_WEB_HOST = "127.0.0.1"
 DEFAULT_WEB_PORT = 8876
-WEB_STATIC_DIR = Path(__file__).resolve().parent / "web"
+WEB_VIDEO_EXISTS_CACHE_TTL_SEC = 60.0
+WEB_VIDEO_EXISTS_CACHE_MAX_ENTRIES = 4096
+WEB_SQLITE_CACHED_STATEMENTS = 128
+LEDGER_SQLITE_CACHED_STATEMENTS = 256
+# Batch-oriented CLI writers (sync, ledger, asr, loudness, dict-index, imports,
+# queue requeue, translate-local):
+# WAL with synchronous=NORMAL fsyncs at checkpoints instead of on every commit.
+LEDGER_WRITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456",
+)
+# Only the ledger rebuild commits batches large enough to want fewer
+# checkpoints; other writers keep SQLite's 1000-page default.
+LEDGER_REBUILD_WAL_AUTOCHECKPOINT_PAGES = 10000
+WEB_SQLITE_MMAP_SIZE_BYTES = 1024 * 1024 * 1024
+WEB_BOOKMARK_BATCH_MAX_ROWS = 5000
+DICTIONARY_LOOKUP_PATH_MAX_ITEMS = 24
+DEFAULT_WEB_MAX_WORKERS = max(8, (os.cpu_count() or 4) * 2)
+MEDIA_PROBE_MAX_WORKERS = max(1, os.cpu_count() or 1)
+META_LOAD_MAX_WORKERS = 8
+META_LOAD_BATCH_SIZE = 256
+MP4_MOOV_MAX_BYTES = 32 * 1024 * 1024
+WEB_JSON_STREAM_CHUNK_CHARS = 64 * 1024
+WEB_JSON_STREAM_ENCODER = json.JSONEncoder(ensure_ascii=False)
+SCRIPT_PATH = Path(__file__).resolve()
+WEB_STATIC_DIR = SCRIPT_PATH.parent / "web"
 MISSING_DICT_ENTRY_ID_BASE = 3_000_000_000
 DEFAULT_DICT_BOOKMARK_EXPORT_DIR = Path("exports")
+EXPORT_TIMESTAMP_FORMAT = "%Y%m%dT%H%M%SZ"
+EXPORT_WRITE_BUFFER_BYTES = 1024 * 1024
+LEDGER_CSV_FETCH_ROWS = 10000
 DEFAULT_NOTIFY_WEB_URL_BASE = f"http://{DEFAULT_WEB_HOST}:{DEFAULT_WEB_PORT}"
 DEFAULT_NOTIFY_LLM_LOOKBACK_HOURS = 24
 DEFAULT_NOTIFY_MACOS_LABEL = "com.substudy.notify"
@@ -169,7 +211,30 @@ AUTO_TAG_METRIC_KEYS = frozenset(
     }
 )
 _SOURCE_ACCESS_UNSET = object()
+TRUTHY_TEXT_VALUES = frozenset({"1", "true", "yes", "y", "on"})
+FALSY_TEXT_VALUES = frozenset({"0", "false", "no", "n", "off"})
 RE_TRANSLATION_ASCII = re.compile(r"[A-Za-z]")
+# First through last [a-z0-9]; trims both edges in a single search.
+RE_DICTIONARY_TERM_CORE = re.compile(r"[a-z0-9](?:.*[a-z0-9])?", re.DOTALL)
+RE_DICTIONARY_FTS_TOKEN_STRIP = re.compile(r"[^a-z0-9-]+")
+RE_EIJIRO_HEAD_ANNOTATION = re.compile(r"\s+\{[^{}]+\}\s*$")
+# Quote/dash folding plus separator punctuation mapped to spaces; runs of
+# spaces are collapsed afterwards.
+DICTIONARY_TERM_TRANSLATION = str.maketrans(
+    {
+        "’": "'",
+        "‘": "'",
+        "`": "'",
+        '"': " ",
+        "“": " ",
+        "”": " ",
+        "‐": "-",
+        "‑": "-",
+        "–": "-",
+        "—": "-",
+        **dict.fromkeys(",:;!?()[]{}<>", " "),
+    }
+)
 RE_TRANSLATION_JA = re.compile(r"[ぁ-んァ-ヶ一-龯々ー]")
 RE_RETRY_TIKTOK_BLOCKED = re.compile(
     r"(your ip address is blocked from accessing this post|"
@@ -194,6 +259,11 @@ RE_RETRY_MISSING_ARTIFACT = re.compile(
     r"did not write a terminal download_state row)",
     re.IGNORECASE,
 )
+RE_WEB_BOOKMARK_PATH = re.compile(r"/api/bookmarks/(\d+)")
+RE_WEB_BOOKMARK_NOTE_PATH = re.compile(r"/api/bookmarks/(\d+)/note")
+RE_WEB_BYTE_RANGE = re.compile(r"bytes=(\d*)-(\d*)")
+RE_TIKTOK_HANDLE = re.compile(r"tiktok\.com/@([^/?]+)")
+RE_MEDIA_VIDEO_ID_FALLBACK = re.compile(r"(\d{10,})")
 RE_TIKTOK_ERROR_VIDEO_ID = re.compile(
     r"ERROR:\s*\[TikTok\]\s*(?P<video_id>\d{10,})\s*:\s*(?P<message>.+)",
     re.IGNORECASE,
@@ -220,7 +290,7 @@ _YTDLP_IMPERSONATE_TARGETS_CACHE: dict[str, list[str]] = {}
 _YTDLP_IMPERSONATE_WARNED_KEYS: set[tuple[str, str]] = set()
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GlobalConfig:
     ledger_db: Path
     ledger_csv: Path
@@ -237,7 +307,7 @@ class AutoTagRule:
     min_total_videos: int = 1
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SourceConfig:
     id: str
     platform: str
@@ -377,6 +447,46 @@ def now_utc_iso() -> str:
     return dt.datetime.now(dt.timezone.utc).replace(microsecond=0).isoformat()
 
 
+def now_utc_compact_stamp() -> str:
+    return time.strftime(EXPORT_TIMESTAMP_FORMAT, time.gmtime())
+
+
+def json_dumps_compact(value: Any) -> str:
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def decode_json_request_body(raw_body: bytes) -> Any:
+    # orjson parses the raw bytes (UTF-8 validation included) in one C pass.
+    if orjson is not None:
+        return orjson.loads(raw_body)
+    return json.loads(raw_body.decode("utf-8"))
+
+
+def decode_json_file_bytes(raw_bytes: bytes) -> Any:
+    # yt-dlp may write NaN/Infinity or integers beyond 64 bits, which orjson
+    # rejects; the stdlib parser accepts both.
+    if orjson is not None:
+        try:
+            return orjson.loads(raw_bytes)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw_bytes.decode("utf-8"))
+
+
+def encode_json_response_body(payload: Any) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+    return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+
 def get_queue_producer_lock_path(db_path: Path) -> Path:
     safe_db_path = Path(db_path).expanduser().resolve()
     return safe_db_path.parent / "locks" / DEFAULT_PRODUCER_LOCK_FILE_NAME
@@ -532,11 +642,14 @@ def compute_review_priority_score(
 
 
 def resolve_path(base: Path, raw_value: str | None, default: str) -> Path:
-    value = raw_value if raw_value not in (None, "") else default
-    candidate = Path(value).expanduser()
-    if candidate.is_absolute():
-        return candidate
-    return (base / candidate).resolve()
+    value = os.path.expanduser(raw_value if raw_value not in (None, "") else default)
+    if os.path.isabs(value):
+        return Path(value)
+    # Callers pass an already-resolved base (cwd or a resolved data_dir), so a
+    # lexical join avoids resolve()'s lstat walk over every component.
+    if os.path.isabs(base):
+        return Path(os.path.normpath(os.path.join(base, value)))
+    return (base / value).resolve()
 
 
 def is_path_like_command(command: str) -> bool:
@@ -555,6 +668,21 @@ def find_executable_command(command: str) -> str | None:
     return shutil.which(value)
 
 
+FFMPEG_TOOL_CACHE: dict[str, str] = {}
+
+
+def find_ffmpeg_tool(command: str) -> str | None:
+    # ffmpeg/ffprobe are looked up per stage and per video; resolve the PATH
+    # scan once per process. Misses are not cached, so a long-running worker
+    # picks the tool up once it is installed.
+    resolved = FFMPEG_TOOL_CACHE.get(command)
+    if resolved is None:
+        resolved = find_executable_command(command)
+        if resolved is not None:
+            FFMPEG_TOOL_CACHE[command] = resolved
+    return resolved
+
+
 def resolve_executable_command(command: str) -> str:
     resolved = find_executable_command(command)
     if resolved is not None:
@@ -768,7 +896,7 @@ def resolve_source_root(
 
 
 def infer_tiktok_handle(url: str) -> str | None:
-    match = re.search(r"tiktok\.com/@([^/?]+)", url)
+    match = RE_TIKTOK_HANDLE.search(url)
     if match:
         return match.group(1)
     return None
@@ -832,14 +960,13 @@ def parse_ext_list(raw_value: Any) -> list[str]:
     else:
         raise ValueError("asr_prefer_exts must be a string or list of strings.")
 
-    exts: list[str] = []
-    seen: set[str] = set()
-    for candidate in candidates:
-        normalized = candidate.strip().lower().lstrip(".")
-        if not normalized or normalized in seen:
-            continue
-        seen.add(normalized)
-        exts.append(normalized)
+    exts = list(
+        dict.fromkeys(
+            normalized
+            for normalized in (candidate.strip().lower().lstrip(".") for candidate in candidates)
+            if normalized
+        )
+    )
     return exts or list(DEFAULT_ASR_EXTS)
 
 
@@ -1197,7 +1324,48 @@ def merge_source_rows_with_managed_overrides(
     return merged_rows, origin_by_id
 
 
+CONFIG_CACHE: dict[
+    tuple[str, str],
+    tuple[tuple[Any, ...], tuple[GlobalConfig, list[SourceConfig]]],
+] = {}
+
+
+def clear_config_cache() -> None:
+    CONFIG_CACHE.clear()
+
+
+def config_file_signature(path: Path) -> tuple[int, int, int] | None:
+    try:
+        stat_result = os.stat(path)
+    except OSError:
+        return None
+    return stat_result.st_mtime_ns, stat_result.st_size, stat_result.st_ino
+
+
 def load_config(config_path: Path) -> tuple[GlobalConfig, list[SourceConfig]]:
+    # Reuse the parsed bundle while sources.toml and the managed targets file
+    # are unchanged; relative paths in the config resolve against cwd.
+    config_signature = config_file_signature(config_path)
+    if config_signature is None:
+        raise FileNotFoundError(f"Config file not found: {config_path}")
+    cache_key = (os.path.abspath(config_path), os.getcwd())
+    signatures = (
+        config_signature,
+        config_file_signature(resolve_managed_targets_path(config_path)),
+    )
+    entry = CONFIG_CACHE.get(cache_key)
+    if entry is not None and entry[0] == signatures:
+        cached = entry[1]
+    else:
+        # Replace rather than add, so edits to either file never pile up
+        # stale bundles under the same path.
+        cached = load_config_uncached(config_path)
+        CONFIG_CACHE[cache_key] = (signatures, cached)
+    global_config, sources = cached
+    return global_config, list(sources)
+
+
+def load_config_uncached(config_path: Path) -> tuple[GlobalConfig, list[SourceConfig]]:
     if not config_path.exists():
         raise FileNotFoundError(f"Config file not found: {config_path}")
 
@@ -1716,6 +1884,19 @@ def _terminate_process_group(
         return
 
 
+# Children run in their own session, so Ctrl-C only reaches the calling
+# thread; concurrent stage runners terminate the rest through this registry.
+ACTIVE_COMMAND_PROCESSES: set[subprocess.Popen[str]] = set()
+ACTIVE_COMMAND_PROCESSES_LOCK = threading.Lock()
+
+
+def terminate_active_command_processes() -> None:
+    with ACTIVE_COMMAND_PROCESSES_LOCK:
+        processes = list(ACTIVE_COMMAND_PROCESSES)
+    for process in processes:
+        _terminate_process_group(process)
+
+
 def run_command_with_output(command: list[str], dry_run: bool) -> tuple[int, str]:
     print("$", shlex.join(command))
     if dry_run:
@@ -1729,6 +1910,8 @@ def run_command_with_output(command: list[str], dry_run: bool) -> tuple[int, str
         bufsize=1,
         start_new_session=True,
     )
+    with ACTIVE_COMMAND_PROCESSES_LOCK:
+        ACTIVE_COMMAND_PROCESSES.add(completed)
     stdout_chunks: list[str] = []
     stderr_chunks: list[str] = []
     stdout_thread = threading.Thread(
@@ -1770,6 +1953,9 @@ def run_command_with_output(command: list[str], dry_run: bool) -> tuple[int, str
         stdout_thread.join(timeout=2.0)
         stderr_thread.join(timeout=2.0)
         raise
+    finally:
+        with ACTIVE_COMMAND_PROCESSES_LOCK:
+            ACTIVE_COMMAND_PROCESSES.discard(completed)
     stdout_text = "".join(stdout_chunks)
     stderr_text = "".join(stderr_chunks)
     combined_output = "\n".join(
@@ -2448,31 +2634,142 @@ def resolve_metered_media_policy(
     )
 
 
-def read_archive_ids(archive_path: Path) -> list[str]:
-    if not archive_path.exists():
-        return []
+def split_archive_line(line: str) -> tuple[str, str]:
+    # yt-dlp writes "<extractor> <id>"; any other whitespace layout takes split().
+    extractor, sep, video_id = line.partition(" ")
+    if sep and video_id and " " not in video_id and "\t" not in line:
+        return extractor, video_id
+    parts = line.split()
+    if len(parts) >= 2:
+        return parts[0], parts[1]
+    return "", parts[0]
 
-    ids: list[str] = []
-    seen: set[str] = set()
-    for raw_line in archive_path.read_text(encoding="utf-8", errors="ignore").splitlines():
+
+def parse_archive_id_lines(lines: Iterable[str]) -> list[str]:
+    # Dedupe through an insertion-ordered dict.
+    ids: dict[str, None] = {}
+    for raw_line in lines:
         line = raw_line.strip()
         if not line or line.startswith("#"):
             continue
-        parts = line.split()
-        candidate = parts[1] if len(parts) >= 2 else parts[0]
-        if candidate and candidate not in seen:
-            ids.append(candidate)
-            seen.add(candidate)
-    return ids
+        ids[split_archive_line(line)[1]] = None
+    return list(ids)
+
+
+def read_archive_ids(archive_path: Path) -> list[str]:
+    try:
+        with open(archive_path, "r", encoding="utf-8", errors="ignore") as file:
+            return parse_archive_id_lines(file)
+    except FileNotFoundError:
+        return []
+
+
+def get_archive_size(archive_path: Path) -> int:
+    try:
+        return os.stat(archive_path).st_size
+    except OSError:
+        return 0
+
+
+def read_archive_ids_appended_since(archive_path: Path, offset: int) -> list[str] | None:
+    # yt-dlp only appends whole lines to its archive, so ids added after a
+    # snapshot can be read from the old size onward. None means the file
+    # shrank or the offset is not on a line boundary; callers re-read it all.
+    try:
+        with open(archive_path, "rb") as file:
+            if offset > 0:
+                file.seek(offset - 1)
+                if file.read(1) != b"\n":
+                    return None
+            tail = file.read()
+    except FileNotFoundError:
+        return [] if offset == 0 else None
+    return parse_archive_id_lines(tail.decode("utf-8", errors="ignore").splitlines())
 
 
 def list_meta_ids(meta_dir: Path) -> set[str]:
-    if not meta_dir.exists():
+    # Only names are needed, so skip glob's per-entry Path/fnmatch work.
+    try:
+        with os.scandir(meta_dir) as entries:
+            return {
+                entry.name[:-INFO_SUFFIX_LEN]
+                for entry in entries
+                if entry.name.endswith(INFO_SUFFIX)
+            }
+    except (FileNotFoundError, NotADirectoryError):
         return set()
-    ids: set[str] = set()
-    for path in meta_dir.glob(f"*{INFO_SUFFIX}"):
-        ids.add(path.name[: -len(INFO_SUFFIX)])
-    return ids
+
+
+def list_meta_description_ids(meta_dir: Path) -> set[str]:
+    try:
+        with os.scandir(meta_dir) as entries:
+            return {
+                entry.name[:-DESCRIPTION_SUFFIX_LEN]
+                for entry in entries
+                if entry.name.endswith(DESCRIPTION_SUFFIX)
+            }
+    except (FileNotFoundError, NotADirectoryError):
+        return set()
+
+
+# Archive reads and directory scans shared across the media/subs/meta phases
+# of a sync, keyed by (kind, path) and validated against the path's stat
+# signature. yt-dlp may write below any source dir within the mtime
+# resolution, so the sync stages drop the whole cache after each run.
+SYNC_SCAN_CACHE: dict[tuple[str, str], tuple[tuple[int, int, int], Any]] = {}
+
+
+def clear_sync_scan_cache() -> None:
+    SYNC_SCAN_CACHE.clear()
+
+
+def cached_sync_scan(kind: str, path: Path, loader: Callable[[], Any]) -> Any:
+    signature = config_file_signature(path)
+    key = (kind, str(path))
+    cached = SYNC_SCAN_CACHE.get(key)
+    if signature is not None and cached is not None and cached[0] == signature:
+        return cached[1]
+    value = loader()
+    if signature is None:
+        SYNC_SCAN_CACHE.pop(key, None)
+    else:
+        SYNC_SCAN_CACHE[key] = (signature, value)
+    return value
+
+
+def cached_read_archive_ids(archive_path: Path) -> list[str]:
+    return list(
+        cached_sync_scan(
+            "archive",
+            archive_path,
+            lambda: tuple(read_archive_ids(archive_path)),
+        )
+    )
+
+
+def cached_list_meta_ids(meta_dir: Path) -> set[str]:
+    return set(cached_sync_scan("meta", meta_dir, lambda: frozenset(list_meta_ids(meta_dir))))
+
+
+def cached_scan_media_ids(source: SourceConfig) -> set[str]:
+    return set(
+        cached_sync_scan(
+            f"media:{source.video_id_regex}",
+            source.media_dir,
+            lambda: frozenset(scan_media_ids(source)),
+        )
+    )
+
+
+def cached_scan_subtitle_ids(source: SourceConfig) -> set[str]:
+    return set(
+        cached_sync_scan("subs", source.subs_dir, lambda: frozenset(scan_subtitle_ids(source)))
+    )
+
+
+def cached_scan_subtitles(source: SourceConfig) -> dict[str, list[tuple[str, str, str]]]:
+    subtitles = cached_sync_scan("subtitles", source.subs_dir, lambda: scan_subtitles(source))
+    return {video_id: list(tracks) for video_id, tracks in subtitles.items()}
 
 
 def build_video_url(source: SourceConfig, video_id: str) -> str:
@@ -2496,24 +2793,30 @@ def build_video_url(source: SourceConfig, video_id: str) -> str:
 
 
 def write_urls_file(path: Path, urls: list[str]) -> None:
+    # Leave an identical file alone; a size mismatch skips the read.
+    payload = "".join(f"{url}\n" for url in urls).encode("utf-8")
+    try:
+        if os.stat(path).st_size == len(payload) and path.read_bytes() == payload:
+            return
+    except OSError:
+        pass
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as file:
-        for url in urls:
-            file.write(url)
-            file.write("\n")
+    path.write_bytes(payload)
 
 
 def detect_archive_extractor(source: SourceConfig) -> str:
     for candidate in [source.media_archive, source.subs_archive]:
-        if not candidate.exists():
+        try:
+            with open(candidate, "r", encoding="utf-8", errors="ignore") as file:
+                for raw_line in file:
+                    line = raw_line.strip()
+                    if not line or line.startswith("#"):
+                        continue
+                    extractor, _ = split_archive_line(line)
+                    if extractor:
+                        return extractor
+        except FileNotFoundError:
             continue
-        for raw_line in candidate.read_text(encoding="utf-8", errors="ignore").splitlines():
-            line = raw_line.strip()
-            if not line or line.startswith("#"):
-                continue
-            parts = line.split()
-            if len(parts) >= 2 and parts[0]:
-                return parts[0]
     return source.platform.lower()
 
 
@@ -2524,9 +2827,10 @@ def write_archive_ids(path: Path, extractor: str, ids: set[str], dry_run: bool)
         print(f"[archive] dry-run: bootstrap {path} with {len(ids)} IDs")
         return
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as file:
-        for video_id in sorted(ids):
-            file.write(f"{extractor} {video_id}\n")
+    path.write_text(
+        "".join(f"{extractor} {video_id}\n" for video_id in sorted(ids)),
+        encoding="utf-8",
+    )
     print(f"[archive] bootstrapped {path} with {len(ids)} IDs")
 
 
@@ -2534,34 +2838,48 @@ def bootstrap_missing_archives(source: SourceConfig, dry_run: bool) -> None:
     extractor = detect_archive_extractor(source)
 
     if not source.media_archive.exists():
-        media_ids = set(scan_media_files(source))
+        media_ids = cached_scan_media_ids(source)
         write_archive_ids(source.media_archive, extractor, media_ids, dry_run=dry_run)
 
     if not source.subs_archive.exists():
-        subtitle_ids = set(scan_subtitles(source))
+        subtitle_ids = cached_scan_subtitle_ids(source)
         write_archive_ids(source.subs_archive, extractor, subtitle_ids, dry_run=dry_run)
 
 
+@functools.lru_cache(maxsize=128)
+def build_ytdlp_static_retry_flags(
+    sleep_interval: int,
+    max_sleep_interval: int,
+    retry_sleep: int,
+    include_ignore_errors: bool,
+) -> tuple[str, ...]:
+    flags = (
+        "--retries",
+        "infinite",
+        "--fragment-retries",
+        "infinite",
+        "--sleep-interval",
+        str(sleep_interval),
+        "--max-sleep-interval",
+        str(max_sleep_interval),
+        "--retry-sleep",
+        str(retry_sleep),
+    )
+    return ("--ignore-errors", *flags) if include_ignore_errors else flags
+
+
 def build_ytdlp_retry_flags(
     source: SourceConfig,
     include_ignore_errors: bool = True,
 ) -> list[str]:
-    flags: list[str] = []
-    if include_ignore_errors:
-        flags.append("--ignore-errors")
-    flags.extend(
-        [
-            "--retries",
-            "infinite",
-            "--fragment-retries",
-            "infinite",
-            "--sleep-interval",
-            str(source.sleep_interval),
-            "--max-sleep-interval",
-            str(source.max_sleep_interval),
-            "--retry-sleep",
-            str(source.retry_sleep),
-        ]
+    # --sleep-requests is re-jittered on every call, so only the fixed part is cached.
+    flags = list(
+        build_ytdlp_static_retry_flags(
+            source.sleep_interval,
+            source.max_sleep_interval,
+            source.retry_sleep,
+            include_ignore_errors,
+        )
     )
     if source.sleep_requests > 0:
         flags.extend(
@@ -2622,7 +2940,7 @@ def apply_stage_target_limit(target_ids: list[str], limit: int | None) -> list[s
 
 
 def build_run_local_urls_file(source: SourceConfig) -> Path:
-    run_token = f"{int(time.time())}.{os.getpid()}.{uuid.uuid4().hex[:8]}"
+    run_token = f"{int(time.time())}.{os.getpid()}.{os.urandom(4).hex()}"
     return source.media_archive.parent / "tmp" / f"urls.{run_token}.txt"
 
 
@@ -2671,16 +2989,14 @@ class ChunkedYtdlpStageOutcome:
 
 
 def attempted_chunk_target_ids(plan: ChunkedYtdlpStagePlan) -> list[str]:
-    attempted_ids: list[str] = []
-    seen_ids: set[str] = set()
     attempted_chunk_count = max(0, min(plan.chunk_index, len(plan.url_chunks)))
-    for chunk_pairs in plan.url_chunks[:attempted_chunk_count]:
-        for video_id, _url in chunk_pairs:
-            if video_id in seen_ids:
-                continue
-            seen_ids.add(video_id)
-            attempted_ids.append(video_id)
-    return attempted_ids
+    return list(
+        dict.fromkeys(
+            video_id
+            for chunk_pairs in plan.url_chunks[:attempted_chunk_count]
+            for video_id, _url in chunk_pairs
+        )
+    )
 
 
 def extract_tiktok_error_messages(
@@ -2959,15 +3275,20 @@ def evaluate_chunked_plan_transient_circuit_breaker(
 def run_interleaved_chunked_ytdlp_stage_plans(
     plans: list[ChunkedYtdlpStagePlan],
     dry_run: bool,
+    stop_event: threading.Event | None = None,
 ) -> None:
     active_plans = [
         plan
         for plan in plans
         if plan.command_template is not None and plan.url_chunks
     ]
-    while True:
+    while stop_event is None or not stop_event.is_set():
         progress_made = False
         for plan in active_plans:
+            # Recheck per plan: after a stop, starting another chunk would
+            # leave a yt-dlp process the one-shot termination never sees.
+            if stop_event is not None and stop_event.is_set():
+                break
             if (
                 plan.error is not None
                 or plan.halt_reason is not None
@@ -2976,18 +3297,17 @@ def run_interleaved_chunked_ytdlp_stage_plans(
                 continue
             progress_made = True
             chunk_pairs = plan.url_chunks[plan.chunk_index]
-            chunk_urls = [url for _, url in chunk_pairs]
-            write_urls_file(plan.active_urls_file, chunk_urls)
-            if plan.chunk_index == 0:
-                command = [*cast(list[str], plan.command_template), "-a", str(plan.active_urls_file)]
-            else:
-                command = [*plan.build_command(), "-a", str(plan.active_urls_file)]
             print(
                 f"[{plan.stage}] {plan.source.id}: chunk "
                 f"{plan.chunk_index + 1}/{len(plan.url_chunks)} "
                 f"targets={len(chunk_pairs)}"
             )
             try:
+                write_urls_file(plan.active_urls_file, [url for _, url in chunk_pairs])
+                if plan.chunk_index == 0:
+                    command = [*cast(list[str], plan.command_template), "-a", str(plan.active_urls_file)]
+                else:
+                    command = [*plan.build_command(), "-a", str(plan.active_urls_file)]
                 plan.exit_code, output_text = run_command_with_output(
                     command,
                     dry_run=dry_run,
@@ -3000,7 +3320,7 @@ def run_interleaved_chunked_ytdlp_stage_plans(
                 transient_retry_ids = extract_tiktok_transient_retry_video_ids_from_messages(
                     final_error_messages
                 )
-                if transient_retry_ids:
+                if transient_retry_ids and (stop_event is None or not stop_event.is_set()):
                     original_error_ids = set(final_error_messages)
                     retry_id_set = set(transient_retry_ids)
                     retry_pairs = [
@@ -3053,6 +3373,13 @@ def run_interleaved_chunked_ytdlp_stage_plans(
                     plan,
                     final_error_messages,
                 )
+                if stop_event is not None and any(
+                    is_source_network_cooldown_error(message)
+                    for message in [plan.error, *final_error_messages.values()]
+                ):
+                    # A concurrently running stage hits the same host; stop it
+                    # too instead of waiting for the finalizer's cooldown.
+                    stop_event.set()
                 if plan.error is None:
                     evaluate_chunked_plan_transient_circuit_breaker(
                         plan,
@@ -3068,10 +3395,50 @@ def run_interleaved_chunked_ytdlp_stage_plans(
                 )
             finally:
                 plan.chunk_index += 1
+                clear_sync_scan_cache()
         if not progress_made:
             break
 
 
+def run_concurrent_chunked_ytdlp_stage_plans(
+    plan_groups: list[list[ChunkedYtdlpStagePlan]],
+    dry_run: bool,
+) -> None:
+    # Subs and meta plans write disjoint dirs, archives and urls files, so
+    # their network-bound yt-dlp runs can overlap. Each group still runs its
+    # chunks interleaved in order; ledger writes stay with the finalizers.
+    groups = [plans for plans in plan_groups if plans]
+    if dry_run or len(groups) <= 1:
+        for plans in groups:
+            run_interleaved_chunked_ytdlp_stage_plans(plans, dry_run=dry_run)
+        return
+
+    stop_event = threading.Event()
+    with ThreadPoolExecutor(max_workers=len(groups)) as executor:
+        futures = [
+            executor.submit(
+                run_interleaved_chunked_ytdlp_stage_plans,
+                plans,
+                dry_run,
+                stop_event,
+            )
+            for plans in groups
+        ]
+        try:
+            # Surface whichever group fails first instead of blocking on the
+            # subs group while a meta failure sits unseen.
+            done, _pending = wait(futures, return_when=FIRST_EXCEPTION)
+            for future in done:
+                if future.exception() is not None:
+                    future.result()
+            for future in futures:
+                future.result()
+        except BaseException:
+            stop_event.set()
+            terminate_active_command_processes()
+            raise
+
+
 def prepare_subtitle_download_plan(
     *,
     source: SourceConfig,
@@ -3090,7 +3457,7 @@ def prepare_subtitle_download_plan(
     suppress_skip_log: bool = False,
 ) -> ChunkedYtdlpStagePlan | None:
     subs_before_ids = (
-        set(read_archive_ids(source.subs_archive))
+        set(cached_read_archive_ids(source.subs_archive))
         if source.subtitle_download_archive_enabled
         else set()
     )
@@ -3127,20 +3494,14 @@ def prepare_subtitle_download_plan(
             limit=bootstrap_limit,
         )
 
-    if metadata_candidate_ids is not None:
-        subtitle_candidate_ids = []
-        seen_subtitle_candidates: set[str] = set()
-        for video_id in metadata_candidate_ids:
-            if video_id in seen_subtitle_candidates:
-                continue
-            seen_subtitle_candidates.add(video_id)
-            subtitle_candidate_ids.append(video_id)
-    else:
-        subtitle_candidate_ids = list(new_media_ids)
-    for video_id in bootstrap_missing_sub_ids:
-        if video_id in subtitle_candidate_ids:
-            continue
-        subtitle_candidate_ids.append(video_id)
+    subtitle_candidate_ids = list(
+        dict.fromkeys(
+            [
+                *(metadata_candidate_ids if metadata_candidate_ids is not None else new_media_ids),
+                *bootstrap_missing_sub_ids,
+            ]
+        )
+    )
 
     missing_sub_ids = [
         video_id
@@ -3148,23 +3509,23 @@ def prepare_subtitle_download_plan(
         if video_id not in subs_before_ids and video_id not in local_sub_ids
     ]
 
+    # One clock reading for the whole retry plan and the zero-target run rows.
+    subs_planned_at = now_utc_iso()
     deferred_sub_ids: list[str] = []
     missing_retryable_sub_ids = list(missing_sub_ids)
+    retry_sub_ids: list[str] = []
     if connection is not None and not dry_run:
-        missing_retryable_sub_ids, deferred_sub_ids = split_retryable_ids(
-            connection=connection,
-            source_id=source.id,
-            stage="subs",
-            candidate_ids=missing_sub_ids,
+        subs_retry_plan = fetch_retry_plan(
+            connection,
+            source.id,
+            "subs",
+            missing_sub_ids,
+            include_due_retries=not (strict_candidate_scope and metadata_candidate_ids is not None),
+            now_iso=subs_planned_at,
         )
-
-    retry_sub_ids: list[str] = []
-    if (
-        connection is not None
-        and not dry_run
-        and not (strict_candidate_scope and metadata_candidate_ids is not None)
-    ):
-        retry_sub_ids = get_due_retry_ids(connection, source.id, "subs")
+        missing_retryable_sub_ids = subs_retry_plan.retryable_ids
+        deferred_sub_ids = subs_retry_plan.deferred_ids
+        retry_sub_ids = subs_retry_plan.due_retry_ids
     existing_retry_sub_ids = [
         video_id
         for video_id in retry_sub_ids
@@ -3176,18 +3537,14 @@ def prepare_subtitle_download_plan(
         if video_id not in subs_before_ids and video_id not in local_sub_ids
     ]
 
-    subtitle_target_ids: list[str] = []
-    seen_target_ids: set[str] = set()
-    for video_id in [*missing_retryable_sub_ids, *retry_sub_ids]:
-        if video_id in seen_target_ids:
-            continue
-        seen_target_ids.add(video_id)
-        subtitle_target_ids.append(video_id)
-    subtitle_target_ids = apply_stage_target_limit(subtitle_target_ids, limit)
+    subtitle_target_ids = apply_stage_target_limit(
+        list(dict.fromkeys([*missing_retryable_sub_ids, *retry_sub_ids])),
+        limit,
+    )
 
     if not subtitle_target_ids:
         if connection is not None and not dry_run:
-            subs_started_at = now_utc_iso()
+            subs_started_at = subs_planned_at
             subs_run_id = begin_download_run(
                 connection=connection,
                 source_id=source.id,
@@ -3196,25 +3553,20 @@ def prepare_subtitle_download_plan(
                 target_count=0,
                 started_at=subs_started_at,
             )
-            for video_id in existing_retry_sub_ids:
-                upsert_download_state(
-                    connection=connection,
-                    source_id=source.id,
-                    stage="subs",
-                    video_id=video_id,
-                    status="success",
-                    run_id=subs_run_id,
-                    attempt_at=subs_started_at,
-                    url=safe_video_url(video_id),
-                    last_error=None,
-                    retry_count=0,
-                    next_retry_at=None,
-                )
+            upsert_stage_download_success_states(
+                connection=connection,
+                source_id=source.id,
+                stage="subs",
+                video_ids=existing_retry_sub_ids,
+                run_id=subs_run_id,
+                attempt_at=subs_started_at,
+                safe_video_url=safe_video_url,
+            )
             finish_download_run(
                 connection=connection,
                 run_id=subs_run_id,
                 status="success",
-                finished_at=now_utc_iso(),
+                finished_at=subs_started_at,
                 exit_code=0,
                 success_count=0,
                 failure_count=0,
@@ -3322,26 +3674,47 @@ def prepare_subtitle_download_plan(
     )
 
 
+def build_plan_video_url_lookup(
+    plan: ChunkedYtdlpStagePlan,
+    safe_video_url: Callable[[str], str | None],
+) -> Callable[[str], str | None]:
+    # URLs for resolved targets were already built for the urls file; ids
+    # outside the plan (e.g. existing retries) still go through safe_video_url.
+    resolved_urls = {
+        video_id: video_url
+        for url_chunk in plan.url_chunks
+        for video_id, video_url in url_chunk
+    }
+
+    def lookup_video_url(video_id: str) -> str | None:
+        video_url = resolved_urls.get(video_id)
+        if video_url is not None:
+            return video_url
+        return safe_video_url(video_id)
+
+    return lookup_video_url
+
+
 def build_chunked_plan_outcome(
     plan: ChunkedYtdlpStagePlan,
     successful_ids: Iterable[str],
 ) -> ChunkedYtdlpStageOutcome:
     attempted_resolved_target_ids = attempted_chunk_target_ids(plan)
     attempted_resolved_target_id_set = set(attempted_resolved_target_ids)
-    successful_id_set = {
-        str(video_id).strip()
-        for video_id in successful_ids
-        if str(video_id).strip()
-    }
+    # successful_ids comes from archive/scan id sets, which are already
+    # stripped; intersect against the attempted ids instead of normalizing
+    # every archived id, then keep plan order for the two partitions.
+    success_target_id_set = attempted_resolved_target_id_set.intersection(successful_ids)
+    failed_target_id_set = attempted_resolved_target_id_set - success_target_id_set
     success_target_ids = [
         video_id
         for video_id in attempted_resolved_target_ids
-        if video_id in successful_id_set
+        if video_id in success_target_id_set
     ]
     failed_target_ids = [
         video_id
         for video_id in attempted_resolved_target_ids
-        if video_id not in successful_id_set
+        if video_id in failed_target_id_set
     ]
     failed_target_ids.extend(plan.unresolved_target_ids)
     return ChunkedYtdlpStageOutcome(
@@ -3356,23 +3729,6 @@ def build_chunked_plan_outcome(
     )
 
 
-def get_next_download_retry_count(
-    connection: sqlite3.Connection,
-    source_id: str,
-    stage: str,
-    video_id: str,
-) -> int:
-    current = connection.execute(
-        """
-        SELECT retry_count
-        FROM download_state
-        WHERE source_id = ? AND stage = ? AND video_id = ?
-        """,
-        (source_id, stage, video_id),
-    ).fetchone()
-    return (int(current[0]) if current else 0) + 1
-
-
 def upsert_stage_download_success_states(
     *,
     connection: sqlite3.Connection,
@@ -3383,23 +3739,26 @@ def upsert_stage_download_success_states(
     attempt_at: str,
     safe_video_url: Callable[[str], str | None],
 ) -> None:
+    rows = []
     for video_id in video_ids:
         normalized_video_id = str(video_id).strip()
         if not normalized_video_id:
             continue
-        upsert_download_state(
-            connection=connection,
-            source_id=source_id,
-            stage=stage,
-            video_id=normalized_video_id,
-            status="success",
-            run_id=run_id,
-            attempt_at=attempt_at,
-            url=safe_video_url(normalized_video_id),
-            last_error=None,
-            retry_count=0,
-            next_retry_at=None,
+        rows.append(
+            build_download_state_row(
+                source_id=source_id,
+                stage=stage,
+                video_id=normalized_video_id,
+                status="success",
+                run_id=run_id,
+                attempt_at=attempt_at,
+                url=safe_video_url(normalized_video_id),
+                last_error=None,
+                retry_count=0,
+                next_retry_at=None,
+            )
         )
+    upsert_download_states(connection, rows)
 
 
 def upsert_stage_download_error_states(
@@ -3415,34 +3774,40 @@ def upsert_stage_download_error_states(
     activate_source_network_cooldown: Callable[[str | None, str | None], None] | None = None,
 ) -> str | None:
     blocked_error: str | None = None
-    for video_id in video_ids:
-        normalized_video_id = str(video_id).strip()
-        if not normalized_video_id:
-            continue
+    normalized_video_ids = [
+        normalized_video_id
+        for normalized_video_id in dict.fromkeys(str(video_id).strip() for video_id in video_ids)
+        if normalized_video_id
+    ]
+    states = load_download_states(connection, source_id, stage, normalized_video_ids)
+    failures: list[tuple[str, str]] = []
+    rows = []
+    for normalized_video_id in normalized_video_ids:
         failure_reason = resolve_failure_reason(normalized_video_id)
-        next_retry_count = get_next_download_retry_count(
-            connection=connection,
-            source_id=source_id,
-            stage=stage,
-            video_id=normalized_video_id,
-        )
+        state = states.get(normalized_video_id)
+        next_retry_count = (state[1] if state else 0) + 1
         next_retry_at = schedule_next_retry_iso(
             next_retry_count,
             error_message=failure_reason,
         )
-        upsert_download_state(
-            connection=connection,
-            source_id=source_id,
-            stage=stage,
-            video_id=normalized_video_id,
-            status="error",
-            run_id=run_id,
-            attempt_at=attempt_at,
-            url=safe_video_url(normalized_video_id),
-            last_error=failure_reason,
-            retry_count=next_retry_count,
-            next_retry_at=next_retry_at,
+        rows.append(
+            build_download_state_row(
+                source_id=source_id,
+                stage=stage,
+                video_id=normalized_video_id,
+                status="error",
+                run_id=run_id,
+                attempt_at=attempt_at,
+                url=safe_video_url(normalized_video_id),
+                last_error=failure_reason,
+                retry_count=next_retry_count,
+                next_retry_at=next_retry_at,
+            )
         )
+        failures.append((failure_reason, next_retry_at))
+    upsert_download_states(connection, rows)
+
+    for failure_reason, next_retry_at in failures:
         blocked_until = extend_source_network_cooldown(
             connection=connection,
             source_id=source_id,
@@ -3561,8 +3926,10 @@ def finalize_subtitle_download_plan(
         return
 
     source = plan.source
+    safe_video_url = build_plan_video_url_lookup(plan, safe_video_url)
+    unresolved_target_ids = set(plan.unresolved_target_ids)
     subs_after_ids = (
-        set(read_archive_ids(source.subs_archive))
+        set(cached_read_archive_ids(source.subs_archive))
         if source.subtitle_download_archive_enabled
         else set()
     )
@@ -3597,23 +3964,14 @@ def finalize_subtitle_download_plan(
             connection=connection,
             source_id=source.id,
             stage="subs",
-            video_ids=outcome.success_target_ids,
-            run_id=plan.run_id,
-            attempt_at=plan.started_at,
-            safe_video_url=safe_video_url,
-        )
-        upsert_stage_download_success_states(
-            connection=connection,
-            source_id=source.id,
-            stage="subs",
-            video_ids=existing_retry_sub_ids,
+            video_ids=[*outcome.success_target_ids, *existing_retry_sub_ids],
             run_id=plan.run_id,
             attempt_at=plan.started_at,
             safe_video_url=safe_video_url,
         )
 
         def resolve_subtitle_failure_reason(video_id: str) -> str:
-            if video_id in plan.unresolved_target_ids:
+            if video_id in unresolved_target_ids:
                 return "cannot build video URL for subtitle download target"
             if video_id in video_error_messages:
                 return format_tiktok_video_error_message(
@@ -3691,25 +4049,17 @@ def prepare_metadata_download_plan(
         return None
 
     if metadata_candidate_ids is not None:
-        archive_ids = []
-        seen_archive_ids: set[str] = set()
-        for video_id in metadata_candidate_ids:
-            if video_id in seen_archive_ids:
-                continue
-            archive_ids.append(video_id)
-            seen_archive_ids.add(video_id)
+        archive_ids = list(dict.fromkeys(metadata_candidate_ids))
     else:
-        media_archive_ids = read_archive_ids(source.media_archive)
-        subs_archive_ids = read_archive_ids(source.subs_archive)
-        local_media_ids = sorted(scan_media_files(source))
-        local_sub_ids = sorted(scan_subtitles(source))
-        archive_ids = []
-        seen_archive_ids = set()
-        for video_id in [*media_archive_ids, *subs_archive_ids, *local_media_ids, *local_sub_ids]:
-            if video_id in seen_archive_ids:
-                continue
-            archive_ids.append(video_id)
-            seen_archive_ids.add(video_id)
+        # Archive order first; only local files missing from the archives
+        # need sorting to keep the tail deterministic.
+        known_ids = dict.fromkeys(cached_read_archive_ids(source.media_archive))
+        known_ids.update(dict.fromkeys(cached_read_archive_ids(source.subs_archive)))
+        known_ids.update(dict.fromkeys(sorted(cached_scan_media_ids(source).difference(known_ids))))
+        known_ids.update(
+            dict.fromkeys(sorted(cached_scan_subtitle_ids(source).difference(known_ids)))
+        )
+        archive_ids = list(known_ids)
 
     if not archive_ids:
         if metadata_candidate_ids is None:
@@ -3721,34 +4071,29 @@ def prepare_metadata_download_plan(
             print("no metadata candidates for this run; skip metadata")
         return None
 
-    existing_meta_ids = list_meta_ids(source.meta_dir)
+    existing_meta_ids = cached_list_meta_ids(source.meta_dir)
     missing_ids = [video_id for video_id in archive_ids if video_id not in existing_meta_ids]
+    meta_planned_at = now_utc_iso()
     deferred_missing_ids: list[str] = []
     missing_retryable_ids = list(missing_ids)
+    retry_ids: list[str] = []
     if connection is not None and not dry_run:
-        missing_retryable_ids, deferred_missing_ids = split_retryable_ids(
-            connection=connection,
-            source_id=source.id,
-            stage="meta",
-            candidate_ids=missing_ids,
+        meta_retry_plan = fetch_retry_plan(
+            connection,
+            source.id,
+            "meta",
+            missing_ids,
+            include_due_retries=not (strict_candidate_scope and metadata_candidate_ids is not None),
+            now_iso=meta_planned_at,
         )
+        missing_retryable_ids = meta_retry_plan.retryable_ids
+        deferred_missing_ids = meta_retry_plan.deferred_ids
+        retry_ids = meta_retry_plan.due_retry_ids
 
-    retry_ids: list[str] = []
-    if (
-        connection is not None
-        and not dry_run
-        and not (strict_candidate_scope and metadata_candidate_ids is not None)
-    ):
-        retry_ids = get_due_retry_ids(connection, source.id, "meta")
-
-    metadata_target_ids: list[str] = []
-    seen_target_ids: set[str] = set()
-    for video_id in [*missing_retryable_ids, *retry_ids]:
-        if video_id in seen_target_ids:
-            continue
-        seen_target_ids.add(video_id)
-        metadata_target_ids.append(video_id)
-    metadata_target_ids = apply_stage_target_limit(metadata_target_ids, limit)
+    metadata_target_ids = apply_stage_target_limit(
+        list(dict.fromkeys([*missing_retryable_ids, *retry_ids])),
+        limit,
+    )
 
     if not metadata_target_ids:
         print("metadata already up to date")
@@ -3843,9 +4188,11 @@ def finalize_metadata_download_plan(
         return
 
     source = plan.source
+    safe_video_url = build_plan_video_url_lookup(plan, safe_video_url)
+    unresolved_target_ids = set(plan.unresolved_target_ids)
     outcome = build_chunked_plan_outcome(
         plan,
-        successful_ids=list_meta_ids(source.meta_dir),
+        successful_ids=cached_list_meta_ids(source.meta_dir),
     )
     video_error_messages = get_payload_video_error_messages(
         plan.payload,
@@ -3864,7 +4211,7 @@ def finalize_metadata_download_plan(
         )
 
         def resolve_metadata_failure_reason(video_id: str) -> str:
-            if video_id in plan.unresolved_target_ids:
+            if video_id in unresolved_target_ids:
                 return "cannot build video URL for metadata download target"
             if video_id in video_error_messages:
                 return format_tiktok_video_error_message(
@@ -3938,6 +4285,7 @@ def sync_source(
     suppress_skip_meta_log: bool = False,
 ) -> SyncSourceRunResult:
     print(f"\n=== {run_label}: {source.id} ===")
+    clear_sync_scan_cache()
 
     source.media_dir.mkdir(parents=True, exist_ok=True)
     source.subs_dir.mkdir(parents=True, exist_ok=True)
@@ -4000,7 +4348,8 @@ def sync_source(
         )
         source_cooldown_remaining_hours = remaining_seconds / 3600.0
 
-    media_before_ids = set(read_archive_ids(source.media_archive))
+    media_before_size = get_archive_size(source.media_archive)
+    media_before_ids = set(cached_read_archive_ids(source.media_archive))
     configured_playlist_end = playlist_end if playlist_end is not None else source.playlist_end
     metered_skip_media = False
     metered_force_break_on_existing = False
@@ -4051,13 +4400,13 @@ def sync_source(
     new_media_ids: list[str] = []
     normalized_media_candidate_ids: list[str] = []
     if media_candidate_ids is not None:
-        seen_media_candidate_ids: set[str] = set()
-        for video_id in media_candidate_ids:
-            video_id_value = str(video_id or "").strip()
-            if not video_id_value or video_id_value in seen_media_candidate_ids:
-                continue
-            seen_media_candidate_ids.add(video_id_value)
-            normalized_media_candidate_ids.append(video_id_value)
+        normalized_media_candidate_ids = [
+            video_id_value
+            for video_id_value in dict.fromkeys(
+                str(video_id or "").strip() for video_id in media_candidate_ids
+            )
+            if video_id_value
+        ]
 
     if not skip_media and not metered_skip_media and not source_cooldown_active:
         media_discovery_state_key = f"media_discovery_last_attempt:{source.id}"
@@ -4155,6 +4504,8 @@ def sync_source(
                 media_exit_code = 1
                 media_error = str(exc)
                 print(f"[sync] {source.id} media command failed: {exc}", file=sys.stderr)
+            finally:
+                clear_sync_scan_cache()
             if connection is not None and not dry_run:
                 if media_error:
                     blocked_until = extend_source_network_cooldown(
@@ -4178,11 +4529,15 @@ def sync_source(
                     media_discovery_state_key,
                     media_started_at,
                 )
-                connection.commit()
 
         if media_candidate_ids is None:
-            media_after_ids = set(read_archive_ids(source.media_archive))
-            new_media_ids = sorted(media_after_ids - media_before_ids)
+            media_appended_ids = read_archive_ids_appended_since(
+                source.media_archive,
+                media_before_size,
+            )
+            if media_appended_ids is None:
+                media_appended_ids = cached_read_archive_ids(source.media_archive)
+            new_media_ids = sorted(set(media_appended_ids) - media_before_ids)
 
         retry_media_ids: list[str] = []
         bootstrap_no_audio_media_ids: list[str] = []
@@ -4193,25 +4548,18 @@ def sync_source(
                 source_id=source.id,
             )
 
-        media_audio_target_ids: list[str] = []
-        seen_media_targets: set[str] = set()
-        for video_id in [*new_media_ids, *retry_media_ids, *bootstrap_no_audio_media_ids]:
-            if video_id in seen_media_targets:
-                continue
-            seen_media_targets.add(video_id)
-            media_audio_target_ids.append(video_id)
+        media_audio_target_ids = list(
+            dict.fromkeys([*new_media_ids, *retry_media_ids, *bootstrap_no_audio_media_ids])
+        )
 
         media_audio_fallback_failures: dict[str, str] = {}
         media_audio_fallback_repaired = 0
         repaired_media_ids: set[str] = set()
-        evaluated_media_ids: list[str] = []
-        seen_evaluated_media_ids: set[str] = set()
-        for video_id in new_media_ids:
-            seen_evaluated_media_ids.add(video_id)
-            evaluated_media_ids.append(video_id)
-
-        ffprobe_bin = find_executable_command("ffprobe")
-        ffmpeg_bin = find_executable_command("ffmpeg")
+        # Insertion-ordered set: new downloads first, then probed targets.
+        evaluated_media_ids: dict[str, None] = dict.fromkeys(new_media_ids)
+
+        ffprobe_bin = find_ffmpeg_tool("ffprobe")
+        ffmpeg_bin = find_ffmpeg_tool("ffmpeg")
         media_fallback_work_dir = source.media_dir / ".audio_fallback"
         media_audio_preferred_format: str | None = None
         if connection is not None and not dry_run:
@@ -4260,6 +4608,8 @@ def sync_source(
                 )
             except Exception as exc:
                 return None, f"primary download command exception: {exc}"
+            finally:
+                clear_sync_scan_cache()
 
             if primary_exit_code != 0:
                 return None, summarize_command_failure(primary_output, primary_exit_code)
@@ -4355,6 +4705,8 @@ def sync_source(
                                 f"{candidate_format}: command exception ({exc})"
                             )
                             continue
+                        finally:
+                            clear_sync_scan_cache()
 
                         if fallback_exit_code != 0:
                             download_errors.append(
@@ -4531,32 +4883,30 @@ def sync_source(
                     except OSError:
                         pass
 
-        if (
-            connection is not None
-            and not dry_run
-            and media_run_id is not None
-            and media_audio_target_ids
-        ):
-            update_download_run_progress(
-                connection=connection,
-                run_id=media_run_id,
-                target_count=len(media_audio_target_ids),
-                success_count=0,
-                failure_count=0,
-                error_message=f"audio_fallback 0/{len(media_audio_target_ids)}",
-            )
+        if connection is not None and not dry_run:
+            if media_run_id is not None and media_audio_target_ids:
+                update_download_run_progress(
+                    connection=connection,
+                    run_id=media_run_id,
+                    target_count=len(media_audio_target_ids),
+                    success_count=0,
+                    failure_count=0,
+                    error_message=f"audio_fallback 0/{len(media_audio_target_ids)}",
+                )
+            # One commit for the download outcome, cooldown and discovery
+            # timestamp recorded above plus the initial fallback progress.
             connection.commit()
 
         if not dry_run and media_audio_target_ids and ffprobe_bin is not None:
+            existing_media_paths = find_media_files_for_videos(source, media_audio_target_ids)
+            existing_media_probes = detect_audio_streams(existing_media_paths, ffprobe_bin)
             for video_id in media_audio_target_ids:
-                if video_id not in seen_evaluated_media_ids:
-                    seen_evaluated_media_ids.add(video_id)
-                    evaluated_media_ids.append(video_id)
+                evaluated_media_ids.setdefault(video_id)
 
                 progress_note = ""
                 try:
-                    media_path = find_media_file_for_video(source, video_id)
-                    if media_path is None or not media_path.exists():
+                    media_path = existing_media_paths.get(video_id)
+                    if media_path is None:
                         media_path, primary_error = run_media_primary_download(video_id, None)
                         if primary_error is not None:
                             media_audio_fallback_failures[video_id] = primary_error
@@ -4567,11 +4917,12 @@ def sync_source(
                                 file=sys.stderr,
                             )
                             continue
-
-                    has_audio_stream, probe_error = detect_audio_stream(
-                        media_path=media_path,
-                        ffprobe_bin=ffprobe_bin,
-                    )
+                        has_audio_stream, probe_error = detect_audio_stream(
+                            media_path=media_path,
+                            ffprobe_bin=ffprobe_bin,
+                        )
+                    else:
+                        has_audio_stream, probe_error = existing_media_probes[video_id]
                     if has_audio_stream is True:
                         progress_note = "already_has_audio"
                         continue
@@ -4611,12 +4962,12 @@ def sync_source(
                             connection is not None
                             and fallback_selected_format is not None
                         ):
+                            # Committed with the progress update in the finally block.
                             record_media_fallback_preferred_format(
                                 connection=connection,
                                 source_id=source.id,
                                 preferred_format=fallback_selected_format,
                             )
-                            connection.commit()
                         progress_note = "recovered"
                         print(
                             f"[media] {source.id}/{video_id}: recovered audio stream "
@@ -4675,80 +5026,52 @@ def sync_source(
                 connection.commit()
 
         if connection is not None and not dry_run:
-            for video_id in evaluated_media_ids:
-                fallback_error = media_audio_fallback_failures.get(video_id)
-                if fallback_error is None:
-                    upsert_download_state(
-                        connection=connection,
-                        source_id=source.id,
-                        stage="media",
-                        video_id=video_id,
-                        status="success",
-                        run_id=media_run_id,
-                        attempt_at=media_started_at,
-                        url=safe_video_url(video_id),
-                        last_error=None,
-                        retry_count=0,
-                        next_retry_at=None,
-                    )
-                    continue
+            upsert_stage_download_success_states(
+                connection=connection,
+                source_id=source.id,
+                stage="media",
+                video_ids=[
+                    video_id
+                    for video_id in evaluated_media_ids
+                    if video_id not in media_audio_fallback_failures
+                ],
+                run_id=media_run_id,
+                attempt_at=media_started_at,
+                safe_video_url=safe_video_url,
+            )
+            fallback_blocked_error = upsert_stage_download_error_states(
+                connection=connection,
+                source_id=source.id,
+                stage="media",
+                video_ids=[
+                    video_id
+                    for video_id in evaluated_media_ids
+                    if video_id in media_audio_fallback_failures
+                ],
+                run_id=media_run_id,
+                attempt_at=media_started_at,
+                safe_video_url=safe_video_url,
+                resolve_failure_reason=media_audio_fallback_failures.__getitem__,
+                activate_source_network_cooldown=activate_source_network_cooldown,
+            )
+            if fallback_blocked_error is not None:
+                media_blocked_error = fallback_blocked_error
 
-                current = connection.execute(
+            if repaired_media_ids:
+                repaired_at = now_utc_iso()
+                connection.executemany(
                     """
-                    SELECT retry_count
-                    FROM download_state
-                    WHERE source_id = ? AND stage = ? AND video_id = ?
+                    UPDATE videos
+                    SET audio_lufs = NULL,
+                        audio_gain_db = NULL,
+                        audio_loudness_analyzed_at = NULL,
+                        audio_loudness_error = NULL,
+                        synced_at = ?
+                    WHERE source_id = ?
+                      AND video_id = ?
                     """,
-                    (source.id, "media", video_id),
-                ).fetchone()
-                next_retry_count = (int(current[0]) if current else 0) + 1
-                next_retry_at = schedule_next_retry_iso(
-                    next_retry_count,
-                    error_message=fallback_error,
-                )
-                upsert_download_state(
-                    connection=connection,
-                    source_id=source.id,
-                    stage="media",
-                    video_id=video_id,
-                    status="error",
-                    run_id=media_run_id,
-                    attempt_at=media_started_at,
-                    url=safe_video_url(video_id),
-                    last_error=fallback_error,
-                    retry_count=next_retry_count,
-                    next_retry_at=next_retry_at,
-                )
-                blocked_until = extend_source_network_cooldown(
-                    connection=connection,
-                    source_id=source.id,
-                    error_message=fallback_error,
-                    blocked_until=next_retry_at,
-                    blocked_at=media_started_at,
+                    [(repaired_at, source.id, video_id) for video_id in repaired_media_ids],
                 )
-                if blocked_until:
-                    media_blocked_error = fallback_error
-                    activate_source_network_cooldown(
-                        blocked_until=blocked_until,
-                        reason=fallback_error,
-                    )
-
-            if repaired_media_ids:
-                repaired_at = now_utc_iso()
-                for video_id in repaired_media_ids:
-                    connection.execute(
-                        """
-                        UPDATE videos
-                        SET audio_lufs = NULL,
-                            audio_gain_db = NULL,
-                            audio_loudness_analyzed_at = NULL,
-                            audio_loudness_error = NULL,
-                            synced_at = ?
-                        WHERE source_id = ?
-                          AND video_id = ?
-                        """,
-                        (repaired_at, source.id, video_id),
-                    )
 
             media_failed_count = sum(
                 1 for video_id in evaluated_media_ids
@@ -4828,6 +5151,7 @@ def sync_source(
                 f"skip media (metered updates-only; archive_count<{max(0, int(metered_min_archive_ids))})"
             )
 
+    subs_plan: ChunkedYtdlpStagePlan | None = None
     if not skip_subs:
         subs_plan = prepare_subtitle_download_plan(
             source=source,
@@ -4845,40 +5169,54 @@ def sync_source(
             limit=stage_limit,
             suppress_skip_log=suppress_skip_subs_log,
         )
-        if subs_plan is not None:
-            run_interleaved_chunked_ytdlp_stage_plans([subs_plan], dry_run=dry_run)
-            finalize_subtitle_download_plan(
-                subs_plan,
-                dry_run=dry_run,
-                connection=connection,
-                safe_video_url=safe_video_url,
-                activate_source_network_cooldown=activate_source_network_cooldown,
-            )
     elif not suppress_skip_subs_log:
         print("skip subtitles")
 
-    if skip_meta:
-        if not suppress_skip_meta_log:
-            print("skip metadata")
-        return SyncSourceRunResult(new_media_ids=new_media_ids)
+    meta_plan: ChunkedYtdlpStagePlan | None = None
+    if not skip_meta:
+        # The subs plan may run concurrently, so meta gets its own urls file.
+        if subs_plan is None:
+            meta_urls_file = active_urls_file
+        elif urls_file_override is None:
+            meta_urls_file = build_run_local_urls_file(source)
+        else:
+            meta_urls_file = active_urls_file.with_name(
+                f"{active_urls_file.stem}.meta{active_urls_file.suffix}"
+            )
+        meta_plan = prepare_metadata_download_plan(
+            source=source,
+            dry_run=dry_run,
+            connection=connection,
+            metadata_candidate_ids=metadata_candidate_ids,
+            strict_candidate_scope=strict_candidate_scope,
+            active_urls_file=meta_urls_file,
+            cookie_flags=cookie_flags,
+            impersonate_flags=impersonate_flags,
+            safe_video_url=safe_video_url,
+            source_cooldown_active=source_cooldown_active,
+            source_cooldown_until=source_cooldown_until,
+            limit=stage_limit,
+            suppress_skip_log=suppress_skip_meta_log,
+        )
+    elif not suppress_skip_meta_log:
+        print("skip metadata")
 
-    meta_plan = prepare_metadata_download_plan(
-        source=source,
+    run_concurrent_chunked_ytdlp_stage_plans(
+        [
+            [subs_plan] if subs_plan is not None else [],
+            [meta_plan] if meta_plan is not None else [],
+        ],
         dry_run=dry_run,
-        connection=connection,
-        metadata_candidate_ids=metadata_candidate_ids,
-        strict_candidate_scope=strict_candidate_scope,
-        active_urls_file=active_urls_file,
-        cookie_flags=cookie_flags,
-        impersonate_flags=impersonate_flags,
-        safe_video_url=safe_video_url,
-        source_cooldown_active=source_cooldown_active,
-        source_cooldown_until=source_cooldown_until,
-        limit=stage_limit,
-        suppress_skip_log=suppress_skip_meta_log,
     )
+    if subs_plan is not None:
+        finalize_subtitle_download_plan(
+            subs_plan,
+            dry_run=dry_run,
+            connection=connection,
+            safe_video_url=safe_video_url,
+            activate_source_network_cooldown=activate_source_network_cooldown,
+        )
     if meta_plan is not None:
-        run_interleaved_chunked_ytdlp_stage_plans([meta_plan], dry_run=dry_run)
         finalize_metadata_download_plan(
             meta_plan,
             dry_run=dry_run,
@@ -4918,8 +5256,8 @@ def run_legacy_sync_sources(
             suppress_skip_meta_log=not skip_meta,
         )
 
+    subtitle_plans: list[ChunkedYtdlpStagePlan] = []
     if not skip_subs:
-        subtitle_plans: list[ChunkedYtdlpStagePlan] = []
         remaining_subs_limit = None if limit is None else max(0, int(limit))
         for source in sources:
             if remaining_subs_limit == 0:
@@ -4963,23 +5301,8 @@ def run_legacy_sync_sources(
                 if remaining_subs_limit is not None:
                     remaining_subs_limit = max(0, remaining_subs_limit - len(subtitle_plan.target_ids))
 
-        run_interleaved_chunked_ytdlp_stage_plans(subtitle_plans, dry_run=dry_run)
-        for plan in subtitle_plans:
-            def safe_video_url(video_id: str, *, _source: SourceConfig = plan.source) -> str | None:
-                try:
-                    return build_video_url(_source, video_id)
-                except ValueError:
-                    return None
-
-            finalize_subtitle_download_plan(
-                plan,
-                dry_run=dry_run,
-                connection=connection,
-                safe_video_url=safe_video_url,
-            )
-
+    metadata_plans: list[ChunkedYtdlpStagePlan] = []
     if not skip_meta:
-        metadata_plans: list[ChunkedYtdlpStagePlan] = []
         remaining_meta_limit = None if limit is None else max(0, int(limit))
         for source in sources:
             if remaining_meta_limit == 0:
@@ -5022,20 +5345,36 @@ def run_legacy_sync_sources(
                 if remaining_meta_limit is not None:
                     remaining_meta_limit = max(0, remaining_meta_limit - len(metadata_plan.target_ids))
 
-        run_interleaved_chunked_ytdlp_stage_plans(metadata_plans, dry_run=dry_run)
-        for plan in metadata_plans:
-            def safe_video_url(video_id: str, *, _source: SourceConfig = plan.source) -> str | None:
-                try:
-                    return build_video_url(_source, video_id)
-                except ValueError:
-                    return None
+    run_concurrent_chunked_ytdlp_stage_plans(
+        [subtitle_plans, metadata_plans],
+        dry_run=dry_run,
+    )
+    for plan in subtitle_plans:
+        def safe_video_url(video_id: str, *, _source: SourceConfig = plan.source) -> str | None:
+            try:
+                return build_video_url(_source, video_id)
+            except ValueError:
+                return None
 
-            finalize_metadata_download_plan(
-                plan,
-                dry_run=dry_run,
-                connection=connection,
-                safe_video_url=safe_video_url,
-            )
+        finalize_subtitle_download_plan(
+            plan,
+            dry_run=dry_run,
+            connection=connection,
+            safe_video_url=safe_video_url,
+        )
+    for plan in metadata_plans:
+        def safe_video_url(video_id: str, *, _source: SourceConfig = plan.source) -> str | None:
+            try:
+                return build_video_url(_source, video_id)
+            except ValueError:
+                return None
+
+        finalize_metadata_download_plan(
+            plan,
+            dry_run=dry_run,
+            connection=connection,
+            safe_video_url=safe_video_url,
+        )
 
 
 def normalize_upload_date(raw_value: Any) -> str | None:
@@ -5069,35 +5408,23 @@ def normalize_dictionary_term(raw_value: str) -> str:
     value = str(raw_value or "")
     if not value:
         return ""
-    value = (
-        value
-        .replace("’", "'")
-        .replace("‘", "'")
-        .replace("`", "'")
-        .replace('"', " ")
-        .replace("“", " ")
-        .replace("”", " ")
-        .replace("‐", "-")
-        .replace("‑", "-")
-        .replace("–", "-")
-        .replace("—", "-")
-    )
-    value = re.sub(r"[,:;!?()\[\]{}<>]+", " ", value)
-    value = re.sub(r"\s+", " ", value).strip().lower()
-    value = value.strip("\"'()[]{}<>")
-    value = re.sub(r"^[^a-z0-9]+|[^a-z0-9]+$", "", value)
-    return value
+    return normalize_dictionary_term_cached(value)
+
+
+# Hover lookups and lookup variants keep re-normalizing the same words.
+@functools.lru_cache(maxsize=65536)
+def normalize_dictionary_term_cached(value: str) -> str:
+    value = " ".join(value.translate(DICTIONARY_TERM_TRANSLATION).split()).lower()
+    match = RE_DICTIONARY_TERM_CORE.search(value)
+    return match.group() if match else ""
 
 
 def strip_eijiro_head_annotations(raw_head: str) -> str:
     head = str(raw_head or "").strip()
     if not head:
         return ""
-    while True:
-        updated = re.sub(r"\s+\{[^{}]+\}\s*$", "", head).strip()
-        if updated == head:
-            break
-        head = updated
+    while (match := RE_EIJIRO_HEAD_ANNOTATION.search(head)) is not None:
+        head = head[: match.start()].strip()
     return head
 
 
@@ -5107,11 +5434,9 @@ def parse_eijiro_line(raw_line: str, line_no: int) -> dict[str, Any] | None:
         return None
     while line.startswith("■"):
         line = line[1:].strip()
-    if not line:
-        return None
-    if " : " not in line:
+    raw_head, separator, raw_definition = line.partition(" : ")
+    if not separator:
         return None
-    raw_head, raw_definition = line.split(" : ", 1)
     head = strip_eijiro_head_annotations(raw_head) or raw_head.strip()
     definition = raw_definition.strip()
     if not head or not definition:
@@ -5131,7 +5456,12 @@ def dictionary_lookup_variants(term_norm: str) -> list[str]:
     base = normalize_dictionary_term(term_norm)
     if not base:
         return []
+    return list(dictionary_lookup_variants_cached(base))
 
+
+# Batch lookups expand every term of a subtitle line; the same words recur.
+@functools.lru_cache(maxsize=8192)
+def dictionary_lookup_variants_cached(base: str) -> tuple[str, ...]:
     variants: list[str] = []
     seen: set[str] = set()
 
@@ -5166,38 +5496,48 @@ def dictionary_lookup_variants(term_norm: str) -> list[str]:
     if "-" in base:
         add_variant(base.replace("-", " "))
 
-    return variants
+    return tuple(variants)
+
+
+def read_meta_record(info_path: Path) -> dict[str, Any] | None:
+    try:
+        return decode_json_file_bytes(info_path.read_bytes())
+    except (OSError, ValueError) as exc:
+        print(f"warning: failed to parse {info_path}: {exc}", file=sys.stderr)
+        return None
 
 
-def escape_like_pattern(value: str) -> str:
-    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+def iter_meta_records(
+    meta_dir: Path,
+    video_ids: list[str],
+) -> Iterable[tuple[str, Path, dict[str, Any] | None]]:
+    # File reads release the GIL, so a small pool overlaps cold-cache I/O.
+    # Ids are read in bounded batches and yielded in the given order, so a
+    # streaming caller holds at most one batch of parsed records.
+    if not video_ids:
+        return
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(META_LOAD_MAX_WORKERS, len(video_ids)))
+    ) as executor:
+        for batch in chunk_items(video_ids, META_LOAD_BATCH_SIZE):
+            info_paths = [meta_dir / f"{video_id}{INFO_SUFFIX}" for video_id in batch]
+            yield from zip(batch, info_paths, executor.map(read_meta_record, info_paths))
 
 
 def load_meta_records(meta_dir: Path) -> dict[str, tuple[Path, dict[str, Any]]]:
-    records: dict[str, tuple[Path, dict[str, Any]]] = {}
-    if not meta_dir.exists():
-        return records
-    for info_path in meta_dir.glob(f"*{INFO_SUFFIX}"):
-        video_id = info_path.name[: -len(INFO_SUFFIX)]
-        try:
-            with info_path.open("r", encoding="utf-8") as file:
-                data = json.load(file)
-        except (OSError, json.JSONDecodeError) as exc:
-            print(f"warning: failed to parse {info_path}: {exc}", file=sys.stderr)
-            continue
-        records[video_id] = (info_path, data)
-    return records
+    return {
+        video_id: (info_path, data)
+        for video_id, info_path, data in iter_meta_records(meta_dir, list(list_meta_ids(meta_dir)))
+        if data is not None
+    }
 
 
 def load_meta_record_by_id(source: SourceConfig, video_id: str) -> tuple[Path | None, dict[str, Any]]:
     info_path = source.meta_dir / f"{video_id}{INFO_SUFFIX}"
     if not info_path.exists():
         return None, {}
-    try:
-        with info_path.open("r", encoding="utf-8") as file:
-            data = json.load(file)
-    except (OSError, json.JSONDecodeError) as exc:
-        print(f"warning: failed to parse {info_path}: {exc}", file=sys.stderr)
+    data = read_meta_record(info_path)
+    if data is None:
         return None, {}
     return info_path, data
 
@@ -5206,88 +5546,173 @@ def extract_video_id_from_media(file_name: str, id_regex: re.Pattern[str]) -> st
     match = id_regex.search(file_name)
     if match:
         return match.group(1)
-    fallback = re.search(r"(\d{10,})", file_name)
+    fallback = RE_MEDIA_VIDEO_ID_FALLBACK.search(file_name)
     if fallback:
         return fallback.group(1)
     return None
 
 
+@functools.lru_cache(maxsize=128)
+def compile_video_id_regex(pattern: str) -> re.Pattern[str]:
+    return re.compile(pattern)
+
+
 def scan_media_files(source: SourceConfig) -> dict[str, Path]:
-    media: dict[str, Path] = {}
-    if not source.media_dir.exists():
-        return media
+    # DirEntry carries the readdir type bits, so only duplicate ids pay for
+    # a stat to keep the larger file.
+    id_regex = compile_video_id_regex(source.video_id_regex)
+    chosen: dict[str, os.DirEntry[str]] = {}
+    try:
+        with os.scandir(source.media_dir) as entries:
+            for entry in entries:
+                if not entry.is_file():
+                    continue
+                video_id = extract_video_id_from_media(entry.name, id_regex)
+                if not video_id:
+                    continue
+                current = chosen.get(video_id)
+                if current is None:
+                    chosen[video_id] = entry
+                    continue
+                try:
+                    current_size = current.stat().st_size
+                    candidate_size = entry.stat().st_size
+                except OSError:
+                    chosen[video_id] = entry
+                    continue
+                if candidate_size > current_size:
+                    chosen[video_id] = entry
+    except (FileNotFoundError, NotADirectoryError):
+        return {}
+    return {video_id: source.media_dir / entry.name for video_id, entry in chosen.items()}
 
-    id_regex = re.compile(source.video_id_regex)
-    for media_path in source.media_dir.iterdir():
-        if not media_path.is_file():
-            continue
-        video_id = extract_video_id_from_media(media_path.name, id_regex)
-        if not video_id:
-            continue
-        current = media.get(video_id)
-        if current is None:
-            media[video_id] = media_path
-            continue
-        try:
-            current_size = current.stat().st_size
-            candidate_size = media_path.stat().st_size
-        except OSError:
-            media[video_id] = media_path
-            continue
-        if candidate_size > current_size:
-            media[video_id] = media_path
-    return media
+
+def scan_media_ids(source: SourceConfig) -> set[str]:
+    # Id-only variant of scan_media_files: no Path objects and no size stats
+    # to pick between duplicates.
+    id_regex = compile_video_id_regex(source.video_id_regex)
+    ids: set[str] = set()
+    try:
+        with os.scandir(source.media_dir) as entries:
+            for entry in entries:
+                if not entry.is_file():
+                    continue
+                video_id = extract_video_id_from_media(entry.name, id_regex)
+                if video_id:
+                    ids.add(video_id)
+    except (FileNotFoundError, NotADirectoryError):
+        pass
+    return ids
 
 
 def find_media_file_for_video(source: SourceConfig, video_id: str) -> Path | None:
-    if not source.media_dir.exists():
-        return None
-    candidates = [path for path in source.media_dir.glob(f"*{video_id}*") if path.is_file()]
-    if not candidates:
-        return None
-    if len(candidates) == 1:
-        return candidates[0]
-    best = candidates[0]
-    best_size = -1
-    for candidate in candidates:
-        try:
-            size = candidate.stat().st_size
-        except OSError:
-            size = -1
-        if size > best_size:
-            best = candidate
-            best_size = size
-    return best
-
-
-def scan_subtitles(source: SourceConfig) -> dict[str, list[tuple[str, Path, str]]]:
-    subtitles: dict[str, list[tuple[str, Path, str]]] = {}
-    if not source.subs_dir.exists():
-        return subtitles
-    for subtitle_path in source.subs_dir.iterdir():
-        if not subtitle_path.is_file():
-            continue
-        parts = subtitle_path.name.split(".")
-        if len(parts) < 2:
-            continue
-        video_id = parts[0]
-        if not video_id.isdigit():
+    return find_media_files_for_videos(source, [video_id]).get(video_id)
+
+
+def find_media_files_for_videos(
+    source: SourceConfig,
+    video_ids: Iterable[str],
+) -> dict[str, Path]:
+    # One directory listing shared by every id with "*{video_id}*" glob
+    # semantics (dotfiles included, as Path.glob does). Names are matched
+    # before any stat: only matching entries pay for is_file(), and only ids
+    # hit by several files stat them to keep the first largest one.
+    wanted = list(dict.fromkeys(video_ids))
+    if not wanted:
+        return {}
+    wanted_set = set(wanted)
+    id_lengths = sorted({len(video_id) for video_id in wanted_set})
+    single_id = wanted[0] if len(wanted) == 1 else None
+    matches: dict[str, list[os.DirEntry[str]]] = {}
+    try:
+        with os.scandir(source.media_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if single_id is not None:
+                    if single_id not in name:
+                        continue
+                    hit_ids: Iterable[str] = (single_id,)
+                else:
+                    hit_ids = wanted_set.intersection(
+                        name[index : index + length]
+                        for length in id_lengths
+                        for index in range(len(name) - length + 1)
+                    )
+                    if not hit_ids:
+                        continue
+                try:
+                    if not entry.is_file():
+                        continue
+                except OSError:
+                    continue
+                for video_id in hit_ids:
+                    matches.setdefault(video_id, []).append(entry)
+    except OSError:
+        return {}
+    found: dict[str, Path] = {}
+    for video_id in wanted:
+        candidates = matches.get(video_id)
+        if not candidates:
             continue
-        language = ".".join(parts[1:-1]) if len(parts) > 2 else ""
-        extension = parts[-1]
-        subtitles.setdefault(video_id, []).append((language, subtitle_path, extension))
+        best = candidates[0]
+        if len(candidates) > 1:
+            best_size = -1
+            for candidate in candidates:
+                try:
+                    size = candidate.stat().st_size
+                except OSError:
+                    size = -1
+                if size > best_size:
+                    best = candidate
+                    best_size = size
+        found[video_id] = source.media_dir / best.name
+    return found
+
+
+def scan_subtitles(source: SourceConfig) -> dict[str, list[tuple[str, str, str]]]:
+    subtitles: dict[str, list[tuple[str, str, str]]] = {}
+    try:
+        with os.scandir(source.subs_dir) as entries:
+            for entry in entries:
+                parts = entry.name.split(".")
+                if len(parts) < 2:
+                    continue
+                video_id = parts[0]
+                if not video_id.isdigit() or not entry.is_file():
+                    continue
+                language = ".".join(parts[1:-1]) if len(parts) > 2 else ""
+                extension = parts[-1]
+                # DirEntry.path is already the joined string the ledger
+                # stores, so no Path object is built per track.
+                subtitles.setdefault(video_id, []).append((language, entry.path, extension))
+    except (FileNotFoundError, NotADirectoryError):
+        pass
     return subtitles
 
 
+def scan_subtitle_ids(source: SourceConfig) -> set[str]:
+    # Same id rule as scan_subtitles without building per-track tuples.
+    ids: set[str] = set()
+    try:
+        with os.scandir(source.subs_dir) as entries:
+            for entry in entries:
+                video_id, sep, _ = entry.name.partition(".")
+                if sep and video_id.isdigit() and entry.is_file():
+                    ids.add(video_id)
+    except (FileNotFoundError, NotADirectoryError):
+        pass
+    return ids
+
+
 def scan_existing_subtitle_ids(
     source: SourceConfig,
     *,
     match_langs: str | None = None,
     origin_kind: str | None = None,
 ) -> set[str]:
-    subtitles = scan_subtitles(source)
     if not match_langs and not origin_kind:
-        return set(subtitles.keys())
+        return cached_scan_subtitle_ids(source)
+    subtitles = cached_scan_subtitles(source)
 
     expected_origin_kind = (
         normalize_subtitle_origin_kind(origin_kind)
@@ -5313,22 +5738,6 @@ def scan_existing_subtitle_ids(
     return matching_ids
 
 
-def scan_subtitles_for_video(source: SourceConfig, video_id: str) -> list[tuple[str, Path, str]]:
-    if not source.subs_dir.exists():
-        return []
-    results: list[tuple[str, Path, str]] = []
-    for subtitle_path in source.subs_dir.glob(f"{video_id}.*"):
-        if not subtitle_path.is_file():
-            continue
-        parts = subtitle_path.name.split(".")
-        if len(parts) < 2:
-            continue
-        language = ".".join(parts[1:-1]) if len(parts) > 2 else ""
-        extension = parts[-1]
-        results.append((language, subtitle_path, extension))
-    return results
-
-
 def normalize_subtitle_origin_kind(value: Any, fallback: str = "upstream") -> str:
     normalized = str(value or "").strip().lower()
     if normalized in {"upstream", "generated"}:
@@ -5337,12 +5746,24 @@ def normalize_subtitle_origin_kind(value: Any, fallback: str = "upstream") -> st
     return safe_fallback if safe_fallback in {"upstream", "generated"} else "upstream"
 
 
+def translation_output_origin_detail(agent_value: Any, method_version_value: Any) -> str:
+    agent = str(agent_value or "").strip().lower()
+    method_version = str(method_version_value or "").strip().lower()
+    if "source-track=asr" in method_version:
+        return "translate-local-asr" if agent == "local-llm" else "generated-asr"
+    if agent == "local-llm":
+        return "translate-local"
+    if agent:
+        return f"generated:{agent}"
+    return "generated"
+
+
 def build_translation_output_origin_lookup(
     connection: sqlite3.Connection,
     source_id: str,
     video_id: str,
 ) -> dict[str, tuple[str, str]]:
-    rows = connection.execute(
+    cursor = connection.execute(
         """
         SELECT output_path, agent, method_version
         FROM translation_runs
@@ -5353,37 +5774,53 @@ def build_translation_output_origin_lookup(
         ORDER BY run_id DESC
         """,
         (source_id, video_id),
-    ).fetchall()
+    )
+    # The cursor is ours, so plain tuples regardless of the connection's
+    # row_factory.
+    cursor.row_factory = None
     lookup: dict[str, tuple[str, str]] = {}
-    for row in rows:
-        if isinstance(row, sqlite3.Row):
-            output_path_value = row["output_path"]
-            agent_value = row["agent"]
-            method_version_value = row["method_version"]
-        else:
-            output_path_value = row[0] if len(row) > 0 else None
-            agent_value = row[1] if len(row) > 1 else None
-            method_version_value = row[2] if len(row) > 2 else None
+    for output_path_value, agent_value, method_version_value in cursor:
         output_path = str(output_path_value or "").strip()
         if not output_path or output_path in lookup:
             continue
-        agent = str(agent_value or "").strip().lower()
-        method_version = str(method_version_value or "").strip().lower()
-        if "source-track=asr" in method_version:
-            origin_detail = "translate-local-asr" if agent == "local-llm" else "generated-asr"
-        elif agent == "local-llm":
-            origin_detail = "translate-local"
-        elif agent:
-            origin_detail = f"generated:{agent}"
-        else:
-            origin_detail = "generated"
-        lookup[output_path] = ("generated", origin_detail)
+        lookup[output_path] = (
+            "generated",
+            translation_output_origin_detail(agent_value, method_version_value),
+        )
     return lookup
 
 
+def build_source_translation_output_origin_lookups(
+    connection: sqlite3.Connection,
+    source_id: str,
+) -> dict[str, dict[str, tuple[str, str]]]:
+    """Per-video output origin lookups for a whole source in one query."""
+    lookups: dict[str, dict[str, tuple[str, str]]] = {}
+    for video_id, output_path_value, agent_value, method_version_value in connection.execute(
+        """
+        SELECT video_id, output_path, agent, method_version
+        FROM translation_runs
+        WHERE source_id = ?
+          AND output_path IS NOT NULL
+          AND output_path <> ''
+        ORDER BY run_id DESC
+        """,
+        (source_id,),
+    ):
+        output_path = str(output_path_value or "").strip()
+        lookup = lookups.setdefault(str(video_id), {})
+        if not output_path or output_path in lookup:
+            continue
+        lookup[output_path] = (
+            "generated",
+            translation_output_origin_detail(agent_value, method_version_value),
+        )
+    return lookups
+
+
 def classify_subtitle_origin(
     language: str | None,
-    subtitle_path: Path,
+    subtitle_path: Path | str,
     translation_output_origin_lookup: dict[str, tuple[str, str]] | None = None,
 ) -> tuple[str, str]:
     subtitle_key = str(subtitle_path)
@@ -5419,6 +5856,22 @@ def format_subtitle_track_origin_label(origin_kind: str, origin_detail: str) ->
     return "Upstream"
 
 
+def apply_ledger_write_pragmas(connection: sqlite3.Connection) -> None:
+    for pragma in LEDGER_WRITE_PRAGMAS:
+        connection.execute(pragma)
+
+
+def connect_ledger_writer(db_path: Path | str) -> sqlite3.Connection:
+    connection = sqlite3.connect(
+        str(db_path),
+        timeout=30,
+        cached_statements=LEDGER_SQLITE_CACHED_STATEMENTS,
+    )
+    if str(db_path) != ":memory:":
+        apply_ledger_write_pragmas(connection)
+    return connection
+
+
 def create_schema(connection: sqlite3.Connection) -> None:
     connection.executescript(
         """
@@ -5527,6 +5980,8 @@ def create_schema(connection: sqlite3.Connection) -> None:
 
         CREATE INDEX IF NOT EXISTS idx_download_runs_time ON download_runs(started_at, source_id, stage);
         CREATE INDEX IF NOT EXISTS idx_download_state_retry ON download_state(stage, status, next_retry_at);
+        CREATE INDEX IF NOT EXISTS idx_download_state_retry_cover
+            ON download_state(source_id, stage, video_id, status, retry_count, next_retry_at);
 
         CREATE TABLE IF NOT EXISTS media_fallback_format_state (
             source_id TEXT PRIMARY KEY,
@@ -5822,88 +6277,100 @@ def create_schema(connection: sqlite3.Connection) -> None:
         );
         """
     )
-    ensure_videos_loudness_columns(connection)
-    ensure_source_access_state_columns(connection)
-    ensure_video_playback_stats_columns(connection)
+    ensure_table_columns(
+        connection,
+        {
+            "videos": VIDEOS_LOUDNESS_COLUMNS,
+            "source_access_state": SOURCE_ACCESS_STATE_COLUMNS,
+            "video_playback_stats": VIDEO_PLAYBACK_STATS_COLUMNS,
+            "subtitles": SUBTITLES_ORIGIN_COLUMNS,
+            "dictionary_bookmarks": DICTIONARY_BOOKMARKS_COLUMNS,
+        },
+    )
     ensure_dictionary_schema(connection)
     ensure_translation_runs_table(connection)
     ensure_translation_stage_runs_table(connection)
-    ensure_subtitles_origin_columns(connection)
-    ensure_dictionary_bookmarks_schema(connection)
+    backfill_subtitles_origin_kinds(connection)
     ensure_dictionary_import_runs_table(connection)
 
 
-def ensure_videos_loudness_columns(connection: sqlite3.Connection) -> None:
-    rows = connection.execute("PRAGMA table_info(videos)").fetchall()
-    existing_columns = {str(row[1]) for row in rows}
-    required_columns = {
-        "audio_lufs": "REAL",
-        "audio_gain_db": "REAL",
-        "audio_loudness_analyzed_at": "TEXT",
-        "audio_loudness_error": "TEXT",
-    }
-    for column_name, column_type in required_columns.items():
-        if column_name in existing_columns:
-            continue
-        connection.execute(
-            f"ALTER TABLE videos ADD COLUMN {column_name} {column_type}"
-        )
-
-
-def ensure_source_access_state_columns(connection: sqlite3.Connection) -> None:
-    rows = connection.execute("PRAGMA table_info(source_access_state)").fetchall()
-    if not rows:
-        return
-    existing_columns = {str(row[1]) for row in rows}
-    required_columns = {
-        "last_request_at": "TEXT",
-        "next_request_not_before": "TEXT",
-        "last_success_at": "TEXT",
-    }
-    for column_name, column_type in required_columns.items():
-        if column_name in existing_columns:
-            continue
-        connection.execute(
-            f"ALTER TABLE source_access_state ADD COLUMN {column_name} {column_type}"
-        )
+# Columns added after the first release, applied by ensure_table_columns.
+VIDEOS_LOUDNESS_COLUMNS = {
+    "audio_lufs": "REAL",
+    "audio_gain_db": "REAL",
+    "audio_loudness_analyzed_at": "TEXT",
+    "audio_loudness_error": "TEXT",
+}
+SOURCE_ACCESS_STATE_COLUMNS = {
+    "last_request_at": "TEXT",
+    "next_request_not_before": "TEXT",
+    "last_success_at": "TEXT",
+}
+VIDEO_PLAYBACK_STATS_COLUMNS = {
+    "impression_count": "INTEGER NOT NULL DEFAULT 0",
+    "fast_skip_count": "INTEGER NOT NULL DEFAULT 0",
+    "shallow_skip_count": "INTEGER NOT NULL DEFAULT 0",
+    "last_served_at": "TEXT",
+    "last_completed_at": "TEXT",
+}
+SUBTITLES_ORIGIN_COLUMNS = {
+    "origin_kind": "TEXT NOT NULL DEFAULT 'upstream'",
+    "origin_detail": "TEXT NOT NULL DEFAULT ''",
+}
+DICTIONARY_BOOKMARKS_COLUMNS = {
+    "missing_entry": "INTEGER NOT NULL DEFAULT 0",
+    "lookup_path_json": "TEXT NOT NULL DEFAULT ''",
+    "lookup_path_label": "TEXT NOT NULL DEFAULT ''",
+}
 
 
-def ensure_video_playback_stats_columns(connection: sqlite3.Connection) -> None:
-    rows = connection.execute("PRAGMA table_info(video_playback_stats)").fetchall()
-    if not rows:
+def ensure_table_columns(
+    connection: sqlite3.Connection,
+    required_columns_by_table: dict[str, dict[str, str]],
+) -> None:
+    # One introspection query for every table, then all missing columns in a
+    # single transaction. Tables that do not exist yet are left alone.
+    table_names = list(required_columns_by_table)
+    placeholders = ",".join("?" for _ in table_names)
+    existing_columns: dict[str, set[str]] = {}
+    for table_name, column_name in connection.execute(
+        f"""
+        SELECT m.name, p.name
+        FROM sqlite_master AS m
+        JOIN pragma_table_info(m.name) AS p
+        WHERE m.type = 'table'
+          AND m.name IN ({placeholders})
+        """,
+        table_names,
+    ):
+        existing_columns.setdefault(table_name, set()).add(column_name)
+    statements = [
+        f"ALTER TABLE {table_name} ADD COLUMN {column_name} {column_type};"
+        for table_name, required_columns in required_columns_by_table.items()
+        if table_name in existing_columns
+        for column_name, column_type in required_columns.items()
+        if column_name not in existing_columns[table_name]
+    ]
+    if not statements:
         return
-    existing_columns = {str(row[1]) for row in rows}
-    required_columns = {
-        "impression_count": "INTEGER NOT NULL DEFAULT 0",
-        "fast_skip_count": "INTEGER NOT NULL DEFAULT 0",
-        "shallow_skip_count": "INTEGER NOT NULL DEFAULT 0",
-        "last_served_at": "TEXT",
-        "last_completed_at": "TEXT",
-    }
-    for column_name, column_type in required_columns.items():
-        if column_name in existing_columns:
-            continue
-        connection.execute(
-            f"ALTER TABLE video_playback_stats ADD COLUMN {column_name} {column_type}"
-        )
+    # A savepoint keeps the batch atomic without committing work the caller
+    # may still have pending on this connection.
+    connection.execute("SAVEPOINT ensure_table_columns")
+    try:
+        for statement in statements:
+            connection.execute(statement)
+    except sqlite3.Error:
+        connection.execute("ROLLBACK TO SAVEPOINT ensure_table_columns")
+        connection.execute("RELEASE SAVEPOINT ensure_table_columns")
+        raise
+    connection.execute("RELEASE SAVEPOINT ensure_table_columns")
 
 
-def ensure_subtitles_origin_columns(connection: sqlite3.Connection) -> None:
-    rows = connection.execute("PRAGMA table_info(subtitles)").fetchall()
-    if not rows:
+def backfill_subtitles_origin_kinds(connection: sqlite3.Connection) -> None:
+    if not connection.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'subtitles'"
+    ).fetchone():
         return
-    existing_columns = {str(row[1]) for row in rows}
-    required_columns = {
-        "origin_kind": "TEXT NOT NULL DEFAULT 'upstream'",
-        "origin_detail": "TEXT NOT NULL DEFAULT ''",
-    }
-    for column_name, column_type in required_columns.items():
-        if column_name in existing_columns:
-            continue
-        connection.execute(
-            f"ALTER TABLE subtitles ADD COLUMN {column_name} {column_type}"
-        )
-
     connection.execute(
         """
         UPDATE subtitles
@@ -6238,40 +6705,31 @@ def ensure_dictionary_import_runs_table(connection: sqlite3.Connection) -> None:
     )
 
 
-def ensure_dictionary_bookmarks_schema(connection: sqlite3.Connection) -> None:
-    rows = connection.execute("PRAGMA table_info(dictionary_bookmarks)").fetchall()
-    if not rows:
-        return
-    existing_columns = {str(row[1]) for row in rows}
-    if "missing_entry" not in existing_columns:
-        connection.execute(
-            """
-            ALTER TABLE dictionary_bookmarks
-            ADD COLUMN missing_entry INTEGER NOT NULL DEFAULT 0
-            """
-        )
-    if "lookup_path_json" not in existing_columns:
-        connection.execute(
-            """
-            ALTER TABLE dictionary_bookmarks
-            ADD COLUMN lookup_path_json TEXT NOT NULL DEFAULT ''
-            """
-        )
-    if "lookup_path_label" not in existing_columns:
-        connection.execute(
-            """
-            ALTER TABLE dictionary_bookmarks
-            ADD COLUMN lookup_path_label TEXT NOT NULL DEFAULT ''
-            """
-        )
-
-
+# Bookmark imports and toggles hash the same few terms over and over.
+@functools.lru_cache(maxsize=4096)
 def make_missing_dict_entry_id(term_norm: str) -> int:
     normalized = normalize_dictionary_term(term_norm)
     digest = zlib.crc32(normalized.encode("utf-8")) & 0xFFFFFFFF
     return MISSING_DICT_ENTRY_ID_BASE + int(digest)
 
 
+def parse_dictionary_lookup_path_id(raw_value: Any) -> int | None:
+    # Lookup paths are JSON, so ids are nearly always ints or missing; only
+    # other shapes go through int() and its exception path.
+    if type(raw_value) is int:
+        return raw_value if raw_value > 0 else None
+    if raw_value is None:
+        return None
+    if isinstance(raw_value, str) and raw_value.isdecimal():
+        parsed = int(raw_value)
+    else:
+        try:
+            parsed = int(raw_value)
+        except (TypeError, ValueError):
+            return None
+    return parsed if parsed > 0 else None
+
+
 def normalize_dictionary_lookup_path(raw_value: Any) -> list[dict[str, Any]]:
     if not isinstance(raw_value, list):
         return []
@@ -6287,24 +6745,9 @@ def normalize_dictionary_lookup_path(raw_value: Any) -> list[dict[str, Any]]:
             term = str(raw_item.get("term") or "").strip()
             term_norm = normalize_dictionary_term(raw_item.get("term_norm") or term)
             source = str(raw_item.get("source") or "").strip()
-            try:
-                parsed_node_id = int(raw_item.get("node_id"))
-            except (TypeError, ValueError):
-                parsed_node_id = 0
-            if parsed_node_id > 0:
-                node_id = parsed_node_id
-            try:
-                parsed_parent_id = int(raw_item.get("parent_id"))
-            except (TypeError, ValueError):
-                parsed_parent_id = 0
-            if parsed_parent_id > 0:
-                parent_id = parsed_parent_id
-            try:
-                parsed_level = int(raw_item.get("level"))
-            except (TypeError, ValueError):
-                parsed_level = 0
-            if parsed_level > 0:
-                level = parsed_level
+            node_id = parse_dictionary_lookup_path_id(raw_item.get("node_id"))
+            parent_id = parse_dictionary_lookup_path_id(raw_item.get("parent_id"))
+            level = parse_dictionary_lookup_path_id(raw_item.get("level"))
         elif raw_item not in (None, ""):
             term = str(raw_item).strip()
             term_norm = normalize_dictionary_term(term)
@@ -6313,7 +6756,7 @@ def normalize_dictionary_lookup_path(raw_value: Any) -> list[dict[str, Any]]:
         if not term and not term_norm:
             continue
         entry: dict[str, Any] = {
-            "level": level if level and level > 0 else len(normalized) + 1,
+            "level": level or len(normalized) + 1,
             "term": term,
             "term_norm": term_norm,
             "source": source,
@@ -6323,7 +6766,7 @@ def normalize_dictionary_lookup_path(raw_value: Any) -> list[dict[str, Any]]:
         if parent_id is not None:
             entry["parent_id"] = parent_id
         normalized.append(entry)
-        if len(normalized) >= 24:
+        if len(normalized) >= DICTIONARY_LOOKUP_PATH_MAX_ITEMS:
             break
     return normalized
 
@@ -6339,7 +6782,7 @@ def build_dictionary_lookup_path_label(path: list[dict[str, Any]]) -> str:
     return " > ".join(labels)
 
 
-def rebuild_dictionary_fts(connection: sqlite3.Connection) -> bool:
+def dictionary_fts_available(connection: sqlite3.Connection) -> bool:
     row = connection.execute(
         """
         SELECT 1
@@ -6349,7 +6792,11 @@ def rebuild_dictionary_fts(connection: sqlite3.Connection) -> bool:
         LIMIT 1
         """
     ).fetchone()
-    if row is None:
+    return row is not None
+
+
+def rebuild_dictionary_fts(connection: sqlite3.Connection) -> bool:
+    if not dictionary_fts_available(connection):
         return False
     try:
         connection.execute(
@@ -6360,22 +6807,145 @@ def rebuild_dictionary_fts(connection: sqlite3.Connection) -> bool:
     return True
 
 
+def dictionary_entry_row(_cursor: sqlite3.Cursor, row: tuple[Any, ...]) -> dict[str, Any]:
+    # Cursor row_factory for `SELECT id, source_name, term, term_norm,
+    # definition`; builds the API result dict directly from the raw tuple.
+    return {
+        "id": row[0],
+        "source_name": row[1],
+        "term": row[2],
+        "term_norm": row[3],
+        "definition": row[4],
+    }
+
+
+def fetch_dictionary_exact_rows(
+    connection: sqlite3.Connection,
+    term_norms: Iterable[str],
+) -> dict[str, list[dict[str, Any]]]:
+    rows_by_norm: dict[str, list[dict[str, Any]]] = {}
+    for batch in chunk_items(list(dict.fromkeys(term_norms)), SQLITE_IN_CLAUSE_BATCH_SIZE):
+        placeholders = ",".join("?" for _ in batch)
+        cursor = connection.execute(
+            f"""
+            SELECT id, source_name, term, term_norm, definition
+            FROM dict_entries
+            WHERE term_norm IN ({placeholders})
+            """,
+            batch,
+        )
+        cursor.row_factory = dictionary_entry_row
+        for entry in cursor:
+            rows_by_norm.setdefault(entry["term_norm"], []).append(entry)
+    return rows_by_norm
+
+
+def lookup_dictionary_entries_batch(
+    connection: sqlite3.Connection,
+    terms: list[str],
+    limit: int = DEFAULT_DICT_LOOKUP_LIMIT,
+    exact_only: bool = False,
+    fts_mode: str = "all",
+    fts_available: bool | None = None,
+) -> list[dict[str, Any]]:
+    # One exact-match query for every variant of every term; the prefix/FTS
+    # fallbacks stay per term.
+    exact_rows_by_norm = fetch_dictionary_exact_rows(
+        connection,
+        (
+            variant
+            for term in terms
+            for variant in dictionary_lookup_variants(normalize_dictionary_term(term))
+        ),
+    )
+    if fts_available is None and not exact_only:
+        # Probe for the FTS table once per batch instead of once per term.
+        fts_available = dictionary_fts_available(connection)
+    return [
+        lookup_dictionary_entries(
+            connection,
+            term,
+            limit=limit,
+            exact_only=exact_only,
+            fts_mode=fts_mode,
+            exact_rows_by_norm=exact_rows_by_norm,
+            fts_available=fts_available,
+        )
+        for term in terms
+    ]
+
+
+# Exact variants first, then the prefix range. Rows stream in arm order, so
+# the prefix arm is only evaluated when the caller keeps stepping past the
+# exact tier; its window matches the old (limit - exact rows) * 3.
+SQL_SELECT_DICTIONARY_EXACT_PREFIX_MATCHES = """
+SELECT id, source_name, term, term_norm, definition
+FROM (
+    SELECT id, source_name, term, term_norm, definition
+    FROM dict_entries
+    WHERE term_norm IN ({placeholders})
+    ORDER BY
+        CASE
+            WHEN term_norm = ? THEN 0
+            ELSE 1
+        END,
+        LENGTH(term_norm) ASC,
+        id ASC
+    LIMIT ?
+)
+UNION ALL
+SELECT id, source_name, term, term_norm, definition
+FROM (
+    SELECT id, source_name, term, term_norm, definition
+    FROM dict_entries
+    WHERE term_norm >= ? AND term_norm < ?
+    ORDER BY LENGTH(term_norm) ASC, id ASC
+    LIMIT MAX(
+        0,
+        ? - (
+            SELECT COUNT(*)
+            FROM (
+                SELECT 1
+                FROM dict_entries
+                WHERE term_norm IN ({placeholders})
+                LIMIT ?
+            )
+        )
+    ) * 3
+)
+"""
+
+SQL_SELECT_DICTIONARY_PREFIX_MATCHES = """
+SELECT id, source_name, term, term_norm, definition
+FROM dict_entries
+WHERE term_norm >= ? AND term_norm < ?
+ORDER BY LENGTH(term_norm) ASC, id ASC
+LIMIT ?
+"""
+
+# MATCH drives the plan (FTS5 index 0:M*) and de rows are fetched by rowid;
+# keep extra predicates on dict_entries out of this WHERE so the planner
+# does not fall back to a full FTS scan.
+SQL_SELECT_DICTIONARY_FTS_MATCHES = """
+SELECT de.id, de.source_name, de.term, de.term_norm, de.definition
+FROM dict_entries_fts fts
+JOIN dict_entries de
+  ON de.id = fts.rowid
+WHERE fts.dict_entries_fts MATCH ?
+ORDER BY LENGTH(de.term_norm) ASC, de.id ASC
+LIMIT ?
+"""
+
+
 def lookup_dictionary_entries(
     connection: sqlite3.Connection,
     term: str,
     limit: int = DEFAULT_DICT_LOOKUP_LIMIT,
     exact_only: bool = False,
     fts_mode: str = "all",
+    exact_rows_by_norm: dict[str, list[dict[str, Any]]] | None = None,
+    fts_available: bool | None = None,
 ) -> dict[str, Any]:
-    def read_field(
-        row: sqlite3.Row | tuple[Any, ...],
-        index: int,
-        name: str,
-    ) -> Any:
-        if isinstance(row, sqlite3.Row):
-            return row[name]
-        return row[index]
-
     normalized = normalize_dictionary_term(term)
     if not normalized:
         return {
@@ -6396,139 +6966,97 @@ def lookup_dictionary_entries(
             "results": [],
         }
 
-    placeholders = ",".join("?" for _ in variants)
-    exact_rows = connection.execute(
-        f"""
-        SELECT id, source_name, term, term_norm, definition
-        FROM dict_entries
-        WHERE term_norm IN ({placeholders})
-        ORDER BY
-            CASE
-                WHEN term_norm = ? THEN 0
-                ELSE 1
-            END,
-            LENGTH(term_norm) ASC,
-            id ASC
-        LIMIT ?
-        """,
-        (*variants, normalized, safe_limit),
-    ).fetchall()
-
-    selected_rows: list[sqlite3.Row | tuple[Any, ...]] = list(exact_rows)
-    seen_ids = {int(read_field(row, 0, "id")) for row in exact_rows}
-
-    if exact_only:
-        results: list[dict[str, Any]] = []
-        for row in selected_rows:
-            results.append(
-                {
-                    "id": int(read_field(row, 0, "id")),
-                    "source_name": str(read_field(row, 1, "source_name")),
-                    "term": str(read_field(row, 2, "term")),
-                    "term_norm": str(read_field(row, 3, "term_norm")),
-                    "definition": str(read_field(row, 4, "definition")),
-                }
+    # Normalized terms are lowercase and end in [a-z0-9], so this range is
+    # the same set as LIKE 'normalized%' but can seek the term_norm index.
+    prefix_upper = normalized[:-1] + chr(ord(normalized[-1]) + 1)
+    candidate_rows: Iterable[dict[str, Any]]
+    if exact_rows_by_norm is not None:
+        # Same ordering as SQL_SELECT_DICTIONARY_EXACT_PREFIX_MATCHES, applied
+        # to prefetched rows.
+        exact_rows = sorted(
+            (entry for variant in variants for entry in exact_rows_by_norm.get(variant, ())),
+            key=lambda entry: (
+                entry["term_norm"] != normalized,
+                len(entry["term_norm"]),
+                entry["id"],
+            ),
+        )[:safe_limit]
+        candidate_rows = exact_rows
+        if not exact_only and len(exact_rows) < safe_limit:
+            prefix_cursor = connection.execute(
+                SQL_SELECT_DICTIONARY_PREFIX_MATCHES,
+                (normalized, prefix_upper, (safe_limit - len(exact_rows)) * 3),
             )
-        return {
-            "term": term,
-            "normalized": normalized,
-            "results": results,
-        }
+            prefix_cursor.row_factory = dictionary_entry_row
+            candidate_rows = [*exact_rows, *prefix_cursor]
+    else:
+        placeholders = ",".join("?" for _ in variants)
+        candidate_cursor = connection.execute(
+            SQL_SELECT_DICTIONARY_EXACT_PREFIX_MATCHES.format(placeholders=placeholders),
+            (
+                *variants,
+                normalized,
+                safe_limit,
+                normalized,
+                prefix_upper,
+                0 if exact_only else safe_limit,
+                *variants,
+                safe_limit,
+            ),
+        )
+        candidate_cursor.row_factory = dictionary_entry_row
+        candidate_rows = candidate_cursor
 
-    if len(selected_rows) < safe_limit:
-        remaining = safe_limit - len(selected_rows)
-        prefix_pattern = f"{escape_like_pattern(normalized)}%"
-        prefix_rows = connection.execute(
-            """
-            SELECT id, source_name, term, term_norm, definition
-            FROM dict_entries
-            WHERE term_norm LIKE ? ESCAPE '\\'
-            ORDER BY LENGTH(term_norm) ASC, id ASC
-            LIMIT ?
-            """,
-            (prefix_pattern, remaining * 3),
-        ).fetchall()
-        for row in prefix_rows:
-            row_id = int(read_field(row, 0, "id"))
-            if row_id in seen_ids:
-                continue
-            seen_ids.add(row_id)
-            selected_rows.append(row)
-            if len(selected_rows) >= safe_limit:
-                break
+    selected_rows: list[dict[str, Any]] = []
+    seen_ids: set[int] = set()
+    for entry in candidate_rows:
+        if entry["id"] in seen_ids:
+            continue
+        seen_ids.add(entry["id"])
+        selected_rows.append(entry)
+        if len(selected_rows) >= safe_limit:
+            break
 
-    if len(selected_rows) < safe_limit and safe_fts_mode != "off":
-        fts_table_exists = connection.execute(
-            """
-            SELECT 1
-            FROM sqlite_master
-            WHERE type = 'table'
-              AND name = 'dict_entries_fts'
-            LIMIT 1
-            """
-        ).fetchone() is not None
-        if fts_table_exists:
+    if not exact_only and len(selected_rows) < safe_limit and safe_fts_mode != "off":
+        if fts_available is None:
+            fts_available = dictionary_fts_available(connection)
+        if fts_available:
             remaining = safe_limit - len(selected_rows)
             safe_fts_term = normalized.replace('"', ' ').strip()
             if safe_fts_term:
                 fts_match_expr = safe_fts_term
                 if safe_fts_mode == "term":
-                    term_tokens = [token for token in safe_fts_term.split() if token]
-                    column_terms: list[str] = []
-                    for token in term_tokens:
-                        cleaned_token = re.sub(r"[^a-z0-9-]+", "", token)
-                        if not cleaned_token:
-                            continue
-                        column_terms.append(
+                    # An empty join leaves no MATCH expression, skipping FTS.
+                    fts_match_expr = " ".join(
+                        [
                             f"(term_norm:{cleaned_token} OR term:{cleaned_token})"
-                        )
-                    if not column_terms:
-                        fts_match_expr = ""
-                    else:
-                        fts_match_expr = " ".join(column_terms)
-                if not fts_match_expr:
-                    fts_rows: list[sqlite3.Row | tuple[Any, ...]] = []
-                else:
+                            for token in safe_fts_term.split()
+                            if (cleaned_token := RE_DICTIONARY_FTS_TOKEN_STRIP.sub("", token))
+                        ]
+                    )
+                fts_rows: list[dict[str, Any]] = []
+                if fts_match_expr:
                     try:
-                        fts_rows = connection.execute(
-                            """
-                            SELECT de.id, de.source_name, de.term, de.term_norm, de.definition
-                            FROM dict_entries_fts fts
-                            JOIN dict_entries de
-                              ON de.id = fts.rowid
-                            WHERE fts.dict_entries_fts MATCH ?
-                            ORDER BY LENGTH(de.term_norm) ASC, de.id ASC
-                            LIMIT ?
-                            """,
+                        fts_cursor = connection.execute(
+                            SQL_SELECT_DICTIONARY_FTS_MATCHES,
                             (fts_match_expr, remaining * 4),
-                        ).fetchall()
+                        )
+                        fts_cursor.row_factory = dictionary_entry_row
+                        fts_rows = fts_cursor.fetchall()
                     except sqlite3.OperationalError:
                         fts_rows = []
-                for row in fts_rows:
-                    row_id = int(read_field(row, 0, "id"))
-                    if row_id in seen_ids:
+                for entry in fts_rows:
+                    if entry["id"] in seen_ids:
                         continue
-                    seen_ids.add(row_id)
-                    selected_rows.append(row)
+                    seen_ids.add(entry["id"])
+                    selected_rows.append(entry)
                     if len(selected_rows) >= safe_limit:
                         break
 
-    results: list[dict[str, Any]] = []
-    for row in selected_rows:
-        results.append(
-            {
-                "id": int(read_field(row, 0, "id")),
-                "source_name": str(read_field(row, 1, "source_name")),
-                "term": str(read_field(row, 2, "term")),
-                "term_norm": str(read_field(row, 3, "term_norm")),
-                "definition": str(read_field(row, 4, "definition")),
-            }
-        )
-
     return {
         "term": term,
         "normalized": normalized,
-        "results": results,
+        "results": selected_rows,
     }
 
 
@@ -6573,13 +7101,21 @@ def export_csv(connection: sqlite3.Connection, csv_path: Path) -> None:
     ORDER BY v.source_id, v.upload_date DESC, v.video_id DESC;
     """
     cursor = connection.execute(query)
-    rows = cursor.fetchall()
     headers = [description[0] for description in cursor.description]
-    with csv_path.open("w", newline="", encoding="utf-8") as file:
+    row_count = 0
+    # Stream the ledger in fetchmany batches instead of holding every row.
+    with csv_path.open(
+        "w",
+        newline="",
+        encoding="utf-8",
+        buffering=EXPORT_WRITE_BUFFER_BYTES,
+    ) as file:
         writer = csv.writer(file)
         writer.writerow(headers)
-        writer.writerows(rows)
-    print(f"[ledger] csv rows: {len(rows)} -> {csv_path}")
+        while rows := cursor.fetchmany(LEDGER_CSV_FETCH_ROWS):
+            writer.writerows(rows)
+            row_count += len(rows)
+    print(f"[ledger] csv rows: {row_count} -> {csv_path}")
 
 
 def upsert_source(connection: sqlite3.Connection, source: SourceConfig, updated_at: str) -> None:
@@ -6650,21 +7186,16 @@ def record_media_fallback_preferred_format(
     )
 
 
-def upsert_video_and_subtitles(
-    connection: sqlite3.Connection,
+def build_video_upsert_params(
     source: SourceConfig,
     video_id: str,
     meta_path: Path | None,
     meta_data: dict[str, Any],
     media_path: Path | None,
-    subtitle_records: list[tuple[str, Path, str]],
+    subtitle_records: list[tuple[str, str, str]],
     synced_at: str,
-) -> None:
-    translation_output_origin_lookup = build_translation_output_origin_lookup(
-        connection=connection,
-        source_id=source.id,
-        video_id=video_id,
-    )
+    description_ids: set[str] | None = None,
+) -> tuple[Any, ...]:
     media_path_value = str(media_path) if media_path else None
     media_ext = media_path.suffix.lstrip(".") if media_path else None
     media_size = None
@@ -6674,10 +7205,16 @@ def upsert_video_and_subtitles(
         except OSError:
             media_size = None
 
-    description_path = source.meta_dir / f"{video_id}.description"
-    description_path_value = str(description_path) if description_path.exists() else None
+    # description_ids is a prefetched listing of meta_dir; without it, fall
+    # back to one exists() probe.
+    description_path = source.meta_dir / f"{video_id}{DESCRIPTION_SUFFIX}"
+    if description_ids is not None:
+        has_description = video_id in description_ids
+    else:
+        has_description = description_path.exists()
+    description_path_value = str(description_path) if has_description else None
     description = meta_data.get("description")
-    if description is None and description_path.exists():
+    if description is None and has_description:
         try:
             description = description_path.read_text(encoding="utf-8", errors="ignore").strip()
         except OSError:
@@ -6693,118 +7230,172 @@ def upsert_video_and_subtitles(
         except ValueError:
             webpage_url = None
 
-    connection.execute(
-        """
-        INSERT INTO videos (
-            source_id,
-            video_id,
-            uploader,
-            uploader_id,
-            title,
-            description,
-            upload_date,
-            duration,
-            view_count,
-            like_count,
-            comment_count,
-            repost_count,
-            save_count,
-            webpage_url,
-            media_path,
-            media_ext,
-            media_size,
-            meta_path,
-            description_path,
-            has_media,
-            has_subtitles,
-            subtitle_count,
-            subtitle_langs,
-            synced_at
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ON CONFLICT(source_id, video_id) DO UPDATE SET
-            uploader = excluded.uploader,
-            uploader_id = excluded.uploader_id,
-            title = excluded.title,
-            description = excluded.description,
-            upload_date = excluded.upload_date,
-            duration = excluded.duration,
-            view_count = excluded.view_count,
-            like_count = excluded.like_count,
-            comment_count = excluded.comment_count,
-            repost_count = excluded.repost_count,
-            save_count = excluded.save_count,
-            webpage_url = excluded.webpage_url,
-            media_path = excluded.media_path,
-            media_ext = excluded.media_ext,
-            media_size = excluded.media_size,
-            meta_path = excluded.meta_path,
-            description_path = excluded.description_path,
-            has_media = excluded.has_media,
-            has_subtitles = excluded.has_subtitles,
-            subtitle_count = excluded.subtitle_count,
-            subtitle_langs = excluded.subtitle_langs,
-            synced_at = excluded.synced_at
-        """,
-        (
-            source.id,
-            video_id,
-            meta_data.get("uploader"),
-            meta_data.get("uploader_id"),
-            meta_data.get("title"),
-            description,
-            normalize_upload_date(meta_data.get("upload_date")),
-            safe_float(meta_data.get("duration")),
-            safe_int(meta_data.get("view_count")),
-            safe_int(meta_data.get("like_count")),
-            safe_int(meta_data.get("comment_count")),
-            safe_int(meta_data.get("repost_count")),
-            safe_int(meta_data.get("save_count")),
-            webpage_url,
-            media_path_value,
-            media_ext,
-            media_size,
-            str(meta_path) if meta_path else None,
-            description_path_value,
-            int(media_path is not None),
-            int(len(subtitle_records) > 0),
-            len(subtitle_records),
-            subtitle_langs_value,
-            synced_at,
-        ),
-    )
-
-    connection.execute(
-        "DELETE FROM subtitles WHERE source_id = ? AND video_id = ?",
-        (source.id, video_id),
-    )
+    return (
+        source.id,
+        video_id,
+        meta_data.get("uploader"),
+        meta_data.get("uploader_id"),
+        meta_data.get("title"),
+        description,
+        normalize_upload_date(meta_data.get("upload_date")),
+        safe_float(meta_data.get("duration")),
+        safe_int(meta_data.get("view_count")),
+        safe_int(meta_data.get("like_count")),
+        safe_int(meta_data.get("comment_count")),
+        safe_int(meta_data.get("repost_count")),
+        safe_int(meta_data.get("save_count")),
+        webpage_url,
+        media_path_value,
+        media_ext,
+        media_size,
+        str(meta_path) if meta_path else None,
+        description_path_value,
+        int(media_path is not None),
+        int(len(subtitle_records) > 0),
+        len(subtitle_records),
+        subtitle_langs_value,
+        synced_at,
+    )
+
+
+def build_subtitle_insert_params(
+    source_id: str,
+    video_id: str,
+    subtitle_records: list[tuple[str, str, str]],
+    translation_output_origin_lookup: dict[str, tuple[str, str]] | None,
+) -> list[tuple[Any, ...]]:
+    params: list[tuple[Any, ...]] = []
     for language, subtitle_path, extension in subtitle_records:
         origin_kind, origin_detail = classify_subtitle_origin(
             language=language,
             subtitle_path=subtitle_path,
             translation_output_origin_lookup=translation_output_origin_lookup,
         )
-        connection.execute(
-            """
-            INSERT INTO subtitles (
+        params.append(
+            (
                 source_id,
                 video_id,
                 language,
                 subtitle_path,
                 origin_kind,
                 origin_detail,
-                ext
-            ) VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                source.id,
-                video_id,
-                language,
-                str(subtitle_path),
-                origin_kind,
-                origin_detail,
                 extension,
-            ),
+            )
         )
+    return params
+
+
+SQL_UPSERT_VIDEO = """
+INSERT INTO videos (
+    source_id,
+    video_id,
+    uploader,
+    uploader_id,
+    title,
+    description,
+    upload_date,
+    duration,
+    view_count,
+    like_count,
+    comment_count,
+    repost_count,
+    save_count,
+    webpage_url,
+    media_path,
+    media_ext,
+    media_size,
+    meta_path,
+    description_path,
+    has_media,
+    has_subtitles,
+    subtitle_count,
+    subtitle_langs,
+    synced_at
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(source_id, video_id) DO UPDATE SET
+    uploader = excluded.uploader,
+    uploader_id = excluded.uploader_id,
+    title = excluded.title,
+    description = excluded.description,
+    upload_date = excluded.upload_date,
+    duration = excluded.duration,
+    view_count = excluded.view_count,
+    like_count = excluded.like_count,
+    comment_count = excluded.comment_count,
+    repost_count = excluded.repost_count,
+    save_count = excluded.save_count,
+    webpage_url = excluded.webpage_url,
+    media_path = excluded.media_path,
+    media_ext = excluded.media_ext,
+    media_size = excluded.media_size,
+    meta_path = excluded.meta_path,
+    description_path = excluded.description_path,
+    has_media = excluded.has_media,
+    has_subtitles = excluded.has_subtitles,
+    subtitle_count = excluded.subtitle_count,
+    subtitle_langs = excluded.subtitle_langs,
+    synced_at = excluded.synced_at
+"""
+SQL_DELETE_VIDEO_SUBTITLES = "DELETE FROM subtitles WHERE source_id = ? AND video_id = ?"
+SQL_INSERT_SUBTITLE = """
+INSERT INTO subtitles (
+    source_id,
+    video_id,
+    language,
+    subtitle_path,
+    origin_kind,
+    origin_detail,
+    ext
+) VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def write_video_and_subtitle_rows(
+    connection: sqlite3.Connection,
+    video_params: list[tuple[Any, ...]],
+    subtitle_params: list[tuple[Any, ...]],
+) -> None:
+    # Upserts videos before their subtitles so one executemany per table
+    # covers a whole rebuild batch.
+    connection.executemany(SQL_UPSERT_VIDEO, video_params)
+    connection.executemany(SQL_INSERT_SUBTITLE, subtitle_params)
+
+
+def upsert_video_and_subtitles(
+    connection: sqlite3.Connection,
+    source: SourceConfig,
+    video_id: str,
+    meta_path: Path | None,
+    meta_data: dict[str, Any],
+    media_path: Path | None,
+    subtitle_records: list[tuple[str, str, str]],
+    synced_at: str,
+) -> None:
+    translation_output_origin_lookup = build_translation_output_origin_lookup(
+        connection=connection,
+        source_id=source.id,
+        video_id=video_id,
+    )
+    video_params = build_video_upsert_params(
+        source=source,
+        video_id=video_id,
+        meta_path=meta_path,
+        meta_data=meta_data,
+        media_path=media_path,
+        subtitle_records=subtitle_records,
+        synced_at=synced_at,
+    )
+    connection.execute(SQL_DELETE_VIDEO_SUBTITLES, (source.id, video_id))
+    write_video_and_subtitle_rows(
+        connection,
+        [video_params],
+        build_subtitle_insert_params(
+            source.id,
+            video_id,
+            subtitle_records,
+            translation_output_origin_lookup,
+        ),
+    )
 
 
 def prune_source_videos_full_rebuild(
@@ -6813,14 +7404,17 @@ def prune_source_videos_full_rebuild(
     keep_video_ids: list[str],
 ) -> None:
     """Delete only stale rows after full rebuild without wiping per-video analysis columns."""
+    # WITHOUT ROWID stores the keep-set as a single clustered key (no separate
+    # PK index to maintain), and the table is dropped afterwards so its pages
+    # do not linger in the temp database between sources.
+    connection.execute("DROP TABLE IF EXISTS temp.tmp_keep_video_ids")
     connection.execute(
         """
-        CREATE TEMP TABLE IF NOT EXISTS tmp_keep_video_ids (
+        CREATE TEMP TABLE tmp_keep_video_ids (
             video_id TEXT PRIMARY KEY
-        )
+        ) WITHOUT ROWID
         """
     )
-    connection.execute("DELETE FROM tmp_keep_video_ids")
     if keep_video_ids:
         connection.executemany(
             "INSERT OR IGNORE INTO tmp_keep_video_ids(video_id) VALUES (?)",
@@ -6840,8 +7434,10 @@ def prune_source_videos_full_rebuild(
             f"""
             DELETE FROM {table_name}
             WHERE source_id = ?
-              AND video_id NOT IN (
-                SELECT video_id FROM tmp_keep_video_ids
+              AND NOT EXISTS (
+                SELECT 1
+                FROM tmp_keep_video_ids AS keep
+                WHERE keep.video_id = {table_name}.video_id
               )
             """,
             (source_id,),
@@ -6851,41 +7447,80 @@ def prune_source_videos_full_rebuild(
         """
         DELETE FROM videos
         WHERE source_id = ?
-          AND video_id NOT IN (
-            SELECT video_id FROM tmp_keep_video_ids
+          AND NOT EXISTS (
+            SELECT 1
+            FROM tmp_keep_video_ids AS keep
+            WHERE keep.video_id = videos.video_id
           )
         """,
         (source_id,),
     )
+    connection.execute("DROP TABLE temp.tmp_keep_video_ids")
 
 
 def rebuild_source_full(connection: sqlite3.Connection, source: SourceConfig, synced_at: str) -> None:
     connection.execute("DELETE FROM subtitles WHERE source_id = ?", (source.id,))
 
-    meta_records = load_meta_records(source.meta_dir)
+    meta_ids = list_meta_ids(source.meta_dir)
     media_files = scan_media_files(source)
     subtitle_files = scan_subtitles(source)
 
-    all_video_ids = sorted(set(meta_records) | set(media_files) | set(subtitle_files))
+    candidate_video_ids = sorted(meta_ids | set(media_files) | set(subtitle_files))
     subtitle_file_count = sum(len(files) for files in subtitle_files.values())
 
-    for video_id in all_video_ids:
+    # The source's subtitles were cleared above, so rows are accumulated and
+    # written with one executemany per table instead of per-video statements.
+    translation_output_origin_lookups = build_source_translation_output_origin_lookups(
+        connection,
+        source.id,
+    )
+    description_ids = list_meta_description_ids(source.meta_dir)
+    # Parsed info.json records are merged in id order from a batched stream
+    # and dropped once their row parameters are built, instead of holding
+    # every record for the source at once.
+    meta_stream = iter(
+        iter_meta_records(
+            source.meta_dir,
+            [video_id for video_id in candidate_video_ids if video_id in meta_ids],
+        )
+    )
+    all_video_ids: list[str] = []
+    video_params: list[tuple[Any, ...]] = []
+    subtitle_params: list[tuple[Any, ...]] = []
+    for video_id in candidate_video_ids:
         meta_path: Path | None = None
         meta_data: dict[str, Any] = {}
-        if video_id in meta_records:
-            meta_path, meta_data = meta_records[video_id]
+        if video_id in meta_ids:
+            _, info_path, data = next(meta_stream)
+            if data is not None:
+                meta_path, meta_data = info_path, data
+            elif video_id not in media_files and video_id not in subtitle_files:
+                # An unreadable info.json alone does not make a video.
+                continue
+        all_video_ids.append(video_id)
         media_path = media_files.get(video_id)
         subtitle_records = subtitle_files.get(video_id, [])
-        upsert_video_and_subtitles(
-            connection=connection,
-            source=source,
-            video_id=video_id,
-            meta_path=meta_path,
-            meta_data=meta_data,
-            media_path=media_path,
-            subtitle_records=subtitle_records,
-            synced_at=synced_at,
+        video_params.append(
+            build_video_upsert_params(
+                source=source,
+                video_id=video_id,
+                meta_path=meta_path,
+                meta_data=meta_data,
+                media_path=media_path,
+                subtitle_records=subtitle_records,
+                synced_at=synced_at,
+                description_ids=description_ids,
+            )
+        )
+        subtitle_params.extend(
+            build_subtitle_insert_params(
+                source.id,
+                video_id,
+                subtitle_records,
+                translation_output_origin_lookups.get(video_id),
+            )
         )
+    write_video_and_subtitle_rows(connection, video_params, subtitle_params)
 
     prune_source_videos_full_rebuild(connection, source.id, all_video_ids)
 
@@ -6947,30 +7582,29 @@ def rebuild_source_incremental(connection: sqlite3.Connection, source: SourceCon
 
     # Keep incremental mode aware of subtitle file add/remove updates for existing videos.
     # This allows translation subtitle drops (e.g., *.ja.vtt) to appear without full rebuild.
+    # A video changed when any (video_id, path) pair is on only one side, so
+    # one flat symmetric difference replaces the per-video set comparison.
     subtitle_files = scan_subtitles(source)
-    db_subtitle_paths_by_video: dict[str, set[str]] = {}
-    for row in connection.execute(
+    db_subtitle_cursor = connection.execute(
         """
         SELECT video_id, subtitle_path
         FROM subtitles
         WHERE source_id = ?
         """,
         (source.id,),
-    ).fetchall():
-        video_id = str(row[0])
-        subtitle_path = str(row[1])
-        db_subtitle_paths_by_video.setdefault(video_id, set()).add(subtitle_path)
-
-    subtitle_changed_ids: set[str] = set()
-    subtitle_video_ids = set(subtitle_files) | set(db_subtitle_paths_by_video)
-    for video_id in subtitle_video_ids:
-        scanned_paths = {
-            str(path)
-            for _, path, _ in subtitle_files.get(video_id, [])
-        }
-        db_paths = db_subtitle_paths_by_video.get(video_id, set())
-        if scanned_paths != db_paths:
-            subtitle_changed_ids.add(video_id)
+    )
+    # Both columns are TEXT and read from the covering primary key, so plain
+    # tuple rows go straight into the set without per-row str() calls.
+    db_subtitle_cursor.row_factory = None
+    db_subtitle_pairs = set(db_subtitle_cursor)
+    scanned_subtitle_pairs = {
+        (video_id, path)
+        for video_id, records in subtitle_files.items()
+        for _, path, _ in records
+    }
+    subtitle_changed_ids = {
+        video_id for video_id, _ in db_subtitle_pairs ^ scanned_subtitle_pairs
+    }
 
     candidate_ids = (
         missing_from_db_ids
@@ -6988,10 +7622,21 @@ def rebuild_source_incremental(connection: sqlite3.Connection, source: SourceCon
     with_media = 0
     with_subtitles = 0
 
+    # Index media once instead of listing media_dir per candidate; the
+    # substring match of find_media_file_for_video only covers ids whose
+    # file names the video_id_regex index missed.
+    media_paths = scan_media_files(source)
+    media_paths.update(
+        find_media_files_for_videos(
+            source,
+            [video_id for video_id in candidate_ids if video_id not in media_paths],
+        )
+    )
+
     for video_id in sorted(candidate_ids):
         meta_path, meta_data = load_meta_record_by_id(source, video_id)
-        media_path = find_media_file_for_video(source, video_id)
-        subtitle_records = scan_subtitles_for_video(source, video_id)
+        media_path = media_paths.get(video_id)
+        subtitle_records = subtitle_files.get(video_id, [])
         upsert_video_and_subtitles(
             connection=connection,
             source=source,
@@ -7019,6 +7664,20 @@ def rebuild_source_incremental(connection: sqlite3.Connection, source: SourceCon
     )
 
 
+# Orphan cleanup probes the videos primary key per row instead of building
+# the source's video_id list for NOT IN.
+SQL_DELETE_SOURCE_ROWS_WITHOUT_VIDEO = """
+DELETE FROM {table_name}
+WHERE source_id = ?
+  AND NOT EXISTS (
+    SELECT 1
+    FROM videos AS v
+    WHERE v.source_id = {table_name}.source_id
+      AND v.video_id = {table_name}.video_id
+  )
+"""
+
+
 def build_ledger(
     sources: list[SourceConfig],
     db_path: Path,
@@ -7028,7 +7687,8 @@ def build_ledger(
     db_path.parent.mkdir(parents=True, exist_ok=True)
     csv_path.parent.mkdir(parents=True, exist_ok=True)
 
-    connection = sqlite3.connect(str(db_path), timeout=30)
+    connection = connect_ledger_writer(db_path)
+    connection.execute(f"PRAGMA wal_autocheckpoint={LEDGER_REBUILD_WAL_AUTOCHECKPOINT_PAGES}")
     create_schema(connection)
     synced_at = now_utc_iso()
 
@@ -7039,26 +7699,11 @@ def build_ledger(
                 rebuild_source_incremental(connection, source, synced_at)
             else:
                 rebuild_source_full(connection, source, synced_at)
-            connection.execute(
-                """
-                DELETE FROM asr_runs
-                WHERE source_id = ?
-                  AND video_id NOT IN (
-                    SELECT video_id FROM videos WHERE source_id = ?
-                  )
-                """,
-                (source.id, source.id),
-            )
-            connection.execute(
-                """
-                DELETE FROM download_state
-                WHERE source_id = ?
-                  AND video_id NOT IN (
-                    SELECT video_id FROM videos WHERE source_id = ?
-                  )
-                """,
-                (source.id, source.id),
-            )
+            for table_name in ("asr_runs", "download_state"):
+                connection.execute(
+                    SQL_DELETE_SOURCE_ROWS_WITHOUT_VIDEO.format(table_name=table_name),
+                    (source.id,),
+                )
 
     export_csv(connection, csv_path)
     connection.close()
@@ -7365,6 +8010,59 @@ def update_download_run_progress(
     )
 
 
+SQL_UPSERT_DOWNLOAD_STATE = """
+INSERT INTO download_state (
+    source_id,
+    stage,
+    video_id,
+    url,
+    status,
+    retry_count,
+    last_error,
+    last_attempt_at,
+    next_retry_at,
+    last_run_id,
+    updated_at
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(source_id, stage, video_id) DO UPDATE SET
+    url = excluded.url,
+    status = excluded.status,
+    retry_count = excluded.retry_count,
+    last_error = excluded.last_error,
+    last_attempt_at = excluded.last_attempt_at,
+    next_retry_at = excluded.next_retry_at,
+    last_run_id = excluded.last_run_id,
+    updated_at = excluded.updated_at
+"""
+
+
+def build_download_state_row(
+    source_id: str,
+    stage: str,
+    video_id: str,
+    status: str,
+    run_id: int | None,
+    attempt_at: str,
+    url: str | None,
+    last_error: str | None,
+    retry_count: int,
+    next_retry_at: str | None,
+) -> tuple[Any, ...]:
+    return (
+        source_id,
+        stage,
+        video_id,
+        url,
+        status,
+        retry_count,
+        last_error,
+        attempt_at,
+        next_retry_at,
+        run_id,
+        attempt_at,
+    )
+
+
 def upsert_download_state(
     connection: sqlite3.Connection,
     source_id: str,
@@ -7378,58 +8076,36 @@ def upsert_download_state(
     retry_count: int | None = None,
     next_retry_at: str | None = None,
 ) -> None:
-    current = connection.execute(
-        """
-        SELECT retry_count
-        FROM download_state
-        WHERE source_id = ? AND stage = ? AND video_id = ?
-        """,
-        (source_id, stage, video_id),
-    ).fetchone()
     if retry_count is None:
-        retry_count = int(current[0]) if current else 0
+        current = load_download_states(connection, source_id, stage, [video_id]).get(video_id)
+        retry_count = current[1] if current else 0
 
     connection.execute(
-        """
-        INSERT INTO download_state (
-            source_id,
-            stage,
-            video_id,
-            url,
-            status,
-            retry_count,
-            last_error,
-            last_attempt_at,
-            next_retry_at,
-            last_run_id,
-            updated_at
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ON CONFLICT(source_id, stage, video_id) DO UPDATE SET
-            url = excluded.url,
-            status = excluded.status,
-            retry_count = excluded.retry_count,
-            last_error = excluded.last_error,
-            last_attempt_at = excluded.last_attempt_at,
-            next_retry_at = excluded.next_retry_at,
-            last_run_id = excluded.last_run_id,
-            updated_at = excluded.updated_at
-        """,
-        (
-            source_id,
-            stage,
-            video_id,
-            url,
-            status,
-            retry_count,
-            last_error,
-            attempt_at,
-            next_retry_at,
-            run_id,
-            attempt_at,
+        SQL_UPSERT_DOWNLOAD_STATE,
+        build_download_state_row(
+            source_id=source_id,
+            stage=stage,
+            video_id=video_id,
+            status=status,
+            run_id=run_id,
+            attempt_at=attempt_at,
+            url=url,
+            last_error=last_error,
+            retry_count=retry_count,
+            next_retry_at=next_retry_at,
         ),
     )
 
 
+def upsert_download_states(
+    connection: sqlite3.Connection,
+    rows: Iterable[tuple[Any, ...]],
+) -> None:
+    # Rows come from build_download_state_row with an explicit retry_count,
+    # so a whole batch binds against one prepared statement.
+    connection.executemany(SQL_UPSERT_DOWNLOAD_STATE, rows)
+
+
 def mark_media_retry_state(
     connection: sqlite3.Connection,
     source: SourceConfig,
@@ -7439,16 +8115,9 @@ def mark_media_retry_state(
     attempt_at: str | None = None,
 ) -> tuple[int, str]:
     attempt_value = attempt_at or now_utc_iso()
-    current = connection.execute(
-        """
-        SELECT status, retry_count, next_retry_at
-        FROM download_state
-        WHERE source_id = ? AND stage = 'media' AND video_id = ?
-        """,
-        (source.id, video_id),
-    ).fetchone()
-    current_status = str(current[0]) if current else ""
-    current_retry_count = int(current[1]) if current else 0
+    current = load_download_states(connection, source.id, "media", [video_id]).get(video_id)
+    current_status = current[0] if current else ""
+    current_retry_count = current[1] if current else 0
     current_next_retry = (
         str(current[2])
         if current is not None and current[2] not in (None, "")
@@ -7498,6 +8167,29 @@ def mark_media_retry_state(
     return next_retry_count, next_retry_at
 
 
+def load_download_states(
+    connection: sqlite3.Connection,
+    source_id: str,
+    stage: str,
+    video_ids: Iterable[str],
+) -> dict[str, tuple[str, int, str | None]]:
+    # (status, retry_count, next_retry_at) per id, looked up in IN batches.
+    states: dict[str, tuple[str, int, str | None]] = {}
+    for batch in chunk_items(list(dict.fromkeys(video_ids)), SQLITE_IN_CLAUSE_BATCH_SIZE):
+        placeholders = ",".join("?" for _ in batch)
+        rows = connection.execute(
+            f"""
+            SELECT video_id, status, retry_count, next_retry_at
+            FROM download_state
+            WHERE source_id = ? AND stage = ? AND video_id IN ({placeholders})
+            """,
+            (source_id, stage, *batch),
+        ).fetchall()
+        for video_id, status, retry_count, next_retry_at in rows:
+            states[str(video_id)] = (str(status), int(retry_count or 0), next_retry_at)
+    return states
+
+
 def split_retryable_ids(
     connection: sqlite3.Connection,
     source_id: str,
@@ -7508,24 +8200,25 @@ def split_retryable_ids(
     if not candidate_ids:
         return [], []
     now_value = now_iso or now_utc_iso()
+    states = load_download_states(connection, source_id, stage, candidate_ids)
+    return classify_retry_candidates(candidate_ids, states, now_value)
+
 
+def classify_retry_candidates(
+    candidate_ids: list[str],
+    states: dict[str, tuple[str, int, str | None]],
+    now_value: str,
+) -> tuple[list[str], list[str]]:
     retryable: list[str] = []
     deferred: list[str] = []
     for video_id in candidate_ids:
-        row = connection.execute(
-            """
-            SELECT status, next_retry_at
-            FROM download_state
-            WHERE source_id = ? AND stage = ? AND video_id = ?
-            """,
-            (source_id, stage, video_id),
-        ).fetchone()
+        row = states.get(video_id)
         if row is None:
             retryable.append(video_id)
             continue
 
         status = str(row[0])
-        next_retry_at = row[1]
+        next_retry_at = row[2]
         if status != "error":
             retryable.append(video_id)
             continue
@@ -7543,8 +8236,9 @@ def get_due_retry_ids(
     source_id: str,
     stage: str,
     limit: int = 200,
+    now_iso: str | None = None,
 ) -> list[str]:
-    now_iso = now_utc_iso()
+    now_value = now_iso or now_utc_iso()
     rows = connection.execute(
         """
         SELECT video_id
@@ -7556,11 +8250,93 @@ def get_due_retry_ids(
         ORDER BY updated_at ASC
         LIMIT ?
         """,
-        (source_id, stage, now_iso, limit),
+        (source_id, stage, now_value, limit),
     ).fetchall()
     return [str(row[0]) for row in rows]
 
 
+@dataclass
+class DownloadRetryPlan:
+    retryable_ids: list[str]
+    deferred_ids: list[str]
+    due_retry_ids: list[str]
+
+
+def fetch_retry_plan(
+    connection: sqlite3.Connection,
+    source_id: str,
+    stage: str,
+    candidate_ids: list[str],
+    *,
+    include_due_retries: bool = True,
+    limit: int = 200,
+    now_iso: str | None = None,
+) -> DownloadRetryPlan:
+    # split_retryable_ids + get_due_retry_ids as one UNION ALL statement.
+    now_value = now_iso or now_utc_iso()
+    unique_candidate_ids = list(dict.fromkeys(candidate_ids))
+    if len(unique_candidate_ids) > SQLITE_IN_CLAUSE_BATCH_SIZE:
+        retryable, deferred = split_retryable_ids(
+            connection=connection,
+            source_id=source_id,
+            stage=stage,
+            candidate_ids=candidate_ids,
+            now_iso=now_value,
+        )
+        due_retry_ids = (
+            get_due_retry_ids(connection, source_id, stage, limit=limit, now_iso=now_value)
+            if include_due_retries
+            else []
+        )
+        return DownloadRetryPlan(retryable, deferred, due_retry_ids)
+
+    selects: list[str] = []
+    params: list[Any] = []
+    if unique_candidate_ids:
+        placeholders = ",".join("?" for _ in unique_candidate_ids)
+        selects.append(
+            f"""
+            SELECT 0, video_id, status, retry_count, next_retry_at, updated_at
+            FROM download_state
+            WHERE source_id = ? AND stage = ? AND video_id IN ({placeholders})
+            """
+        )
+        params.extend((source_id, stage, *unique_candidate_ids))
+    if include_due_retries:
+        selects.append(
+            """
+            SELECT * FROM (
+                SELECT 1, video_id, status, retry_count, next_retry_at, updated_at
+                FROM download_state
+                WHERE source_id = ?
+                  AND stage = ?
+                  AND status = 'error'
+                  AND (next_retry_at IS NULL OR next_retry_at <= ?)
+                ORDER BY updated_at ASC
+                LIMIT ?
+            )
+            """
+        )
+        params.extend((source_id, stage, now_value, limit))
+    if not selects:
+        return DownloadRetryPlan([], [], [])
+
+    states: dict[str, tuple[str, int, str | None]] = {}
+    due_retry_ids: list[str] = []
+    # The subquery's ORDER BY only picks which due rows fit the LIMIT; the
+    # compound select needs its own ORDER BY to keep them oldest first.
+    for kind, video_id, status, retry_count, next_retry_at, _updated_at in connection.execute(
+        " UNION ALL ".join(selects) + " ORDER BY 1, 6",
+        params,
+    ):
+        if kind == 0:
+            states[str(video_id)] = (str(status), int(retry_count or 0), next_retry_at)
+        else:
+            due_retry_ids.append(str(video_id))
+    retryable, deferred = classify_retry_candidates(candidate_ids, states, now_value)
+    return DownloadRetryPlan(retryable, deferred, due_retry_ids)
+
+
 def compute_next_poll_at_iso(
     poll_interval_hours: float,
     from_dt: dt.datetime | None = None,
@@ -8347,7 +9123,7 @@ def lease_next_work_item(
             lease_seconds=lease_seconds,
             from_dt=now_value,
         )
-        lease_token = uuid.uuid4().hex
+        lease_token = os.urandom(16).hex()
 
         connection.execute("BEGIN IMMEDIATE")
         candidate_params: list[Any] = [*normalized_stages, now_iso, now_iso, now_iso]
@@ -8746,7 +9522,7 @@ def process_leased_work_item(
                 video_id=video_id,
                 dry_run=False,
                 force=False,
-                ffprobe_bin=find_executable_command("ffprobe"),
+                ffprobe_bin=find_ffmpeg_tool("ffprobe"),
             )
             if not asr_ok:
                 return (False, asr_error or f"asr failed ({source.id}/{video_id})")
@@ -8827,8 +9603,7 @@ def run_queue_worker(
     translate_timeout_sec: int = 60,
 ) -> None:
     db_path.parent.mkdir(parents=True, exist_ok=True)
-    connection = sqlite3.connect(str(db_path), timeout=30)
-    connection.execute("PRAGMA journal_mode=WAL")
+    connection = connect_ledger_writer(db_path)
     connection.row_factory = sqlite3.Row
     create_schema(connection)
 
@@ -8841,7 +9616,7 @@ def run_queue_worker(
 
     worker_id_value = str(worker_id or "").strip()
     if not worker_id_value:
-        worker_id_value = f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        worker_id_value = f"{socket.gethostname()}-{os.getpid()}-{os.urandom(4).hex()}"
 
     started_at = now_utc_iso()
     processed = 0
@@ -9384,7 +10159,7 @@ def run_asr_for_video(
     ffprobe_value = (
         ffprobe_bin
         if ffprobe_bin is not None
-        else find_executable_command("ffprobe")
+        else find_ffmpeg_tool("ffprobe")
     )
     has_valid_output = False
     if output_path_value not in (None, ""):
@@ -9589,9 +10364,9 @@ def run_asr(
     db_path.parent.mkdir(parents=True, exist_ok=True)
     csv_path.parent.mkdir(parents=True, exist_ok=True)
 
-    connection = sqlite3.connect(str(db_path), timeout=30)
+    connection = connect_ledger_writer(db_path)
     create_schema(connection)
-    ffprobe_bin = find_executable_command("ffprobe")
+    ffprobe_bin = find_ffmpeg_tool("ffprobe")
 
     for source in sources:
         if not source.asr_enabled:
@@ -9718,21 +10493,9 @@ def run_asr(
             run_attempt = attempts + 1
             started_at = now_utc_iso()
 
-            upsert_asr_run(
-                connection=connection,
-                source_id=source.id,
-                video_id=video_id,
-                status="running",
-                attempts=run_attempt,
-                engine="command",
-                output_path=str(previous_output_path) if previous_output_path else None,
-                artifact_dir=str(artifact_dir),
-                last_error=None,
-                started_at=started_at,
-                finished_at=None,
-            )
-            connection.commit()
-
+            # Probe before recording the run: a video without audio gets its
+            # retry state and final row in one commit instead of a separate
+            # "running" commit first.
             timeout = source.asr_timeout_sec if source.asr_timeout_sec > 0 else None
             if ffprobe_bin:
                 has_audio_stream, probe_error = detect_audio_stream(
@@ -9776,6 +10539,23 @@ def run_asr(
                         f"ffprobe warning ({probe_error}); continuing",
                         file=sys.stderr,
                     )
+            upsert_asr_run(
+                connection=connection,
+                source_id=source.id,
+                video_id=video_id,
+                status="running",
+                attempts=run_attempt,
+                engine="command",
+                output_path=str(previous_output_path) if previous_output_path else None,
+                artifact_dir=str(artifact_dir),
+                last_error=None,
+                started_at=started_at,
+                finished_at=None,
+            )
+            # Committed before the command runs so no write lock is held
+            # for its duration.
+            connection.commit()
+
             try:
                 completed = subprocess.run(
                     command,
@@ -9944,10 +10724,88 @@ def analyze_media_loudness(
     return input_lufs, None
 
 
+def iter_mp4_boxes(data: bytes, start: int = 0, end: int | None = None) -> Iterable[tuple[bytes, int, int]]:
+    # Yields (type, payload_start, payload_end) for each box in data[start:end].
+    limit = len(data) if end is None else end
+    offset = start
+    while offset + 8 <= limit:
+        size = int.from_bytes(data[offset:offset + 4], "big")
+        box_type = data[offset + 4:offset + 8]
+        header_size = 8
+        if size == 1:
+            if offset + 16 > limit:
+                return
+            size = int.from_bytes(data[offset + 8:offset + 16], "big")
+            header_size = 16
+        elif size == 0:
+            size = limit - offset
+        if size < header_size or offset + size > limit:
+            return
+        yield box_type, offset + header_size, offset + size
+        offset += size
+
+
+def detect_mp4_audio_track(media_path: Path) -> bool | None:
+    # Reads the moov box directly and checks each trak's hdlr for "soun".
+    # None means "not a readable MP4"; the caller then asks ffprobe.
+    try:
+        with open(media_path, "rb") as file:
+            file_size = os.fstat(file.fileno()).st_size
+            offset = 0
+            moov: bytes | None = None
+            saw_ftyp = False
+            while offset + 8 <= file_size:
+                file.seek(offset)
+                header = file.read(16)
+                size = int.from_bytes(header[:4], "big")
+                box_type = header[4:8]
+                header_size = 8
+                if size == 1:
+                    size = int.from_bytes(header[8:16], "big")
+                    header_size = 16
+                elif size == 0:
+                    size = file_size - offset
+                if size < header_size or offset + size > file_size:
+                    return None
+                if offset == 0:
+                    if box_type != b"ftyp":
+                        return None
+                    saw_ftyp = True
+                if box_type == b"moov":
+                    if size > MP4_MOOV_MAX_BYTES:
+                        return None
+                    file.seek(offset + header_size)
+                    moov = file.read(size - header_size)
+                    break
+                offset += size
+    except OSError:
+        return None
+    if not saw_ftyp or moov is None:
+        return None
+
+    track_count = 0
+    for box_type, start, end in iter_mp4_boxes(moov):
+        if box_type != b"trak":
+            continue
+        track_count += 1
+        for trak_child, mdia_start, mdia_end in iter_mp4_boxes(moov, start, end):
+            if trak_child != b"mdia":
+                continue
+            for mdia_child, hdlr_start, hdlr_end in iter_mp4_boxes(moov, mdia_start, mdia_end):
+                # hdlr: version/flags (4), pre_defined (4), handler_type (4).
+                if mdia_child == b"hdlr" and hdlr_end - hdlr_start >= 12:
+                    if moov[hdlr_start + 8:hdlr_start + 12] == b"soun":
+                        return True
+    return False if track_count else None
+
+
 def detect_audio_stream(
     media_path: Path,
     ffprobe_bin: str,
 ) -> tuple[bool | None, str | None]:
+    has_audio_track = detect_mp4_audio_track(media_path)
+    if has_audio_track is not None:
+        return has_audio_track, None
     command = [
         ffprobe_bin,
         "-v",
@@ -9973,6 +10831,26 @@ def detect_audio_stream(
     return bool(completed.stdout.strip()), None
 
 
+def detect_audio_streams(
+    media_paths: dict[str, Path],
+    ffprobe_bin: str,
+    max_workers: int = MEDIA_PROBE_MAX_WORKERS,
+) -> dict[str, tuple[bool | None, str | None]]:
+    # ffprobe runs are dominated by process start-up, so probe them side by side.
+    if not media_paths:
+        return {}
+    video_ids = list(media_paths)
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(video_ids)))) as executor:
+        results = executor.map(
+            lambda video_id: detect_audio_stream(
+                media_path=media_paths[video_id],
+                ffprobe_bin=ffprobe_bin,
+            ),
+            video_ids,
+        )
+        return dict(zip(video_ids, results))
+
+
 def run_loudness_for_video(
     connection: sqlite3.Connection,
     source: SourceConfig,
@@ -10000,7 +10878,7 @@ def run_loudness_for_video(
         if sibling_ffprobe.exists():
             ffprobe_bin = str(sibling_ffprobe)
     if ffprobe_bin is None:
-        ffprobe_bin = find_executable_command("ffprobe")
+        ffprobe_bin = find_ffmpeg_tool("ffprobe")
     has_ffprobe = ffprobe_bin is not None
 
     row = connection.execute(
@@ -10195,10 +11073,10 @@ def run_loudness(
         if sibling_ffprobe.exists():
             ffprobe_bin = str(sibling_ffprobe)
     if ffprobe_bin is None:
-        ffprobe_bin = find_executable_command("ffprobe")
+        ffprobe_bin = find_ffmpeg_tool("ffprobe")
     has_ffprobe = ffprobe_bin is not None
 
-    connection = sqlite3.connect(str(db_path), timeout=30)
+    connection = connect_ledger_writer(db_path)
     create_schema(connection)
 
     safe_limit = max(1, int(limit))
@@ -10440,7 +11318,7 @@ def run_dict_index(
         raise ValueError(f"Dictionary path is not a file: {dictionary_path}")
 
     db_path.parent.mkdir(parents=True, exist_ok=True)
-    connection = sqlite3.connect(str(db_path), timeout=30)
+    connection = connect_ledger_writer(db_path)
     create_schema(connection)
 
     max_lines_value = None
@@ -10562,7 +11440,7 @@ def run_backfill(
     db_path.parent.mkdir(parents=True, exist_ok=True)
     csv_path.parent.mkdir(parents=True, exist_ok=True)
 
-    connection = sqlite3.connect(str(db_path), timeout=30)
+    connection = connect_ledger_writer(db_path)
     create_schema(connection)
     any_work = False
 
@@ -11200,7 +12078,7 @@ def requeue_work_items(
     if not status_filter:
         status_filter = ["error", "dead"]
 
-    connection = sqlite3.connect(str(db_path), timeout=30)
+    connection = connect_ledger_writer(db_path)
     create_schema(connection)
     now_iso = now_utc_iso()
     total_selected = 0
@@ -11457,10 +12335,7 @@ def run_dict_bookmarks_export(
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
     if output_format == "jsonl":
-        with output_path.open("w", encoding="utf-8") as handle:
-            for record in records:
-                handle.write(json.dumps(record, ensure_ascii=False))
-                handle.write("\n")
+        write_jsonl_records(records, output_path)
     else:
         fieldnames = [
             "id",
@@ -11482,32 +12357,39 @@ def run_dict_bookmarks_export(
             "created_at",
             "updated_at",
         ]
-        with output_path.open("w", encoding="utf-8", newline="") as handle:
-            writer = csv.DictWriter(handle, fieldnames=fieldnames)
-            writer.writeheader()
-            for record in records:
-                writer.writerow(
-                    {
-                        "id": record["id"],
-                        "source_id": record["source_id"],
-                        "video_id": record["video_id"],
-                        "track": record["track"],
-                        "cue_start_ms": record["cue_start_ms"],
-                        "cue_end_ms": record["cue_end_ms"],
-                        "cue_text": record["cue_text"],
-                        "dict_entry_id": record["dict_entry_id"],
-                        "dict_source_name": record["dict_source_name"],
-                        "lookup_term": record["lookup_term"],
-                        "term": record["term"],
-                        "term_norm": record["term_norm"],
-                        "definition": record["definition"],
-                        "missing_entry": 1 if record["missing_entry"] else 0,
-                        "lookup_path_json": json.dumps(record["lookup_path"], ensure_ascii=False),
-                        "lookup_path_label": record["lookup_path_label"],
-                        "created_at": record["created_at"],
-                        "updated_at": record["updated_at"],
-                    }
+        with output_path.open(
+            "w",
+            encoding="utf-8",
+            newline="",
+            buffering=EXPORT_WRITE_BUFFER_BYTES,
+        ) as handle:
+            # Plain tuples in fieldnames order: DictWriter would rebuild a
+            # dict and run its extra-key check for every row.
+            writer = csv.writer(handle)
+            writer.writerow(fieldnames)
+            writer.writerows(
+                (
+                    record["id"],
+                    record["source_id"],
+                    record["video_id"],
+                    record["track"],
+                    record["cue_start_ms"],
+                    record["cue_end_ms"],
+                    record["cue_text"],
+                    record["dict_entry_id"],
+                    record["dict_source_name"],
+                    record["lookup_term"],
+                    record["term"],
+                    record["term_norm"],
+                    record["definition"],
+                    1 if record["missing_entry"] else 0,
+                    json_dumps_compact(record["lookup_path"]),
+                    record["lookup_path_label"],
+                    record["created_at"],
+                    record["updated_at"],
                 )
+                for record in records
+            )
 
     missing_count = sum(1 for record in records if record["missing_entry"])
     known_count = len(records) - missing_count
@@ -11526,9 +12408,9 @@ def parse_bool_like(value: Any, default: bool = False) -> bool:
     if isinstance(value, (int, float)):
         return bool(value)
     normalized = str(value).strip().lower()
-    if normalized in {"1", "true", "yes", "y", "on"}:
+    if normalized in TRUTHY_TEXT_VALUES:
         return True
-    if normalized in {"0", "false", "no", "n", "off"}:
+    if normalized in FALSY_TEXT_VALUES:
         return False
     return default
 
@@ -11565,6 +12447,11 @@ def load_dict_bookmark_import_rows(input_path: Path, input_format: str) -> list[
     raise ValueError("input_format must be jsonl or csv")
 
 
+def write_jsonl_records(records: Iterable[dict[str, Any]], output_path: Path) -> None:
+    with output_path.open("w", encoding="utf-8", buffering=EXPORT_WRITE_BUFFER_BYTES) as handle:
+        handle.writelines(f"{json_dumps_compact(record)}\n" for record in records)
+
+
 def write_records_as_jsonl_or_csv(
     records: list[dict[str, Any]],
     output_path: Path,
@@ -11572,10 +12459,7 @@ def write_records_as_jsonl_or_csv(
 ) -> None:
     output_path.parent.mkdir(parents=True, exist_ok=True)
     if output_format == "jsonl":
-        with output_path.open("w", encoding="utf-8") as handle:
-            for record in records:
-                handle.write(json.dumps(record, ensure_ascii=False))
-                handle.write("\n")
+        write_jsonl_records(records, output_path)
         return
 
     if output_format != "csv":
@@ -11589,11 +12473,15 @@ def write_records_as_jsonl_or_csv(
                 continue
             seen.add(key)
             fieldnames.append(key)
-    with output_path.open("w", encoding="utf-8", newline="") as handle:
+    with output_path.open(
+        "w",
+        encoding="utf-8",
+        newline="",
+        buffering=EXPORT_WRITE_BUFFER_BYTES,
+    ) as handle:
         writer = csv.DictWriter(handle, fieldnames=fieldnames)
         writer.writeheader()
-        for record in records:
-            writer.writerow(record)
+        writer.writerows(records)
 
 
 def normalize_dict_bookmark_import_row(
@@ -11689,7 +12577,7 @@ def normalize_dict_bookmark_import_row(
 
     lookup_path_json = ""
     if lookup_path:
-        lookup_path_json = json.dumps(lookup_path, ensure_ascii=False, separators=(",", ":"))
+        lookup_path_json = json_dumps_compact(lookup_path)
 
     return {
         "source_id": source_id,
@@ -11733,7 +12621,7 @@ def run_dict_bookmarks_import(
     allowed_sources = set(source_ids)
     seen_composites: set[tuple[Any, ...]] = set()
 
-    connection = sqlite3.connect(str(db_path), timeout=30)
+    connection = connect_ledger_writer(db_path)
     connection.row_factory = sqlite3.Row
     create_schema(connection)
     connection.commit()
@@ -12651,6 +13539,9 @@ def run_notify_install_macos(
         "StandardErrorPath": str(logs_dir / "substudy-notify.err.log"),
     }
 
+    # plistlib pulls in the expat XML parser; only this macOS command needs it.
+    import plistlib
+
     safe_plist_path.parent.mkdir(parents=True, exist_ok=True)
     with safe_plist_path.open("wb") as handle:
         plistlib.dump(plist_payload, handle, sort_keys=True)
@@ -12738,9 +13629,9 @@ def parse_bool_flag(raw_value: str | None, default: bool = False) -> bool:
     if raw_value in (None, ""):
         return default
     normalized = str(raw_value).strip().lower()
-    if normalized in {"1", "true", "yes", "y", "on"}:
+    if normalized in TRUTHY_TEXT_VALUES:
         return True
-    if normalized in {"0", "false", "no", "n", "off"}:
+    if normalized in FALSY_TEXT_VALUES:
         return False
     return default
 
@@ -12761,10 +13652,7 @@ def get_app_state_value(
     ).fetchone()
     if row is None:
         return default
-    if isinstance(row, sqlite3.Row):
-        value = row["state_value"]
-    else:
-        value = row[0]
+    value = row[0]
     return default if value in (None, "") else str(value)
 
 
@@ -13653,6 +14541,64 @@ def get_track_for_video(
     return None
 
 
+def probe_video_track(
+    connection: sqlite3.Connection,
+    source_id: str,
+    video_id: str,
+    track_id: str,
+) -> tuple[bool, bool]:
+    # Validates a track id against the same rules as collect_video_tracks
+    # (latest successful ASR output first, then existing subtitle files),
+    # together with the video existence check, in one round trip.
+    track_kind, _, track_token = str(track_id or "").partition(":")
+    track_path = decode_path_token(track_token)
+    row = connection.execute(
+        """
+        SELECT
+            EXISTS(
+                SELECT 1
+                FROM videos
+                WHERE source_id = ?1
+                  AND video_id = ?2
+            ) AS video_exists,
+            (
+                SELECT output_path
+                FROM asr_runs
+                WHERE source_id = ?1
+                  AND video_id = ?2
+                  AND status = 'success'
+                  AND output_path IS NOT NULL
+                ORDER BY updated_at DESC
+                LIMIT 1
+            ) AS asr_output_path,
+            EXISTS(
+                SELECT 1
+                FROM subtitles
+                WHERE source_id = ?1
+                  AND video_id = ?2
+                  AND subtitle_path = ?3
+            ) AS subtitle_exists
+        """,
+        (source_id, video_id, "" if track_path is None else str(track_path)),
+    ).fetchone()
+    video_exists = bool(row[0])
+    if not video_exists or track_path is None:
+        return video_exists, False
+
+    asr_path: Path | None = None
+    if row[1] is not None:
+        candidate = Path(str(row[1]))
+        if candidate.exists() and candidate.is_file():
+            asr_path = candidate
+    if track_kind == "asr":
+        return True, asr_path is not None and encode_path_token(asr_path) == track_token
+    if track_kind != "subtitle" or not row[2]:
+        return True, False
+    if asr_path is not None and str(asr_path) == str(track_path):
+        return True, False
+    return True, track_path.exists() and track_path.is_file()
+
+
 def resolve_ja_subtitle_path(
     connection: sqlite3.Connection,
     source_id: str,
@@ -15714,6 +16660,146 @@ def serialize_source_target(source: SourceConfig, video_count: int = 0) -> dict[
     )
 
 
+# Web write-path statements are shared constants so every request binds
+# byte-identical SQL and hits the per-connection sqlite3 statement cache.
+SQL_SELECT_VIDEO_EXISTS = """
+    SELECT 1
+    FROM videos
+    WHERE source_id = ?
+      AND video_id = ?
+    LIMIT 1
+"""
+SQL_SELECT_SUBTITLE_BOOKMARK_BY_ID = """
+    SELECT
+        id,
+        source_id,
+        video_id,
+        track,
+        start_ms,
+        end_ms,
+        text,
+        note,
+        created_at
+    FROM subtitle_bookmarks
+    WHERE id = ?
+"""
+SQL_SELECT_SUBTITLE_BOOKMARKS_AFTER_ID = """
+    SELECT
+        id,
+        source_id,
+        video_id,
+        track,
+        start_ms,
+        end_ms,
+        text,
+        note,
+        created_at
+    FROM subtitle_bookmarks
+    WHERE id > ?
+    ORDER BY id ASC
+"""
+SQL_INSERT_SUBTITLE_BOOKMARK = """
+    INSERT INTO subtitle_bookmarks (
+        source_id,
+        video_id,
+        track,
+        start_ms,
+        end_ms,
+        text,
+        note,
+        created_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+SQL_UPSERT_VIDEO_NOTE_RETURNING = """
+    INSERT INTO video_notes (
+        source_id,
+        video_id,
+        note,
+        created_at,
+        updated_at
+    ) VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT(source_id, video_id) DO UPDATE SET
+        note = excluded.note,
+        updated_at = excluded.updated_at
+    RETURNING note, created_at, updated_at
+"""
+SQL_DELETE_VIDEO_NOTE = """
+    DELETE FROM video_notes
+    WHERE source_id = ?
+      AND video_id = ?
+"""
+SQL_INSERT_DICTIONARY_BOOKMARK_RETURNING = """
+    INSERT INTO dictionary_bookmarks (
+        source_id,
+        video_id,
+        track,
+        cue_start_ms,
+        cue_end_ms,
+        cue_text,
+        dict_entry_id,
+        dict_source_name,
+        lookup_term,
+        term,
+        term_norm,
+        definition,
+        missing_entry,
+        lookup_path_json,
+        lookup_path_label,
+        created_at,
+        updated_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(source_id, video_id, track, cue_start_ms, cue_end_ms, dict_entry_id)
+    DO NOTHING
+    RETURNING
+        id,
+        source_id,
+        video_id,
+        track,
+        cue_start_ms,
+        cue_end_ms,
+        cue_text,
+        dict_entry_id,
+        dict_source_name,
+        lookup_term,
+        term,
+        term_norm,
+        definition,
+        missing_entry,
+        lookup_path_json,
+        lookup_path_label,
+        created_at,
+        updated_at
+"""
+SQL_DELETE_DICTIONARY_BOOKMARK_RETURNING = """
+    DELETE FROM dictionary_bookmarks
+    WHERE source_id = ?
+      AND video_id = ?
+      AND track = ?
+      AND cue_start_ms = ?
+      AND cue_end_ms = ?
+      AND dict_entry_id = ?
+    RETURNING
+        id,
+        source_id,
+        video_id,
+        track,
+        cue_start_ms,
+        cue_end_ms,
+        cue_text,
+        dict_entry_id,
+        dict_source_name,
+        lookup_term,
+        term,
+        term_norm,
+        definition,
+        missing_entry,
+        lookup_path_json,
+        lookup_path_label,
+        created_at,
+        updated_at
+"""
+
+
 def build_web_handler(
     db_path: Path,
     static_dir: Path,
@@ -15724,6 +16810,13 @@ def build_web_handler(
     static_root = static_dir.resolve()
     workspace_root = db_path.resolve().parent.parent
     web_config_path = config_path
+    # Only positive existence checks are cached; misses always hit SQLite so
+    # newly synced videos become visible immediately.
+    video_exists_cache: dict[tuple[str, str], float] = {}
+    video_exists_cache_lock = threading.Lock()
+    # The FTS table is never dropped once created, so only a positive probe is
+    # remembered; a missing table is re-checked until dict-index builds it.
+    dictionary_fts_known_available = threading.Event()
 
     class SubstudyWebHandler(BaseHTTPRequestHandler):
         server_version = "SubstudyWeb/0.1"
@@ -15734,15 +16827,38 @@ def build_web_handler(
             )
 
         def _open_connection(self) -> sqlite3.Connection:
-            connection = sqlite3.connect(str(db_path), timeout=30)
+            connection = sqlite3.connect(
+                str(db_path),
+                timeout=30,
+                cached_statements=WEB_SQLITE_CACHED_STATEMENTS,
+            )
             connection.row_factory = sqlite3.Row
             connection.execute("PRAGMA journal_mode=WAL")
+            # WAL keeps committed bookmark/note writes consistent without an
+            # fsync per commit; the WAL is synced at checkpoints.
+            connection.execute("PRAGMA synchronous=NORMAL")
             connection.execute("PRAGMA foreign_keys = ON")
+            # Serve read pages straight from the mapped file instead of copying them
+            # through SQLite's page cache; writers still go through the WAL.
+            connection.execute(f"PRAGMA mmap_size={WEB_SQLITE_MMAP_SIZE_BYTES}")
             return connection
 
-        def _request_content_type(self) -> str:
-            raw_value = self.headers.get("Content-Type", "")
-            return str(raw_value).split(";", 1)[0].strip().lower()
+        @contextmanager
+        def _write_transaction(self) -> Iterable[sqlite3.Connection]:
+            connection = self._open_connection()
+            try:
+                connection.execute("BEGIN IMMEDIATE")
+                yield connection
+                connection.commit()
+            except BaseException:
+                connection.rollback()
+                raise
+            finally:
+                connection.close()
+
+        def _request_content_type(self) -> str:
+            raw_value = self.headers.get("Content-Type", "")
+            return str(raw_value).split(";", 1)[0].strip().lower()
 
         def _is_json_content_type(self) -> bool:
             content_type = self._request_content_type()
@@ -15751,6 +16867,18 @@ def build_web_handler(
             return content_type.startswith("application/") and content_type.endswith("+json")
 
         def _read_json_body(self) -> dict[str, Any]:
+            parsed = self._read_json_value()
+            if not isinstance(parsed, dict):
+                raise ValueError("JSON body must be an object.")
+            return parsed
+
+        def _read_json_object_or_array(self) -> dict[str, Any] | list[Any]:
+            parsed = self._read_json_value()
+            if not isinstance(parsed, (dict, list)):
+                raise ValueError("JSON body must be an object or an array.")
+            return parsed
+
+        def _read_json_value(self) -> Any:
             raw_length = self.headers.get("Content-Length", "0")
             try:
                 content_length = int(raw_length)
@@ -15764,11 +16892,9 @@ def build_web_handler(
             if not raw_body:
                 return {}
             try:
-                parsed = json.loads(raw_body.decode("utf-8"))
+                parsed = decode_json_request_body(raw_body)
             except (UnicodeDecodeError, json.JSONDecodeError) as exc:
                 raise ValueError(f"Invalid JSON body: {exc}") from exc
-            if not isinstance(parsed, dict):
-                raise ValueError("JSON body must be an object.")
             return parsed
 
         def _handle_json_body_error(self, exc: ValueError) -> None:
@@ -15776,13 +16902,37 @@ def build_web_handler(
             self._send_error_json(status, str(exc))
 
         def _send_json(self, payload: Any, status: int = 200) -> None:
-            body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+            body = encode_json_response_body(payload)
             self.send_response(status)
             self.send_header("Content-Type", "application/json; charset=utf-8")
             self.send_header("Content-Length", str(len(body)))
             self.end_headers()
             self.wfile.write(body)
 
+        def _send_json_stream(self, payload: Any, status: int = 200) -> None:
+            # orjson already yields the final bytes in one C pass. Without it,
+            # stream the stdlib encoder in bounded chunks rather than holding
+            # the whole str plus its UTF-8 copy for large list responses.
+            if orjson is not None:
+                self._send_json(payload, status=status)
+                return
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Connection", "close")
+            self.end_headers()
+            self.close_connection = True
+            pending: list[str] = []
+            pending_chars = 0
+            for fragment in WEB_JSON_STREAM_ENCODER.iterencode(payload):
+                pending.append(fragment)
+                pending_chars += len(fragment)
+                if pending_chars >= WEB_JSON_STREAM_CHUNK_CHARS:
+                    self.wfile.write("".join(pending).encode("utf-8"))
+                    pending.clear()
+                    pending_chars = 0
+            if pending:
+                self.wfile.write("".join(pending).encode("utf-8"))
+
         def _send_error_json(self, status: int, message: str) -> None:
             self._send_json(
                 {
@@ -15860,7 +17010,7 @@ def build_web_handler(
 
             range_header = self.headers.get("Range", "").strip()
             if range_header:
-                match = re.fullmatch(r"bytes=(\d*)-(\d*)", range_header)
+                match = RE_WEB_BYTE_RANGE.fullmatch(range_header)
                 if not match:
                     self.send_response(416)
                     self.send_header("Content-Range", f"bytes */{file_size}")
@@ -16006,7 +17156,13 @@ def build_web_handler(
             normalized = str(source_id).strip()
             if not normalized:
                 return None
-            return normalized
+            return sys.intern(normalized)
+
+        def _normalize_interned_label(self, raw_value: Any) -> str:
+            # Low-cardinality labels repeat across requests; share one str object.
+            if raw_value in (None, ""):
+                return ""
+            return sys.intern(str(raw_value).strip())
 
         def _handle_api_source_targets_get(self) -> None:
             try:
@@ -16185,73 +17341,10 @@ def build_web_handler(
             bookmark_id: int,
         ) -> sqlite3.Row | None:
             return connection.execute(
-                """
-                SELECT
-                    id,
-                    source_id,
-                    video_id,
-                    track,
-                    start_ms,
-                    end_ms,
-                    text,
-                    note,
-                    created_at
-                FROM subtitle_bookmarks
-                WHERE id = ?
-                """,
+                SQL_SELECT_SUBTITLE_BOOKMARK_BY_ID,
                 (bookmark_id,),
             ).fetchone()
 
-        def _fetch_dictionary_bookmark_by_composite(
-            self,
-            connection: sqlite3.Connection,
-            source_id: str,
-            video_id: str,
-            track: str,
-            cue_start_ms: int,
-            cue_end_ms: int,
-            dict_entry_id: int,
-        ) -> sqlite3.Row | None:
-            return connection.execute(
-                """
-                SELECT
-                    id,
-                    source_id,
-                    video_id,
-                    track,
-                    cue_start_ms,
-                    cue_end_ms,
-                    cue_text,
-                    dict_entry_id,
-                    dict_source_name,
-                    lookup_term,
-                    term,
-                    term_norm,
-                    definition,
-                    missing_entry,
-                    lookup_path_json,
-                    lookup_path_label,
-                    created_at,
-                    updated_at
-                FROM dictionary_bookmarks
-                WHERE source_id = ?
-                  AND video_id = ?
-                  AND track = ?
-                  AND cue_start_ms = ?
-                  AND cue_end_ms = ?
-                  AND dict_entry_id = ?
-                LIMIT 1
-                """,
-                (
-                    source_id,
-                    video_id,
-                    track,
-                    cue_start_ms,
-                    cue_end_ms,
-                    dict_entry_id,
-                ),
-            ).fetchone()
-
         def _handle_api_feed(self, query: dict[str, list[str]]) -> None:
             def normalize_translation_filter_value(raw_value: Any) -> str:
                 normalized_value = str(raw_value or "all").strip().lower()
@@ -16668,7 +17761,7 @@ def build_web_handler(
                     if len(rows) < raw_batch_size:
                         break
 
-            self._send_json(
+            self._send_json_stream(
                 {
                     "videos": videos,
                     "count": len(videos),
@@ -16706,7 +17799,7 @@ def build_web_handler(
 
                 track_path = Path(track["path"])
                 cues = parse_subtitle_cues(track_path)
-                self._send_json(
+                self._send_json_stream(
                     {
                         "source_id": source_id,
                         "video_id": video_id,
@@ -16742,6 +17835,7 @@ def build_web_handler(
                     limit=limit,
                     exact_only=exact_only,
                     fts_mode=fts_mode,
+                    fts_available=self._dictionary_fts_available(connection),
                 )
             self._send_json(payload)
 
@@ -16775,19 +17869,16 @@ def build_web_handler(
             exact_only = parse_bool_flag(query.get("exact_only", [None])[0], default=False)
             fts_mode = str(query.get("fts_mode", ["all"])[0] or "all")
 
-            items: list[dict[str, Any]] = []
             with self._open_connection() as connection:
-                for term in cleaned_terms:
-                    items.append(
-                        lookup_dictionary_entries(
-                            connection,
-                            term,
-                            limit=limit,
-                            exact_only=exact_only,
-                            fts_mode=fts_mode,
-                        )
-                    )
-            self._send_json({"items": items})
+                items = lookup_dictionary_entries_batch(
+                    connection,
+                    cleaned_terms,
+                    limit=limit,
+                    exact_only=exact_only,
+                    fts_mode=fts_mode,
+                    fts_available=self._dictionary_fts_available(connection),
+                )
+            self._send_json_stream({"items": items})
 
         def _handle_api_bookmarks_get(self, query: dict[str, list[str]]) -> None:
             source_id = self._normalize_source(query.get("source_id", [None])[0])
@@ -16822,7 +17913,7 @@ def build_web_handler(
                     (source_id, video_id, limit),
                 ).fetchall()
             bookmarks = [serialize_bookmark_row(row) for row in rows]
-            self._send_json(
+            self._send_json_stream(
                 {
                     "source_id": source_id,
                     "video_id": video_id,
@@ -16885,7 +17976,7 @@ def build_web_handler(
                     tuple(params),
                 ).fetchall()
             bookmarks = [serialize_dictionary_bookmark_row(row) for row in rows]
-            self._send_json(
+            self._send_json_stream(
                 {
                     "source_id": source_id,
                     "video_id": video_id,
@@ -17037,7 +18128,7 @@ def build_web_handler(
                 root_dir=workspace_root,
                 limit=artifact_limit,
             )
-            self._send_json(
+            self._send_json_stream(
                 {
                     "source_id": source_filter or "",
                     "review_cards": review_cards,
@@ -17057,40 +18148,49 @@ def build_web_handler(
                 self._handle_json_body_error(exc)
                 return
 
-            source_id = self._normalize_source(payload.get("source_id"))
-            video_id = self._normalize_source(payload.get("video_id"))
-            track = self._normalize_source(payload.get("track")) or ""
-            cue_text = "" if payload.get("cue_text") in (None, "") else str(payload.get("cue_text"))
-            lookup_term = "" if payload.get("lookup_term") in (None, "") else str(payload.get("lookup_term"))
-            term = "" if payload.get("term") in (None, "") else str(payload.get("term")).strip()
-            term_norm_value = "" if payload.get("term_norm") in (None, "") else str(payload.get("term_norm"))
+            # This runs on every dictionary click; bind hot lookups once.
+            get = payload.get
+            send_error = self._send_error_json
+            normalize_source = self._normalize_source
+            normalize_label = self._normalize_interned_label
+
+            source_id = normalize_source(get("source_id"))
+            video_id = normalize_source(get("video_id"))
+            track = normalize_source(get("track")) or ""
+            cue_text_raw = get("cue_text")
+            cue_text = "" if cue_text_raw in (None, "") else str(cue_text_raw)
+            lookup_term_raw = get("lookup_term")
+            lookup_term = "" if lookup_term_raw in (None, "") else str(lookup_term_raw)
+            term_raw = get("term")
+            term = "" if term_raw in (None, "") else str(term_raw).strip()
+            term_norm_raw = get("term_norm")
+            term_norm_value = "" if term_norm_raw in (None, "") else str(term_norm_raw)
             term_norm = normalize_dictionary_term(term_norm_value or term)
-            definition = "" if payload.get("definition") in (None, "") else str(payload.get("definition")).strip()
-            dict_source_name = (
-                "" if payload.get("dict_source_name") in (None, "") else str(payload.get("dict_source_name")).strip()
-            )
-            lookup_path = normalize_dictionary_lookup_path(payload.get("lookup_path"))
-            lookup_path_label = (
-                "" if payload.get("lookup_path_label") in (None, "") else str(payload.get("lookup_path_label")).strip()
-            )
-            missing_entry_raw = payload.get("missing_entry")
-            if isinstance(missing_entry_raw, str):
-                missing_entry = missing_entry_raw.strip().lower() in {"1", "true", "yes", "on"}
+            definition_raw = get("definition")
+            definition = "" if definition_raw in (None, "") else str(definition_raw).strip()
+            dict_source_name = normalize_label(get("dict_source_name"))
+            lookup_path = normalize_dictionary_lookup_path(get("lookup_path"))
+            lookup_path_label = normalize_label(get("lookup_path_label"))
+            missing_entry_raw = get("missing_entry")
+            if missing_entry_raw is None or isinstance(missing_entry_raw, bool):
+                missing_entry = missing_entry_raw is True
+            elif isinstance(missing_entry_raw, str):
+                missing_entry = missing_entry_raw.strip().lower() in TRUTHY_TEXT_VALUES
             else:
                 missing_entry = bool(missing_entry_raw)
 
             if source_id is None or video_id is None:
-                self._send_error_json(400, "source_id and video_id are required.")
+                send_error(400, "source_id and video_id are required.")
                 return
             if not self._is_source_allowed(source_id):
-                self._send_error_json(403, "Source is not allowed.")
+                send_error(403, "Source is not allowed.")
                 return
 
             if not term:
-                self._send_error_json(400, "term is required.")
+                send_error(400, "term is required.")
                 return
             if not term_norm:
-                self._send_error_json(400, "term_norm is required.")
+                send_error(400, "term_norm is required.")
                 return
             if missing_entry:
                 if not definition:
@@ -17098,28 +18198,25 @@ def build_web_handler(
                 if not lookup_term:
                     lookup_term = term
             if not definition:
-                self._send_error_json(400, "definition is required.")
+                send_error(400, "definition is required.")
                 return
 
             try:
-                cue_start_ms = int(payload.get("cue_start_ms"))
-                cue_end_ms = int(payload.get("cue_end_ms"))
+                cue_start_ms = int(get("cue_start_ms"))
+                cue_end_ms = int(get("cue_end_ms"))
             except (TypeError, ValueError):
-                self._send_error_json(
-                    400,
-                    "cue_start_ms and cue_end_ms must be integers.",
-                )
+                send_error(400, "cue_start_ms and cue_end_ms must be integers.")
                 return
             if missing_entry:
                 dict_entry_id = make_missing_dict_entry_id(term_norm)
             else:
                 try:
-                    dict_entry_id = int(payload.get("dict_entry_id"))
+                    dict_entry_id = int(get("dict_entry_id"))
                 except (TypeError, ValueError):
-                    self._send_error_json(400, "dict_entry_id must be an integer.")
+                    send_error(400, "dict_entry_id must be an integer.")
                     return
                 if dict_entry_id <= 0:
-                    self._send_error_json(400, "dict_entry_id must be a positive integer.")
+                    send_error(400, "dict_entry_id must be a positive integer.")
                     return
             if cue_end_ms < cue_start_ms:
                 cue_start_ms, cue_end_ms = cue_end_ms, cue_start_ms
@@ -17141,128 +18238,79 @@ def build_web_handler(
                 lookup_path_label = build_dictionary_lookup_path_label(lookup_path)
             lookup_path_json = ""
             if lookup_path:
-                lookup_path_json = json.dumps(
-                    lookup_path,
-                    ensure_ascii=False,
-                    separators=(",", ":"),
-                )
-
-            with self._open_connection() as connection:
-                if not self._validate_video_exists(connection, source_id, video_id):
-                    self._send_error_json(404, "Video not found.")
-                    return
-                if track:
-                    valid_track = get_track_for_video(connection, source_id, video_id, track)
-                    if valid_track is None:
-                        self._send_error_json(400, "track is invalid for this video.")
-                        return
+                lookup_path_json = json_dumps_compact(lookup_path)
 
-                existing = self._fetch_dictionary_bookmark_by_composite(
+            with self._write_transaction() as connection:
+                video_exists, track_valid = self._validate_video_and_track(
                     connection,
                     source_id,
                     video_id,
                     track,
-                    cue_start_ms,
-                    cue_end_ms,
-                    dict_entry_id,
                 )
-                if existing is None:
-                    now_iso = now_utc_iso()
-                    cursor = connection.execute(
-                        """
-                        INSERT INTO dictionary_bookmarks (
-                            source_id,
-                            video_id,
-                            track,
-                            cue_start_ms,
-                            cue_end_ms,
-                            cue_text,
-                            dict_entry_id,
-                            dict_source_name,
-                            lookup_term,
-                            term,
-                            term_norm,
-                            definition,
-                            missing_entry,
-                            lookup_path_json,
-                            lookup_path_label,
-                            created_at,
-                            updated_at
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        """,
+                if not video_exists:
+                    send_error(404, "Video not found.")
+                    return
+                if not track_valid:
+                    send_error(400, "track is invalid for this video.")
+                    return
+
+                now_iso = now_utc_iso()
+                bookmark = connection.execute(
+                    SQL_INSERT_DICTIONARY_BOOKMARK_RETURNING,
+                    (
+                        source_id,
+                        video_id,
+                        track,
+                        cue_start_ms,
+                        cue_end_ms,
+                        cue_text,
+                        dict_entry_id,
+                        dict_source_name,
+                        lookup_term,
+                        term,
+                        term_norm,
+                        definition,
+                        int(missing_entry),
+                        lookup_path_json,
+                        lookup_path_label,
+                        now_iso,
+                        now_iso,
+                    ),
+                ).fetchone()
+                if bookmark is not None:
+                    response_payload = {
+                        "status": "saved",
+                        "bookmark": serialize_dictionary_bookmark_row(bookmark),
+                    }
+                else:
+                    # The composite key already exists, so this toggle removes it.
+                    existing = connection.execute(
+                        SQL_DELETE_DICTIONARY_BOOKMARK_RETURNING,
                         (
                             source_id,
                             video_id,
                             track,
                             cue_start_ms,
                             cue_end_ms,
-                            cue_text,
                             dict_entry_id,
-                            dict_source_name,
-                            lookup_term,
-                            term,
-                            term_norm,
-                            definition,
-                            int(missing_entry),
-                            lookup_path_json,
-                            lookup_path_label,
-                            now_iso,
-                            now_iso,
                         ),
-                    )
-                    bookmark_id = cursor.lastrowid
-                    if bookmark_id is None:
-                        self._send_error_json(500, "Failed to create dictionary bookmark.")
-                        return
-                    connection.commit()
-                    bookmark = connection.execute(
-                        """
-                        SELECT
-                            id,
-                            source_id,
-                            video_id,
-                            track,
-                            cue_start_ms,
-                            cue_end_ms,
-                            cue_text,
-                            dict_entry_id,
-                            dict_source_name,
-                            lookup_term,
-                            term,
-                            term_norm,
-                            definition,
-                            missing_entry,
-                            lookup_path_json,
-                            lookup_path_label,
-                            created_at,
-                            updated_at
-                        FROM dictionary_bookmarks
-                        WHERE id = ?
-                        """,
-                        (int(bookmark_id),),
                     ).fetchone()
-                    if bookmark is None:
-                        self._send_error_json(500, "Failed to read dictionary bookmark.")
+                    if existing is None:
+                        send_error(500, "Failed to toggle dictionary bookmark.")
                         return
-                    self._send_json(
-                        {
-                            "status": "saved",
-                            "bookmark": serialize_dictionary_bookmark_row(bookmark),
-                        }
-                    )
-                    return
-
-                connection.execute(
-                    "DELETE FROM dictionary_bookmarks WHERE id = ?",
-                    (int(existing["id"]),),
-                )
-                connection.commit()
-                self._send_json(
-                    {
+                    response_payload = {
                         "status": "removed",
                         "bookmark": serialize_dictionary_bookmark_row(existing),
                     }
-                )
+            self._send_json(response_payload)
+
+        def _dictionary_fts_available(self, connection: sqlite3.Connection) -> bool:
+            if dictionary_fts_known_available.is_set():
+                return True
+            available = dictionary_fts_available(connection)
+            if available:
+                dictionary_fts_known_available.set()
+            return available
 
         def _validate_video_exists(
             self,
@@ -17270,17 +18318,36 @@ def build_web_handler(
             source_id: str,
             video_id: str,
         ) -> bool:
+            cache_key = (source_id, video_id)
+            now_monotonic = time.monotonic()
+            with video_exists_cache_lock:
+                expires_at = video_exists_cache.get(cache_key)
+                if expires_at is not None:
+                    if expires_at > now_monotonic:
+                        return True
+                    video_exists_cache.pop(cache_key, None)
             row = connection.execute(
-                """
-                SELECT 1
-                FROM videos
-                WHERE source_id = ?
-                  AND video_id = ?
-                LIMIT 1
-                """,
+                SQL_SELECT_VIDEO_EXISTS,
                 (source_id, video_id),
             ).fetchone()
-            return row is not None
+            if row is None:
+                return False
+            with video_exists_cache_lock:
+                if len(video_exists_cache) >= WEB_VIDEO_EXISTS_CACHE_MAX_ENTRIES:
+                    video_exists_cache.clear()
+                video_exists_cache[cache_key] = now_monotonic + WEB_VIDEO_EXISTS_CACHE_TTL_SEC
+            return True
+
+        def _validate_video_and_track(
+            self,
+            connection: sqlite3.Connection,
+            source_id: str,
+            video_id: str,
+            track: str | None,
+        ) -> tuple[bool, bool]:
+            if not track:
+                return self._validate_video_exists(connection, source_id, video_id), True
+            return probe_video_track(connection, source_id, video_id, track)
 
         def _fetch_video_preference_state(
             self,
@@ -17288,57 +18355,44 @@ def build_web_handler(
             source_id: str,
             video_id: str,
         ) -> dict[str, Any]:
-            favorite_row = connection.execute(
-                """
-                SELECT created_at
-                FROM video_favorites
-                WHERE source_id = ?
-                  AND video_id = ?
-                LIMIT 1
-                """,
-                (source_id, video_id),
-            ).fetchone()
-            dislike_row = connection.execute(
-                """
-                SELECT created_at
-                FROM video_dislikes
-                WHERE source_id = ?
-                  AND video_id = ?
-                LIMIT 1
-                """,
-                (source_id, video_id),
-            ).fetchone()
-            not_interested_row = connection.execute(
+            row = connection.execute(
                 """
-                SELECT created_at
-                FROM video_not_interested
-                WHERE source_id = ?
-                  AND video_id = ?
-                LIMIT 1
+                SELECT
+                    (
+                        SELECT created_at
+                        FROM video_favorites
+                        WHERE source_id = ?1
+                          AND video_id = ?2
+                        LIMIT 1
+                    ) AS favorite_created_at,
+                    (
+                        SELECT created_at
+                        FROM video_dislikes
+                        WHERE source_id = ?1
+                          AND video_id = ?2
+                        LIMIT 1
+                    ) AS disliked_created_at,
+                    (
+                        SELECT created_at
+                        FROM video_not_interested
+                        WHERE source_id = ?1
+                          AND video_id = ?2
+                        LIMIT 1
+                    ) AS not_interested_created_at
                 """,
                 (source_id, video_id),
             ).fetchone()
+            favorite_created_at = row["favorite_created_at"]
+            disliked_created_at = row["disliked_created_at"]
+            not_interested_created_at = row["not_interested_created_at"]
             return {
-                "is_favorite": favorite_row is not None,
-                "favorite_created_at": (
-                    ""
-                    if favorite_row is None or favorite_row["created_at"] in (None, "")
-                    else str(favorite_row["created_at"])
-                ),
-                "is_disliked": dislike_row is not None,
-                "disliked_created_at": (
-                    ""
-                    if dislike_row is None or dislike_row["created_at"] in (None, "")
-                    else str(dislike_row["created_at"])
-                ),
-                "is_not_interested": not_interested_row is not None,
+                "is_favorite": favorite_created_at is not None,
+                "favorite_created_at": "" if favorite_created_at in (None, "") else str(favorite_created_at),
+                "is_disliked": disliked_created_at is not None,
+                "disliked_created_at": "" if disliked_created_at in (None, "") else str(disliked_created_at),
+                "is_not_interested": not_interested_created_at is not None,
                 "not_interested_created_at": (
-                    ""
-                    if (
-                        not_interested_row is None
-                        or not_interested_row["created_at"] in (None, "")
-                    )
-                    else str(not_interested_row["created_at"])
+                    "" if not_interested_created_at in (None, "") else str(not_interested_created_at)
                 ),
             }
 
@@ -17668,59 +18722,39 @@ def build_web_handler(
             selected_table: str,
             cleared_tables: Iterable[str] = (),
         ) -> tuple[bool, set[str]]:
-            existing = connection.execute(
+            removed_rows = connection.execute(
                 f"""
-                SELECT 1
-                FROM {selected_table}
+                DELETE FROM {selected_table}
                 WHERE source_id = ?
                   AND video_id = ?
-                LIMIT 1
+                RETURNING 1
                 """,
                 (source_id, video_id),
-            ).fetchone()
-            if existing is None:
-                connection.execute(
-                    f"""
-                    INSERT INTO {selected_table}(source_id, video_id, created_at)
-                    VALUES (?, ?, ?)
-                    """,
-                    (source_id, video_id, now_utc_iso()),
-                )
-                cleared_other_tables: set[str] = set()
-                for cleared_table in cleared_tables:
-                    other_existing = connection.execute(
-                        f"""
-                        SELECT 1
-                        FROM {cleared_table}
-                        WHERE source_id = ?
-                          AND video_id = ?
-                        LIMIT 1
-                        """,
-                        (source_id, video_id),
-                    ).fetchone()
-                    if other_existing is None:
-                        continue
-                    cleared_other_tables.add(str(cleared_table))
-                    if other_existing is not None:
-                        connection.execute(
-                            f"""
-                            DELETE FROM {cleared_table}
-                            WHERE source_id = ?
-                              AND video_id = ?
-                            """,
-                            (source_id, video_id),
-                        )
-                return True, cleared_other_tables
+            ).fetchall()
+            if removed_rows:
+                return False, set()
 
             connection.execute(
                 f"""
-                DELETE FROM {selected_table}
-                WHERE source_id = ?
-                  AND video_id = ?
+                INSERT INTO {selected_table}(source_id, video_id, created_at)
+                VALUES (?, ?, ?)
                 """,
-                (source_id, video_id),
+                (source_id, video_id, now_utc_iso()),
             )
-            return False, set()
+            cleared_other_tables: set[str] = set()
+            for cleared_table in cleared_tables:
+                cleared_rows = connection.execute(
+                    f"""
+                    DELETE FROM {cleared_table}
+                    WHERE source_id = ?
+                      AND video_id = ?
+                    RETURNING 1
+                    """,
+                    (source_id, video_id),
+                ).fetchall()
+                if cleared_rows:
+                    cleared_other_tables.add(str(cleared_table))
+            return True, cleared_other_tables
 
         def _handle_api_toggle_favorite(self) -> None:
             try:
@@ -17737,7 +18771,7 @@ def build_web_handler(
                 self._send_error_json(403, "Source is not allowed.")
                 return
 
-            with self._open_connection() as connection:
+            with self._write_transaction() as connection:
                 if not self._validate_video_exists(connection, source_id, video_id):
                     self._send_error_json(404, "Video not found.")
                     return
@@ -17750,7 +18784,6 @@ def build_web_handler(
                     cleared_tables=("video_dislikes", "video_not_interested"),
                 )
                 state_payload = self._fetch_video_preference_state(connection, source_id, video_id)
-                connection.commit()
 
             self._send_json(
                 {
@@ -17782,7 +18815,7 @@ def build_web_handler(
                 self._send_error_json(403, "Source is not allowed.")
                 return
 
-            with self._open_connection() as connection:
+            with self._write_transaction() as connection:
                 if not self._validate_video_exists(connection, source_id, video_id):
                     self._send_error_json(404, "Video not found.")
                     return
@@ -17795,7 +18828,6 @@ def build_web_handler(
                     cleared_tables=("video_favorites", "video_not_interested"),
                 )
                 state_payload = self._fetch_video_preference_state(connection, source_id, video_id)
-                connection.commit()
 
             self._send_json(
                 {
@@ -17827,7 +18859,7 @@ def build_web_handler(
                 self._send_error_json(403, "Source is not allowed.")
                 return
 
-            with self._open_connection() as connection:
+            with self._write_transaction() as connection:
                 if not self._validate_video_exists(connection, source_id, video_id):
                     self._send_error_json(404, "Video not found.")
                     return
@@ -17840,7 +18872,6 @@ def build_web_handler(
                     cleared_tables=("video_favorites", "video_dislikes"),
                 )
                 state_payload = self._fetch_video_preference_state(connection, source_id, video_id)
-                connection.commit()
 
             self._send_json(
                 {
@@ -17942,48 +18973,24 @@ def build_web_handler(
                 self._send_error_json(403, "Source is not allowed.")
                 return
 
-            with self._open_connection() as connection:
+            with self._write_transaction() as connection:
                 if not self._validate_video_exists(connection, source_id, video_id):
                     self._send_error_json(404, "Video not found.")
                     return
 
                 now_iso = now_utc_iso()
                 if note.strip():
-                    connection.execute(
-                        """
-                        INSERT INTO video_notes (
-                            source_id,
-                            video_id,
-                            note,
-                            created_at,
-                            updated_at
-                        ) VALUES (?, ?, ?, ?, ?)
-                        ON CONFLICT(source_id, video_id) DO UPDATE SET
-                            note = excluded.note,
-                            updated_at = excluded.updated_at
-                        """,
+                    row = connection.execute(
+                        SQL_UPSERT_VIDEO_NOTE_RETURNING,
                         (source_id, video_id, note, now_iso, now_iso),
-                    )
+                    ).fetchone()
                 else:
+                    # A cleared note has no row left to read back.
                     connection.execute(
-                        """
-                        DELETE FROM video_notes
-                        WHERE source_id = ?
-                          AND video_id = ?
-                        """,
+                        SQL_DELETE_VIDEO_NOTE,
                         (source_id, video_id),
                     )
-                connection.commit()
-
-                row = connection.execute(
-                    """
-                    SELECT note, created_at, updated_at
-                    FROM video_notes
-                    WHERE source_id = ?
-                      AND video_id = ?
-                    """,
-                    (source_id, video_id),
-                ).fetchone()
+                    row = None
             self._send_json(
                 {
                     "source_id": source_id,
@@ -17994,12 +19001,12 @@ def build_web_handler(
                 }
             )
 
-        def _handle_api_create_bookmark(self) -> None:
-            try:
-                payload = self._read_json_body()
-            except ValueError as exc:
-                self._handle_json_body_error(exc)
-                return
+        def _parse_bookmark_create_row(
+            self,
+            payload: Any,
+        ) -> tuple[tuple[Any, ...] | None, int, str]:
+            if not isinstance(payload, dict):
+                return None, 400, "bookmark must be a JSON object."
             source_id = self._normalize_source(payload.get("source_id"))
             video_id = self._normalize_source(payload.get("video_id"))
             track = self._normalize_source(payload.get("track"))
@@ -18007,62 +19014,58 @@ def build_web_handler(
             note_value = "" if payload.get("note") in (None, "") else str(payload.get("note"))
 
             if source_id is None or video_id is None:
-                self._send_error_json(400, "source_id and video_id are required.")
-                return
+                return None, 400, "source_id and video_id are required."
             if not self._is_source_allowed(source_id):
-                self._send_error_json(403, "Source is not allowed.")
-                return
+                return None, 403, "Source is not allowed."
             try:
                 start_ms = int(payload.get("start_ms"))
                 end_ms = int(payload.get("end_ms"))
             except (TypeError, ValueError):
-                self._send_error_json(400, "start_ms and end_ms must be integers.")
-                return
+                return None, 400, "start_ms and end_ms must be integers."
             if end_ms < start_ms:
                 start_ms, end_ms = end_ms, start_ms
             start_ms = max(0, start_ms)
             end_ms = max(start_ms, end_ms)
+            return (source_id, video_id, track, start_ms, end_ms, text_value, note_value), 200, ""
 
-            with self._open_connection() as connection:
-                if not self._validate_video_exists(connection, source_id, video_id):
+        def _handle_api_create_bookmark(self) -> None:
+            try:
+                payload = self._read_json_object_or_array()
+            except ValueError as exc:
+                self._handle_json_body_error(exc)
+                return
+            if isinstance(payload, list):
+                self._handle_api_create_bookmarks_batch(payload)
+                return
+            row_values, error_status, error_message = self._parse_bookmark_create_row(payload)
+            if row_values is None:
+                self._send_error_json(error_status, error_message)
+                return
+            source_id, video_id, track = row_values[:3]
+
+            with self._write_transaction() as connection:
+                video_exists, track_valid = self._validate_video_and_track(
+                    connection,
+                    source_id,
+                    video_id,
+                    track,
+                )
+                if not video_exists:
                     self._send_error_json(404, "Video not found.")
                     return
-                if track:
-                    valid_track = get_track_for_video(connection, source_id, video_id, track)
-                    if valid_track is None:
-                        self._send_error_json(400, "track is invalid for this video.")
-                        return
+                if not track_valid:
+                    self._send_error_json(400, "track is invalid for this video.")
+                    return
 
                 created_at = now_utc_iso()
                 cursor = connection.execute(
-                    """
-                    INSERT INTO subtitle_bookmarks (
-                        source_id,
-                        video_id,
-                        track,
-                        start_ms,
-                        end_ms,
-                        text,
-                        note,
-                        created_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        source_id,
-                        video_id,
-                        track,
-                        start_ms,
-                        end_ms,
-                        text_value,
-                        note_value,
-                        created_at,
-                    ),
+                    SQL_INSERT_SUBTITLE_BOOKMARK,
+                    (*row_values, created_at),
                 )
                 bookmark_id = cursor.lastrowid
                 if bookmark_id is None:
                     self._send_error_json(500, "Failed to create bookmark.")
                     return
-                connection.commit()
                 row = self._fetch_bookmark_by_id(connection, int(bookmark_id))
             if row is None:
                 self._send_error_json(500, "Failed to read created bookmark.")
@@ -18074,6 +19077,70 @@ def build_web_handler(
                 status=201,
             )
 
+        def _handle_api_create_bookmarks_batch(self, payload: list[Any]) -> None:
+            if not payload:
+                self._send_error_json(400, "bookmarks array must not be empty.")
+                return
+            if len(payload) > WEB_BOOKMARK_BATCH_MAX_ROWS:
+                self._send_error_json(
+                    400,
+                    f"bookmarks array must contain at most {WEB_BOOKMARK_BATCH_MAX_ROWS} items.",
+                )
+                return
+            rows: list[tuple[Any, ...]] = []
+            for index, item in enumerate(payload):
+                row_values, error_status, error_message = self._parse_bookmark_create_row(item)
+                if row_values is None:
+                    self._send_error_json(error_status, f"bookmarks[{index}]: {error_message}")
+                    return
+                rows.append(row_values)
+
+            with self._write_transaction() as connection:
+                checked_videos: set[tuple[str, str]] = set()
+                checked_tracks: set[tuple[str, str, str]] = set()
+                for index, row_values in enumerate(rows):
+                    source_id, video_id, track = row_values[:3]
+                    if (source_id, video_id) in checked_videos and (
+                        not track or (source_id, video_id, track) in checked_tracks
+                    ):
+                        continue
+                    video_exists, track_valid = self._validate_video_and_track(
+                        connection,
+                        source_id,
+                        video_id,
+                        track,
+                    )
+                    if not video_exists:
+                        self._send_error_json(404, f"bookmarks[{index}]: Video not found.")
+                        return
+                    if not track_valid:
+                        self._send_error_json(400, f"bookmarks[{index}]: track is invalid for this video.")
+                        return
+                    checked_videos.add((source_id, video_id))
+                    if track:
+                        checked_tracks.add((source_id, video_id, track))
+
+                created_at = now_utc_iso()
+                # BEGIN IMMEDIATE holds the write lock, so every id above the
+                # previous maximum belongs to this batch.
+                previous_max_id = int(
+                    connection.execute("SELECT COALESCE(MAX(id), 0) FROM subtitle_bookmarks").fetchone()[0]
+                )
+                connection.executemany(
+                    SQL_INSERT_SUBTITLE_BOOKMARK,
+                    [(*row_values, created_at) for row_values in rows],
+                )
+                created_rows = connection.execute(
+                    SQL_SELECT_SUBTITLE_BOOKMARKS_AFTER_ID,
+                    (previous_max_id,),
+                ).fetchall()
+            self._send_json(
+                {
+                    "bookmarks": [serialize_bookmark_row(row) for row in created_rows],
+                },
+                status=201,
+            )
+
         def _handle_api_update_bookmark_note(self, bookmark_id: int) -> None:
             try:
                 payload = self._read_json_body()
@@ -18132,56 +19199,56 @@ def build_web_handler(
                 }
             )
 
+        _GET_ROUTES: dict[str, Callable[[Any, dict[str, list[str]]], None]] = {
+            "/": lambda handler, query: handler._serve_static_file("index.html"),
+            "/index.html": lambda handler, query: handler._serve_static_file("index.html"),
+            "/app.js": lambda handler, query: handler._serve_static_file("app.js"),
+            "/styles.css": lambda handler, query: handler._serve_static_file("styles.css"),
+            "/api/source-targets": lambda handler, query: handler._handle_api_source_targets_get(),
+            "/api/feed": _handle_api_feed,
+            "/api/subtitles": _handle_api_subtitles,
+            "/api/dictionary": _handle_api_dictionary_lookup,
+            "/api/dictionary/batch": _handle_api_dictionary_lookup_batch,
+            "/api/bookmarks": _handle_api_bookmarks_get,
+            "/api/dictionary-bookmarks": _handle_api_dictionary_bookmarks_get,
+            "/api/workspace": _handle_api_workspace,
+        }
+        _GET_PREFIX_ROUTES: tuple[tuple[str, Callable[[Any, str, dict[str, list[str]]], None]], ...] = (
+            ("/vendor/", lambda handler, path, query: handler._serve_static_file(path.lstrip("/"))),
+            ("/media/", lambda handler, path, query: handler._serve_media_file(path[len("/media/") :])),
+            (
+                "/artifact/",
+                lambda handler, path, query: handler._serve_workspace_artifact_file(
+                    path[len("/artifact/") :],
+                    force_download=parse_bool_flag(query.get("download", [None])[0], default=False),
+                ),
+            ),
+        )
+        _POST_ROUTES: dict[str, Callable[[Any], None]] = {
+            "/api/favorites/toggle": _handle_api_toggle_favorite,
+            "/api/dislikes/toggle": _handle_api_toggle_dislike,
+            "/api/not-interested/toggle": _handle_api_toggle_not_interested,
+            "/api/playback-stats/record": _handle_api_record_playback_stats,
+            "/api/video-note": _handle_api_upsert_video_note,
+            "/api/bookmarks": _handle_api_create_bookmark,
+            "/api/dictionary-bookmarks/toggle": _handle_api_toggle_dictionary_bookmark,
+            "/api/source-targets/upsert": _handle_api_source_targets_upsert,
+            "/api/source-targets/remove": _handle_api_source_targets_remove,
+        }
+
         def do_GET(self) -> None:  # noqa: N802
             parsed = urlparse(self.path)
             path = parsed.path
             query = parse_qs(parsed.query)
             try:
-                if path in ("/", "/index.html"):
-                    self._serve_static_file("index.html")
-                    return
-                if path == "/app.js":
-                    self._serve_static_file("app.js")
-                    return
-                if path == "/styles.css":
-                    self._serve_static_file("styles.css")
-                    return
-                if path.startswith("/vendor/"):
-                    self._serve_static_file(path.lstrip("/"))
-                    return
-                if path.startswith("/media/"):
-                    token = path[len("/media/") :]
-                    self._serve_media_file(token)
-                    return
-                if path.startswith("/artifact/"):
-                    token = path[len("/artifact/") :]
-                    force_download = parse_bool_flag(query.get("download", [None])[0], default=False)
-                    self._serve_workspace_artifact_file(token, force_download=force_download)
-                    return
-                if path == "/api/source-targets":
-                    self._handle_api_source_targets_get()
-                    return
-                if path == "/api/feed":
-                    self._handle_api_feed(query)
-                    return
-                if path == "/api/subtitles":
-                    self._handle_api_subtitles(query)
-                    return
-                if path == "/api/dictionary":
-                    self._handle_api_dictionary_lookup(query)
-                    return
-                if path == "/api/dictionary/batch":
-                    self._handle_api_dictionary_lookup_batch(query)
-                    return
-                if path == "/api/bookmarks":
-                    self._handle_api_bookmarks_get(query)
-                    return
-                if path == "/api/dictionary-bookmarks":
-                    self._handle_api_dictionary_bookmarks_get(query)
-                    return
-                if path == "/api/workspace":
-                    self._handle_api_workspace(query)
+                route = self._GET_ROUTES.get(path)
+                if route is not None:
+                    route(self, query)
                     return
+                for prefix, prefix_route in self._GET_PREFIX_ROUTES:
+                    if path.startswith(prefix):
+                        prefix_route(self, path, query)
+                        return
                 self._send_error_json(404, "Not found.")
             except BrokenPipeError:
                 return
@@ -18192,34 +19259,11 @@ def build_web_handler(
             parsed = urlparse(self.path)
             path = parsed.path
             try:
-                if path == "/api/favorites/toggle":
-                    self._handle_api_toggle_favorite()
+                route = self._POST_ROUTES.get(path)
+                if route is not None:
+                    route(self)
                     return
-                if path == "/api/dislikes/toggle":
-                    self._handle_api_toggle_dislike()
-                    return
-                if path == "/api/not-interested/toggle":
-                    self._handle_api_toggle_not_interested()
-                    return
-                if path == "/api/playback-stats/record":
-                    self._handle_api_record_playback_stats()
-                    return
-                if path == "/api/video-note":
-                    self._handle_api_upsert_video_note()
-                    return
-                if path == "/api/bookmarks":
-                    self._handle_api_create_bookmark()
-                    return
-                if path == "/api/dictionary-bookmarks/toggle":
-                    self._handle_api_toggle_dictionary_bookmark()
-                    return
-                if path == "/api/source-targets/upsert":
-                    self._handle_api_source_targets_upsert()
-                    return
-                if path == "/api/source-targets/remove":
-                    self._handle_api_source_targets_remove()
-                    return
-                note_match = re.fullmatch(r"/api/bookmarks/(\d+)/note", path)
+                note_match = RE_WEB_BOOKMARK_NOTE_PATH.fullmatch(path)
                 if note_match:
                     self._handle_api_update_bookmark_note(int(note_match.group(1)))
                     return
@@ -18233,7 +19277,7 @@ def build_web_handler(
             parsed = urlparse(self.path)
             path = parsed.path
             try:
-                match = re.fullmatch(r"/api/bookmarks/(\d+)", path)
+                match = RE_WEB_BOOKMARK_PATH.fullmatch(path)
                 if match:
                     self._handle_api_delete_bookmark(int(match.group(1)))
                     return
@@ -18246,6 +19290,61 @@ def build_web_handler(
     return SubstudyWebHandler
 
 
+class SubstudyWebServer(ThreadingHTTPServer):
+    # Requests run on a bounded thread pool instead of one new thread per
+    # connection, so bursts queue up rather than spawning unbounded threads.
+    # A /media/ response holds its worker until the client finishes reading,
+    # so --max-workers also caps concurrent media streams.
+    daemon_threads = True
+    block_on_close = False
+
+    def __init__(
+        self,
+        server_address: tuple[str, int],
+        handler_class: type[BaseHTTPRequestHandler],
+        max_workers: int = DEFAULT_WEB_MAX_WORKERS,
+        reuse_port: bool = False,
+    ) -> None:
+        self.reuse_port = reuse_port
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, int(max_workers)),
+            thread_name_prefix="substudy-web",
+        )
+        self._pending_requests: dict[Future[None], Any] = {}
+        self._pending_lock = threading.Lock()
+        try:
+            super().__init__(server_address, handler_class)
+        except BaseException:
+            self._executor.shutdown(wait=False)
+            raise
+
+    def server_bind(self) -> None:
+        if self.reuse_port and hasattr(socket, "SO_REUSEPORT"):
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        super().server_bind()
+
+    def process_request(self, request: Any, client_address: Any) -> None:
+        future = self._executor.submit(self.process_request_thread, request, client_address)
+        with self._pending_lock:
+            self._pending_requests[future] = request
+        future.add_done_callback(self._forget_request)
+
+    def _forget_request(self, future: Future[None]) -> None:
+        with self._pending_lock:
+            self._pending_requests.pop(future, None)
+
+    def server_close(self) -> None:
+        super().server_close()
+        with self._pending_lock:
+            pending = list(self._pending_requests.items())
+        # Queued requests never reach process_request_thread, so close their
+        # accepted sockets here instead of leaking them.
+        for future, request in pending:
+            if future.cancel():
+                self.shutdown_request(request)
+        self._executor.shutdown(wait=False)
+
+
 def run_web_ui(
     db_path: Path,
     source_ids: list[str],
@@ -18253,6 +19352,8 @@ def run_web_ui(
     host: str,
     port: int,
     restrict_to_source_ids: bool = False,
+    max_workers: int = DEFAULT_WEB_MAX_WORKERS,
+    reuse_port: bool = False,
 ) -> None:
     db_path.parent.mkdir(parents=True, exist_ok=True)
     with sqlite3.connect(str(db_path), timeout=30) as bootstrap_connection:
@@ -18270,7 +19371,12 @@ def run_web_ui(
         config_path=config_path,
         restrict_to_source_ids=restrict_to_source_ids,
     )
-    server = ThreadingHTTPServer((host, port), handler_cls)
+    server = SubstudyWebServer(
+        (host, port),
+        handler_cls,
+        max_workers=max_workers,
+        reuse_port=reuse_port,
+    )
     print(f"[web] serving on http://{host}:{port}")
     print(f"[web] sources: {', '.join(sorted(source_ids))}")
     try:
@@ -19095,9 +20201,8 @@ def run_translate_local(
     video_ids: list[str] | None = None,
 ) -> None:
     db_path.parent.mkdir(parents=True, exist_ok=True)
-    with sqlite3.connect(str(db_path), timeout=30) as connection:
+    with connect_ledger_writer(db_path) as connection:
         connection.row_factory = sqlite3.Row
-        connection.execute("PRAGMA journal_mode=WAL")
         create_schema(connection)
         connection.commit()
 
@@ -19500,51 +20605,59 @@ def run_translate_local_for_video(
     )
 
 
-def parse_args() -> argparse.Namespace:
-    parser = argparse.ArgumentParser(description="Substudy sync and ledger tool")
-    subparsers = parser.add_subparsers(dest="command", required=True)
+# argparse type= callables, so main() receives already-normalized values.
+def cli_lower_text(raw_value: str) -> str:
+    return raw_value.strip().lower()
 
-    sync_parser = subparsers.add_parser(
-        "sync",
-        help="Download updates and refresh ledger (incremental by default)",
-    )
-    sync_parser.add_argument("--config", type=Path, default=DEFAULT_CONFIG)
-    sync_parser.add_argument("--source", action="append", dest="sources")
-    sync_parser.add_argument(
+
+def cli_positive_int(raw_value: str) -> int:
+    return max(1, int(raw_value))
+
+
+def cli_non_negative_int(raw_value: str) -> int:
+    return max(0, int(raw_value))
+
+
+def cli_non_negative_float(raw_value: str) -> float:
+    return max(0.0, float(raw_value))
+
+
+def add_sync_command_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
         "--source-order",
         choices=["config", "random"],
         default=None,
         help="Source processing order (default: config global.source_order or random).",
     )
-    sync_parser.add_argument(
+    parser.add_argument(
         "--execution-mode",
         choices=["legacy", "queue"],
         default="legacy",
         help="Execution mode: legacy direct processing or queue producer mode.",
     )
-    sync_parser.add_argument(
+    parser.add_argument(
         "--no-producer-lock",
         action="store_true",
         help="Disable producer lock in queue mode (unsafe; advanced use only).",
     )
-    sync_parser.add_argument("--dry-run", action="store_true")
-    sync_parser.add_argument("--skip-media", action="store_true")
-    sync_parser.add_argument("--skip-subs", action="store_true")
-    sync_parser.add_argument("--skip-meta", action="store_true")
-    sync_parser.add_argument(
+    parser.add_argument("--dry-run", action="store_true")
+    parser.add_argument("--skip-media", action="store_true")
+    parser.add_argument("--skip-subs", action="store_true")
+    parser.add_argument("--skip-meta", action="store_true")
+    parser.add_argument(
         "--limit",
         type=int,
         default=0,
         help="Cap subtitle/meta targets processed in this sync run (0 = unbounded).",
     )
-    sync_parser.add_argument(
+    parser.add_argument(
         "--upstream-sub-langs-override",
         help=(
             "Override subtitle download to fetch only matching upstream subtitle tracks "
             "for this run. Disables subtitle archive gating for the run."
         ),
     )
-    sync_parser.add_argument(
+    parser.add_argument(
         "--network-profile",
         choices=["normal", "weak", "auto"],
         default="normal",
@@ -19553,36 +20666,36 @@ def parse_args() -> argparse.Namespace:
             "normal=download media, weak=skip media, auto=probe and decide."
         ),
     )
-    sync_parser.add_argument(
+    parser.add_argument(
         "--network-probe-url",
         default=DEFAULT_NETWORK_PROBE_URL,
         help=f"Probe URL for --network-profile auto (default: {DEFAULT_NETWORK_PROBE_URL})",
     )
-    sync_parser.add_argument(
+    parser.add_argument(
         "--network-probe-timeout-sec",
         type=int,
         default=DEFAULT_NETWORK_PROBE_TIMEOUT_SEC,
         help=f"Probe timeout seconds for auto network profile (default: {DEFAULT_NETWORK_PROBE_TIMEOUT_SEC})",
     )
-    sync_parser.add_argument(
+    parser.add_argument(
         "--network-probe-bytes",
         type=int,
         default=DEFAULT_NETWORK_PROBE_BYTES,
         help=f"Probe byte size for throughput estimation (default: {DEFAULT_NETWORK_PROBE_BYTES})",
     )
-    sync_parser.add_argument(
+    parser.add_argument(
         "--weak-net-min-kbps",
         type=float,
         default=DEFAULT_WEAK_NET_MIN_KBPS,
         help=f"Auto profile threshold: below this kbps is weak (default: {DEFAULT_WEAK_NET_MIN_KBPS})",
     )
-    sync_parser.add_argument(
+    parser.add_argument(
         "--weak-net-max-rtt-ms",
         type=float,
         default=DEFAULT_WEAK_NET_MAX_RTT_MS,
         help=f"Auto profile threshold: above this RTT is weak (default: {DEFAULT_WEAK_NET_MAX_RTT_MS})",
     )
-    sync_parser.add_argument(
+    parser.add_argument(
         "--metered-media-mode",
         choices=["off", "updates-only"],
         default=DEFAULT_METERED_MEDIA_MODE,
@@ -19591,7 +20704,7 @@ def parse_args() -> argparse.Namespace:
             "off=normal behavior, updates-only=download only recent updates for already-seeded sources."
         ),
     )
-    sync_parser.add_argument(
+    parser.add_argument(
         "--metered-min-archive-ids",
         type=int,
         default=DEFAULT_METERED_MIN_ARCHIVE_IDS,
@@ -19600,7 +20713,7 @@ def parse_args() -> argparse.Namespace:
             f"(default: {DEFAULT_METERED_MIN_ARCHIVE_IDS})."
         ),
     )
-    sync_parser.add_argument(
+    parser.add_argument(
         "--metered-playlist-end",
         type=int,
         default=DEFAULT_METERED_PLAYLIST_END,
@@ -19609,61 +20722,56 @@ def parse_args() -> argparse.Namespace:
             f"(default: {DEFAULT_METERED_PLAYLIST_END})."
         ),
     )
-    sync_parser.add_argument(
+    parser.add_argument(
         "--require-current-ytdlp",
         action="store_true",
         help="Fail fast when configured yt-dlp is not on the latest available version.",
     )
-    sync_parser.add_argument(
+    parser.add_argument(
         "--ytdlp-check-mode",
         choices=["auto", "uv", "brew", "off"],
         default="auto",
         help="Freshness check mode used by --require-current-ytdlp (default: auto).",
     )
-    sync_parser.add_argument("--skip-ledger", action="store_true")
-    sync_parser.add_argument(
+    parser.add_argument("--skip-ledger", action="store_true")
+    parser.add_argument(
         "--full-ledger",
         action="store_true",
         help="Run a full ledger rebuild (scan all files) instead of incremental update.",
     )
-    sync_parser.add_argument("--ledger-db", type=Path)
-    sync_parser.add_argument("--ledger-csv", type=Path)
+    parser.add_argument("--ledger-csv", type=Path)
 
-    backfill_parser = subparsers.add_parser(
-        "backfill",
-        help="Fetch older playlist windows incrementally and advance per-source cursors",
-    )
-    backfill_parser.add_argument("--config", type=Path, default=DEFAULT_CONFIG)
-    backfill_parser.add_argument("--source", action="append", dest="sources")
-    backfill_parser.add_argument(
+
+def add_backfill_command_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
         "--source-order",
         choices=["config", "random"],
         default=None,
         help="Source processing order (default: config global.source_order or random).",
     )
-    backfill_parser.add_argument(
+    parser.add_argument(
         "--execution-mode",
         choices=["legacy", "queue"],
         default="legacy",
         help="Execution mode: legacy direct processing or queue producer mode.",
     )
-    backfill_parser.add_argument(
+    parser.add_argument(
         "--no-producer-lock",
         action="store_true",
         help="Disable producer lock in queue mode (unsafe; advanced use only).",
     )
-    backfill_parser.add_argument("--dry-run", action="store_true")
-    backfill_parser.add_argument("--skip-media", action="store_true")
-    backfill_parser.add_argument("--skip-subs", action="store_true")
-    backfill_parser.add_argument("--skip-meta", action="store_true")
-    backfill_parser.add_argument(
+    parser.add_argument("--dry-run", action="store_true")
+    parser.add_argument("--skip-media", action="store_true")
+    parser.add_argument("--skip-subs", action="store_true")
+    parser.add_argument("--skip-meta", action="store_true")
+    parser.add_argument(
         "--upstream-sub-langs-override",
         help=(
             "Override subtitle download to fetch only matching upstream subtitle tracks "
             "for this run. Disables subtitle archive gating for the run."
         ),
     )
-    backfill_parser.add_argument(
+    parser.add_argument(
         "--network-profile",
         choices=["normal", "weak", "auto"],
         default="normal",
@@ -19672,36 +20780,36 @@ def parse_args() -> argparse.Namespace:
             "normal=download media, weak=skip media, auto=probe and decide."
         ),
     )
-    backfill_parser.add_argument(
+    parser.add_argument(
         "--network-probe-url",
         default=DEFAULT_NETWORK_PROBE_URL,
         help=f"Probe URL for --network-profile auto (default: {DEFAULT_NETWORK_PROBE_URL})",
     )
-    backfill_parser.add_argument(
+    parser.add_argument(
         "--network-probe-timeout-sec",
         type=int,
         default=DEFAULT_NETWORK_PROBE_TIMEOUT_SEC,
         help=f"Probe timeout seconds for auto network profile (default: {DEFAULT_NETWORK_PROBE_TIMEOUT_SEC})",
     )
-    backfill_parser.add_argument(
+    parser.add_argument(
         "--network-probe-bytes",
         type=int,
         default=DEFAULT_NETWORK_PROBE_BYTES,
         help=f"Probe byte size for throughput estimation (default: {DEFAULT_NETWORK_PROBE_BYTES})",
     )
-    backfill_parser.add_argument(
+    parser.add_argument(
         "--weak-net-min-kbps",
         type=float,
         default=DEFAULT_WEAK_NET_MIN_KBPS,
         help=f"Auto profile threshold: below this kbps is weak (default: {DEFAULT_WEAK_NET_MIN_KBPS})",
     )
-    backfill_parser.add_argument(
+    parser.add_argument(
         "--weak-net-max-rtt-ms",
         type=float,
         default=DEFAULT_WEAK_NET_MAX_RTT_MS,
         help=f"Auto profile threshold: above this RTT is weak (default: {DEFAULT_WEAK_NET_MAX_RTT_MS})",
     )
-    backfill_parser.add_argument(
+    parser.add_argument(
         "--metered-media-mode",
         choices=["off", "updates-only"],
         default=DEFAULT_METERED_MEDIA_MODE,
@@ -19710,7 +20818,7 @@ def parse_args() -> argparse.Namespace:
             "updates-only disables historical backfill windows."
         ),
     )
-    backfill_parser.add_argument(
+    parser.add_argument(
         "--metered-min-archive-ids",
         type=int,
         default=DEFAULT_METERED_MIN_ARCHIVE_IDS,
@@ -19719,7 +20827,7 @@ def parse_args() -> argparse.Namespace:
             f"(default: {DEFAULT_METERED_MIN_ARCHIVE_IDS})."
         ),
     )
-    backfill_parser.add_argument(
+    parser.add_argument(
         "--metered-playlist-end",
         type=int,
         default=DEFAULT_METERED_PLAYLIST_END,
@@ -19728,582 +20836,513 @@ def parse_args() -> argparse.Namespace:
             f"(default: {DEFAULT_METERED_PLAYLIST_END})."
         ),
     )
-    backfill_parser.add_argument(
+    parser.add_argument(
         "--require-current-ytdlp",
         action="store_true",
         help="Fail fast when configured yt-dlp is not on the latest available version.",
     )
-    backfill_parser.add_argument(
+    parser.add_argument(
         "--ytdlp-check-mode",
         choices=["auto", "uv", "brew", "off"],
         default="auto",
         help="Freshness check mode used by --require-current-ytdlp (default: auto).",
     )
-    backfill_parser.add_argument("--skip-ledger", action="store_true")
-    backfill_parser.add_argument(
+    parser.add_argument("--skip-ledger", action="store_true")
+    parser.add_argument(
         "--full-ledger",
         action="store_true",
         help="Run a full ledger rebuild after backfill instead of incremental update.",
     )
-    backfill_parser.add_argument(
+    parser.add_argument(
         "--windows",
         type=int,
         help="Override how many windows each source processes in this run.",
     )
-    backfill_parser.add_argument(
+    parser.add_argument(
         "--reset",
         action="store_true",
         help="Reset saved backfill cursor before running.",
     )
-    backfill_parser.add_argument("--ledger-db", type=Path)
-    backfill_parser.add_argument("--ledger-csv", type=Path)
+    parser.add_argument("--ledger-csv", type=Path)
 
-    queue_worker_parser = subparsers.add_parser(
-        "queue-worker",
-        help="Lease and process work_items with per-video stage workers",
-    )
-    queue_worker_parser.add_argument("--config", type=Path, default=DEFAULT_CONFIG)
-    queue_worker_parser.add_argument("--source", action="append", dest="sources")
-    queue_worker_parser.add_argument(
+
+def add_queue_worker_command_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
         "--stage",
         action="append",
         dest="stages",
         choices=["media", "subs", "meta", "asr", "loudness", "translate"],
         help="Stage filter (repeatable). Defaults to media+subs+meta+asr+loudness+translate.",
     )
-    queue_worker_parser.add_argument(
+    parser.add_argument(
         "--worker-id",
         help="Optional stable worker identity (default: host-pid-random).",
     )
-    queue_worker_parser.add_argument(
+    parser.add_argument(
         "--lease-sec",
         type=int,
         default=DEFAULT_QUEUE_LEASE_SEC,
         help=f"Lease duration seconds (default: {DEFAULT_QUEUE_LEASE_SEC}).",
     )
-    queue_worker_parser.add_argument(
+    parser.add_argument(
         "--poll-sec",
         type=float,
         default=DEFAULT_QUEUE_POLL_SEC,
         help=f"Idle polling interval seconds (default: {DEFAULT_QUEUE_POLL_SEC}).",
     )
-    queue_worker_parser.add_argument(
+    parser.add_argument(
         "--max-items",
-        type=int,
+        type=cli_non_negative_int,
         default=0,
         help="Stop after this many leased items (0 = unlimited).",
     )
-    queue_worker_parser.add_argument(
+    parser.add_argument(
         "--max-attempts",
-        type=int,
+        type=cli_positive_int,
         default=DEFAULT_QUEUE_MAX_ATTEMPTS,
         help=f"Mark item dead after this many failed attempts (default: {DEFAULT_QUEUE_MAX_ATTEMPTS}).",
     )
-    queue_worker_parser.add_argument(
+    parser.add_argument(
         "--no-enqueue-downstream",
         action="store_true",
         help="Disable downstream work item enqueue on success (media->subs/meta/asr/loudness, subs/asr->translate).",
     )
-    queue_worker_parser.add_argument(
+    parser.add_argument(
         "--translate-target-lang",
         default="ja-local",
         help="Target language label for translate stage runs (default: ja-local).",
     )
-    queue_worker_parser.add_argument(
+    parser.add_argument(
         "--translate-source-track",
         choices=["subtitle", "asr", "auto"],
         default="auto",
         help="Source track preference for translate stage (default: auto).",
     )
-    queue_worker_parser.add_argument(
+    parser.add_argument(
         "--translate-timeout-sec",
         type=int,
         default=60,
         help="HTTP timeout per translate request (default: 60).",
     )
-    queue_worker_parser.add_argument(
+    parser.add_argument(
         "--once",
         action="store_true",
         help="Try to process at most one currently due item, then exit.",
     )
-    queue_worker_parser.add_argument("--dry-run", action="store_true")
-    queue_worker_parser.add_argument("--ledger-db", type=Path)
+    parser.add_argument("--dry-run", action="store_true")
 
-    ledger_parser = subparsers.add_parser("ledger", help="Rebuild ledger only")
-    ledger_parser.add_argument("--config", type=Path, default=DEFAULT_CONFIG)
-    ledger_parser.add_argument("--source", action="append", dest="sources")
-    ledger_parser.add_argument(
+
+def add_ledger_command_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
         "--incremental",
         action="store_true",
         help="Update ledger incrementally from archive deltas/unresolved rows.",
     )
-    ledger_parser.add_argument("--ledger-db", type=Path)
-    ledger_parser.add_argument("--ledger-csv", type=Path)
+    parser.add_argument("--ledger-csv", type=Path)
 
-    asr_parser = subparsers.add_parser(
-        "asr",
-        help="Generate ASR subtitles incrementally from local media files",
-    )
-    asr_parser.add_argument("--config", type=Path, default=DEFAULT_CONFIG)
-    asr_parser.add_argument("--source", action="append", dest="sources")
-    asr_parser.add_argument("--dry-run", action="store_true")
-    asr_parser.add_argument(
+
+def add_asr_command_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--dry-run", action="store_true")
+    parser.add_argument(
         "--force",
         action="store_true",
         help="Re-run ASR even when successful artifacts already exist.",
     )
-    asr_parser.add_argument(
+    parser.add_argument(
         "--max-per-source",
         type=int,
         help="Override per-source ASR batch size for this run.",
     )
-    asr_parser.add_argument("--ledger-db", type=Path)
-    asr_parser.add_argument("--ledger-csv", type=Path)
+    parser.add_argument("--ledger-csv", type=Path)
 
-    downloads_parser = subparsers.add_parser(
-        "downloads",
-        help="Show recent download run logs and pending failures",
-    )
-    downloads_parser.add_argument("--config", type=Path, default=DEFAULT_CONFIG)
-    downloads_parser.add_argument("--source", action="append", dest="sources")
-    downloads_parser.add_argument(
+
+def add_downloads_command_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
         "--since-hours",
-        type=int,
+        type=cli_positive_int,
         default=24,
         help="Lookback window for download_runs.",
     )
-    downloads_parser.add_argument(
+    parser.add_argument(
         "--limit",
-        type=int,
+        type=cli_positive_int,
         default=20,
         help="Max rows per source for runs/failures.",
     )
-    downloads_parser.add_argument("--ledger-db", type=Path)
 
-    queue_status_parser = subparsers.add_parser(
-        "queue-status",
-        help="Show unresolved queue work items and recent queue failures",
-    )
-    queue_status_parser.add_argument("--config", type=Path, default=DEFAULT_CONFIG)
-    queue_status_parser.add_argument("--source", action="append", dest="sources")
-    queue_status_parser.add_argument(
+
+def add_queue_status_command_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
         "--limit",
-        type=int,
+        type=cli_positive_int,
         default=20,
         help="Max recent failed items per source.",
     )
-    queue_status_parser.add_argument(
+    parser.add_argument(
         "--only-unresolved",
         action="store_true",
         help="Show only sources that currently have unresolved queue items.",
     )
-    queue_status_parser.add_argument("--ledger-db", type=Path)
 
-    queue_requeue_parser = subparsers.add_parser(
-        "queue-requeue",
-        help="Requeue selected queue work_items (default: status error/dead)",
-    )
-    queue_requeue_parser.add_argument("--config", type=Path, default=DEFAULT_CONFIG)
-    queue_requeue_parser.add_argument("--source", action="append", dest="sources")
-    queue_requeue_parser.add_argument(
+
+def add_queue_requeue_command_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
         "--stage",
         action="append",
         dest="stages",
         choices=["media", "subs", "meta", "asr", "loudness", "translate"],
         help="Stage filter (repeatable). Defaults to all stages.",
     )
-    queue_requeue_parser.add_argument(
+    parser.add_argument(
         "--status",
         action="append",
         dest="statuses",
         choices=["queued", "leased", "error", "dead", "success"],
         help="Current status filter (repeatable). Defaults to error+dead.",
     )
-    queue_requeue_parser.add_argument(
+    parser.add_argument(
         "--error-contains",
         help="Optional substring filter against last_error.",
     )
-    queue_requeue_parser.add_argument(
+    parser.add_argument(
         "--limit",
-        type=int,
+        type=cli_non_negative_int,
         default=0,
         help="Max matched items per source (0 = no limit).",
     )
-    queue_requeue_parser.add_argument(
+    parser.add_argument(
         "--reset-attempts",
         action="store_true",
         help="Reset attempt_count to 0 on requeue.",
     )
-    queue_requeue_parser.add_argument("--dry-run", action="store_true")
-    queue_requeue_parser.add_argument("--ledger-db", type=Path)
+    parser.add_argument("--dry-run", action="store_true")
 
-    queue_recover_known_parser = subparsers.add_parser(
-        "queue-recover-known",
-        help="Requeue known recoverable queue failures with predefined filters",
-    )
-    queue_recover_known_parser.add_argument("--config", type=Path, default=DEFAULT_CONFIG)
-    queue_recover_known_parser.add_argument("--source", action="append", dest="sources")
-    queue_recover_known_parser.add_argument(
+
+def add_queue_recover_known_command_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
         "--profile",
         action="append",
         dest="profiles",
         choices=["all", *sorted(QUEUE_RECOVERY_PROFILES.keys())],
         help="Recovery profile (repeatable). Defaults to all known profiles.",
     )
-    queue_recover_known_parser.add_argument(
+    parser.add_argument(
         "--limit",
-        type=int,
+        type=cli_non_negative_int,
         default=0,
         help="Max matched items per source for each profile (0 = no limit).",
     )
-    queue_recover_known_parser.add_argument(
+    parser.add_argument(
         "--reset-attempts",
         action="store_true",
         help="Reset attempt_count to 0 on requeue.",
     )
-    queue_recover_known_parser.add_argument("--dry-run", action="store_true")
-    queue_recover_known_parser.add_argument("--ledger-db", type=Path)
+    parser.add_argument("--dry-run", action="store_true")
 
-    loudness_parser = subparsers.add_parser(
-        "loudness",
-        help="Analyze per-video loudness and store normalization gain",
-    )
-    loudness_parser.add_argument("--config", type=Path, default=DEFAULT_CONFIG)
-    loudness_parser.add_argument("--source", action="append", dest="sources")
-    loudness_parser.add_argument("--ledger-db", type=Path)
-    loudness_parser.add_argument(
+
+def add_loudness_command_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
         "--target-lufs",
         type=float,
         default=DEFAULT_LOUDNESS_TARGET_LUFS,
         help="Target integrated loudness in LUFS (default: -16.0)",
     )
-    loudness_parser.add_argument(
+    parser.add_argument(
         "--max-boost-db",
-        type=float,
+        type=cli_non_negative_float,
         default=DEFAULT_LOUDNESS_MAX_BOOST_DB,
         help="Maximum positive gain per video (default: 6.0)",
     )
-    loudness_parser.add_argument(
+    parser.add_argument(
         "--max-cut-db",
-        type=float,
+        type=cli_non_negative_float,
         default=DEFAULT_LOUDNESS_MAX_CUT_DB,
         help="Maximum attenuation per video (default: 12.0)",
     )
-    loudness_parser.add_argument(
+    parser.add_argument(
         "--limit",
-        type=int,
+        type=cli_positive_int,
         default=DEFAULT_LOUDNESS_LIMIT,
         help="Maximum videos to analyze per source in one run (default: 300)",
     )
-    loudness_parser.add_argument(
+    parser.add_argument(
         "--force",
         action="store_true",
         help="Re-analyze videos even when gain has already been computed.",
     )
-    loudness_parser.add_argument(
+    parser.add_argument(
         "--ffmpeg-bin",
         default=DEFAULT_LOUDNESS_FFMPEG_BIN,
         help="ffmpeg binary path/name (default: ffmpeg)",
     )
 
-    dict_index_parser = subparsers.add_parser(
-        "dict-index",
-        help="Index EIJIRO dictionary entries into SQLite for hover lookup",
-    )
-    dict_index_parser.add_argument("--config", type=Path, default=DEFAULT_CONFIG)
-    dict_index_parser.add_argument("--source", action="append", dest="sources")
-    dict_index_parser.add_argument("--ledger-db", type=Path)
-    dict_index_parser.add_argument(
+
+def add_dict_index_command_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
         "--dictionary-path",
         type=Path,
         default=DEFAULT_DICT_PATH,
         help="Dictionary file path (default: data/eijiro-1449.utf8.txt)",
     )
-    dict_index_parser.add_argument(
+    parser.add_argument(
         "--encoding",
         default=DEFAULT_DICT_ENCODING,
         help="Dictionary file encoding (default: utf-8)",
     )
-    dict_index_parser.add_argument(
+    parser.add_argument(
         "--source-name",
         default=DEFAULT_DICT_SOURCE_NAME,
         help="Logical dictionary source label stored in DB (default: eijiro-1449)",
     )
-    dict_index_parser.add_argument(
+    parser.add_argument(
         "--no-clear",
         action="store_true",
         help="Append/update without deleting existing entries for the same source.",
     )
-    dict_index_parser.add_argument(
+    parser.add_argument(
         "--max-lines",
         type=int,
         default=0,
         help="Optional line cap for quick trial runs (0 = no cap).",
     )
 
-    dict_bookmarks_export_parser = subparsers.add_parser(
-        "dict-bookmarks-export",
-        help="Export dictionary bookmarks for LLM/review workflows",
-    )
-    dict_bookmarks_export_parser.add_argument("--config", type=Path, default=DEFAULT_CONFIG)
-    dict_bookmarks_export_parser.add_argument("--source", action="append", dest="sources")
-    dict_bookmarks_export_parser.add_argument("--ledger-db", type=Path)
-    dict_bookmarks_export_parser.add_argument(
+
+def add_dict_bookmarks_export_command_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
         "--format",
+        type=cli_lower_text,
         choices=["jsonl", "csv"],
         default="jsonl",
         help="Export format (default: jsonl)",
     )
-    dict_bookmarks_export_parser.add_argument(
+    parser.add_argument(
         "--entry-status",
+        type=cli_lower_text,
         choices=["all", "missing", "known"],
         default="all",
         help="Filter by dictionary entry status (default: all)",
     )
-    dict_bookmarks_export_parser.add_argument(
+    parser.add_argument(
         "--video-id",
         action="append",
         dest="video_ids",
         help="Optional video_id filter (repeatable).",
     )
-    dict_bookmarks_export_parser.add_argument(
+    parser.add_argument(
         "--limit",
-        type=int,
+        type=cli_non_negative_int,
         default=0,
         help="Optional row cap (0 = no limit).",
     )
-    dict_bookmarks_export_parser.add_argument(
+    parser.add_argument(
         "--output",
         type=Path,
         help="Output file path. Defaults to exports/dictionary_bookmarks_<status>_<utc>.<format>",
     )
 
-    dict_bookmarks_import_parser = subparsers.add_parser(
-        "dict-bookmarks-import",
-        help="Import dictionary bookmarks from JSONL/CSV with duplicate policy control",
-    )
-    dict_bookmarks_import_parser.add_argument("--config", type=Path, default=DEFAULT_CONFIG)
-    dict_bookmarks_import_parser.add_argument("--source", action="append", dest="sources")
-    dict_bookmarks_import_parser.add_argument("--ledger-db", type=Path)
-    dict_bookmarks_import_parser.add_argument(
+
+def add_dict_bookmarks_import_command_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
         "--input",
         type=Path,
         required=True,
         help="Input file path (JSONL/CSV).",
     )
-    dict_bookmarks_import_parser.add_argument(
+    parser.add_argument(
         "--format",
+        type=cli_lower_text,
         choices=["jsonl", "csv"],
         default="jsonl",
         help="Input format (default: jsonl)",
     )
-    dict_bookmarks_import_parser.add_argument(
+    parser.add_argument(
         "--on-duplicate",
+        type=cli_lower_text,
         choices=["skip", "upsert", "error"],
         default="upsert",
         help="Duplicate composite-key behavior (default: upsert)",
     )
-    dict_bookmarks_import_parser.add_argument(
+    parser.add_argument(
         "--dry-run",
         action="store_true",
         help="Validate and report without writing DB changes.",
     )
 
-    dict_bookmarks_curate_parser = subparsers.add_parser(
-        "dict-bookmarks-curate",
-        help="Materialize curated dictionary bookmark views for review/study",
-    )
-    dict_bookmarks_curate_parser.add_argument("--config", type=Path, default=DEFAULT_CONFIG)
-    dict_bookmarks_curate_parser.add_argument("--source", action="append", dest="sources")
-    dict_bookmarks_curate_parser.add_argument("--ledger-db", type=Path)
-    dict_bookmarks_curate_parser.add_argument(
+
+def add_dict_bookmarks_curate_command_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
         "--preset",
+        type=cli_lower_text,
         choices=["missing_review", "frequent_terms", "recent_saved", "review_cards"],
         required=True,
         help="Curated view preset to materialize.",
     )
-    dict_bookmarks_curate_parser.add_argument(
+    parser.add_argument(
         "--format",
+        type=cli_lower_text,
         choices=["jsonl", "csv"],
         default="jsonl",
         help="Output format (default: jsonl)",
     )
-    dict_bookmarks_curate_parser.add_argument(
+    parser.add_argument(
         "--limit",
-        type=int,
+        type=cli_positive_int,
         default=200,
         help="Row cap for output (default: 200)",
     )
-    dict_bookmarks_curate_parser.add_argument(
+    parser.add_argument(
         "--min-bookmarks",
-        type=int,
+        type=cli_positive_int,
         default=2,
         help="Minimum bookmark count for frequent_terms (default: 2)",
     )
-    dict_bookmarks_curate_parser.add_argument(
+    parser.add_argument(
         "--min-videos",
-        type=int,
+        type=cli_positive_int,
         default=1,
         help="Minimum distinct videos for frequent_terms (default: 1)",
     )
-    dict_bookmarks_curate_parser.add_argument(
+    parser.add_argument(
         "--output",
         type=Path,
         help="Output file path. Defaults to exports/dictionary_bookmarks_<preset>_<utc>.<format>",
     )
 
-    notify_parser = subparsers.add_parser(
-        "notify",
-        help="Send local study notifications (review / LLM-updated unread)",
-    )
-    notify_parser.add_argument("--config", type=Path, default=DEFAULT_CONFIG)
-    notify_parser.add_argument("--source", action="append", dest="sources")
-    notify_parser.add_argument("--ledger-db", type=Path)
-    notify_parser.add_argument(
+
+def add_notify_command_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
         "--kind",
+        type=cli_lower_text,
         choices=["review", "llm", "all"],
         default="all",
         help="Notification kind (default: all)",
     )
-    notify_parser.add_argument(
+    parser.add_argument(
         "--web-url-base",
         default=DEFAULT_NOTIFY_WEB_URL_BASE,
         help="Base URL opened when notification is clicked (default: http://127.0.0.1:8876)",
     )
-    notify_parser.add_argument(
+    parser.add_argument(
         "--llm-lookback-hours",
-        type=int,
+        type=cli_positive_int,
         default=DEFAULT_NOTIFY_LLM_LOOKBACK_HOURS,
         help="Initial lookback for LLM update detection when no state exists (default: 24)",
     )
-    notify_parser.add_argument(
+    parser.add_argument(
         "--cooldown-minutes",
         type=int,
         default=DEFAULT_NOTIFY_COOLDOWN_MINUTES,
         help=f"Suppress duplicate notifications within this window (default: {DEFAULT_NOTIFY_COOLDOWN_MINUTES})",
     )
-    notify_parser.add_argument("--dry-run", action="store_true")
+    parser.add_argument("--dry-run", action="store_true")
 
-    notify_install_parser = subparsers.add_parser(
-        "notify-install-macos",
-        help="Install periodic notification scheduler via macOS launchd",
-    )
-    notify_install_parser.add_argument("--config", type=Path, default=DEFAULT_CONFIG)
-    notify_install_parser.add_argument("--source", action="append", dest="sources")
-    notify_install_parser.add_argument("--ledger-db", type=Path)
-    notify_install_parser.add_argument(
+
+def add_notify_install_macos_command_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
         "--label",
         default=DEFAULT_NOTIFY_MACOS_LABEL,
         help=f"LaunchAgent label (default: {DEFAULT_NOTIFY_MACOS_LABEL})",
     )
-    notify_install_parser.add_argument(
+    parser.add_argument(
         "--interval-minutes",
-        type=int,
+        type=cli_positive_int,
         default=DEFAULT_NOTIFY_INTERVAL_MINUTES,
         help=f"Notification interval minutes (default: {DEFAULT_NOTIFY_INTERVAL_MINUTES})",
     )
-    notify_install_parser.add_argument(
+    parser.add_argument(
         "--kind",
+        type=cli_lower_text,
         choices=["review", "llm", "all"],
         default="all",
         help="Notification kind for scheduled runs (default: all)",
     )
-    notify_install_parser.add_argument(
+    parser.add_argument(
         "--web-url-base",
         default=DEFAULT_NOTIFY_WEB_URL_BASE,
         help="Base URL opened when notification is clicked",
     )
-    notify_install_parser.add_argument(
+    parser.add_argument(
         "--llm-lookback-hours",
-        type=int,
+        type=cli_positive_int,
         default=DEFAULT_NOTIFY_LLM_LOOKBACK_HOURS,
         help="Initial lookback for LLM update detection when state is empty",
     )
-    notify_install_parser.add_argument(
+    parser.add_argument(
         "--cooldown-minutes",
         type=int,
         default=DEFAULT_NOTIFY_COOLDOWN_MINUTES,
         help=f"Suppress duplicate notifications within this window (default: {DEFAULT_NOTIFY_COOLDOWN_MINUTES})",
     )
-    notify_install_parser.add_argument(
+    parser.add_argument(
         "--python-bin",
         default=sys.executable,
         help="Python executable for LaunchAgent ProgramArguments",
     )
-    notify_install_parser.add_argument(
+    parser.add_argument(
         "--script-path",
         type=Path,
-        default=Path(__file__).resolve(),
+        default=SCRIPT_PATH,
         help="Path to substudy.py used by LaunchAgent",
     )
-    notify_install_parser.add_argument(
+    parser.add_argument(
         "--plist-path",
         type=Path,
         help="Optional custom LaunchAgent plist path",
     )
-    notify_install_parser.add_argument(
+    parser.add_argument(
         "--no-load",
         action="store_true",
         help="Write plist but do not load/bootstrap immediately.",
     )
 
-    notify_uninstall_parser = subparsers.add_parser(
-        "notify-uninstall-macos",
-        help="Uninstall periodic notification LaunchAgent on macOS",
-    )
-    notify_uninstall_parser.add_argument("--config", type=Path, default=DEFAULT_CONFIG)
-    notify_uninstall_parser.add_argument("--source", action="append", dest="sources")
-    notify_uninstall_parser.add_argument(
+
+def add_notify_uninstall_macos_command_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
         "--label",
         default=DEFAULT_NOTIFY_MACOS_LABEL,
         help=f"LaunchAgent label (default: {DEFAULT_NOTIFY_MACOS_LABEL})",
     )
-    notify_uninstall_parser.add_argument(
+    parser.add_argument(
         "--plist-path",
         type=Path,
         help="Optional custom LaunchAgent plist path",
     )
 
-    translate_local_parser = subparsers.add_parser(
-        "translate-local",
-        help="Translate subtitles with local multi-stage LLM pipeline (20b draft + 120b refinements)",
-    )
-    translate_local_parser.add_argument("--config", type=Path, default=DEFAULT_CONFIG)
-    translate_local_parser.add_argument("--source", action="append", dest="sources")
-    translate_local_parser.add_argument("--ledger-db", type=Path)
-    translate_local_parser.add_argument(
+
+def add_translate_local_command_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
         "--video-id",
         action="append",
         dest="video_ids",
         help="Optional video_id filter (repeatable).",
     )
-    translate_local_parser.add_argument(
+    parser.add_argument(
         "--limit",
-        type=int,
+        type=cli_non_negative_int,
         default=1,
         help="Max subtitle files to process in this run (default: 1).",
     )
-    translate_local_parser.add_argument(
+    parser.add_argument(
         "--include-translated",
         action="store_true",
         help="Include files that already have active translation_runs rows.",
     )
-    translate_local_parser.add_argument(
+    parser.add_argument(
         "--overwrite",
         action="store_true",
         help="Overwrite existing target subtitle files.",
     )
-    translate_local_parser.add_argument(
+    parser.add_argument(
         "--source-lang",
         default="en",
         help="Source language label stored in translation_runs (default: en).",
     )
-    translate_local_parser.add_argument(
+    parser.add_argument(
         "--target-lang",
         default="ja",
         help="Target language label stored in translation_runs (default: ja).",
     )
-    translate_local_parser.add_argument(
+    parser.add_argument(
         "--source-track",
         choices=["subtitle", "asr", "auto"],
         default="subtitle",
@@ -20312,754 +21351,991 @@ def parse_args() -> argparse.Namespace:
             "subtitle=subtitle table only, asr=asr_runs only, auto=prefer subtitle then ASR."
         ),
     )
-    translate_local_parser.add_argument(
+    parser.add_argument(
         "--endpoint",
         default=os.environ.get("SUBSTUDY_LOCAL_LLM_ENDPOINT", DEFAULT_LOCAL_LLM_ENDPOINT),
         help=f"OpenAI-compatible endpoint (default: {DEFAULT_LOCAL_LLM_ENDPOINT})",
     )
-    translate_local_parser.add_argument(
+    parser.add_argument(
         "--api-key",
         default=os.environ.get("SUBSTUDY_LOCAL_LLM_API_KEY", ""),
         help="Optional API key for endpoint auth.",
     )
-    translate_local_parser.add_argument(
+    parser.add_argument(
         "--draft-model",
         default=DEFAULT_LOCAL_TRANSLATE_DRAFT_MODEL,
         help=f"Stage1 cue-level model (default: {DEFAULT_LOCAL_TRANSLATE_DRAFT_MODEL})",
     )
-    translate_local_parser.add_argument(
+    parser.add_argument(
         "--refine-model",
         default=DEFAULT_LOCAL_TRANSLATE_REFINE_MODEL,
         help=f"Stage2 chunk-level model (default: {DEFAULT_LOCAL_TRANSLATE_REFINE_MODEL})",
     )
-    translate_local_parser.add_argument(
+    parser.add_argument(
         "--global-model",
         default=DEFAULT_LOCAL_TRANSLATE_GLOBAL_MODEL,
         help=f"Stage3 global-pass model (default: {DEFAULT_LOCAL_TRANSLATE_GLOBAL_MODEL})",
     )
-    translate_local_parser.add_argument(
+    parser.add_argument(
         "--draft-max-tokens",
-        type=int,
+        type=cli_positive_int,
         default=160,
         help="Stage1 max_tokens (default: 160).",
     )
-    translate_local_parser.add_argument(
+    parser.add_argument(
         "--refine-max-tokens",
-        type=int,
+        type=cli_positive_int,
         default=480,
         help="Stage2 max_tokens (default: 480).",
     )
-    translate_local_parser.add_argument(
+    parser.add_argument(
         "--global-max-tokens",
-        type=int,
+        type=cli_positive_int,
         default=1200,
         help="Stage3 max_tokens (default: 1200).",
     )
-    translate_local_parser.add_argument(
+    parser.add_argument(
         "--temperature",
         type=float,
         default=0.1,
         help="Sampling temperature (default: 0.1).",
     )
-    translate_local_parser.add_argument(
+    parser.add_argument(
         "--top-p",
         type=float,
         default=0.9,
         help="Nucleus sampling top_p (default: 0.9).",
     )
-    translate_local_parser.add_argument(
+    parser.add_argument(
         "--chunk-size",
-        type=int,
+        type=cli_positive_int,
         default=12,
         help="Cues per refine request (default: 12).",
     )
-    translate_local_parser.add_argument(
+    parser.add_argument(
         "--global-max-cues",
-        type=int,
+        type=cli_positive_int,
         default=240,
         help="Skip stage3 when cue count exceeds this (default: 240).",
     )
-    translate_local_parser.add_argument(
+    parser.add_argument(
         "--timeout-sec",
         type=int,
         default=60,
         help="HTTP timeout per request (default: 60).",
     )
-    translate_local_parser.add_argument(
+    parser.add_argument(
         "--agent",
         default="local-llm",
         help="translation_runs.agent value (default: local-llm).",
     )
-    translate_local_parser.add_argument(
+    parser.add_argument(
         "--method",
         default="multi-stage",
         help="translation_runs.method value (default: multi-stage).",
     )
-    translate_local_parser.add_argument(
+    parser.add_argument(
         "--method-version",
         default="20b-draft+120b-refine+120b-global-v1",
         help="translation_runs.method_version value.",
     )
-    translate_local_parser.add_argument(
+    parser.add_argument(
         "--quality-enforce",
         action="store_true",
         help="Fail this run when quality thresholds are not met after quality loop.",
     )
-    translate_local_parser.add_argument(
+    parser.add_argument(
         "--quality-loop-max-rounds",
-        type=int,
+        type=cli_non_negative_int,
         default=DEFAULT_LOCAL_TRANSLATE_QUALITY_LOOP_MAX_ROUNDS,
         help=(
             "Max rounds for audit->repair->re-audit loop "
             f"(default: {DEFAULT_LOCAL_TRANSLATE_QUALITY_LOOP_MAX_ROUNDS}, 0 disables)."
         ),
     )
-    translate_local_parser.add_argument(
+    parser.add_argument(
         "--quality-json-fragment-threshold",
-        type=float,
+        type=cli_non_negative_float,
         default=DEFAULT_LOCAL_TRANSLATE_QUALITY_JSON_FRAGMENT_THRESHOLD,
         help=(
             "Allowed json_fragment_rate after quality loop "
             f"(default: {DEFAULT_LOCAL_TRANSLATE_QUALITY_JSON_FRAGMENT_THRESHOLD})."
         ),
     )
-    translate_local_parser.add_argument(
+    parser.add_argument(
         "--quality-english-heavy-threshold",
-        type=float,
+        type=cli_non_negative_float,
         default=DEFAULT_LOCAL_TRANSLATE_QUALITY_ENGLISH_HEAVY_THRESHOLD,
         help=(
             "Allowed english_heavy_rate after quality loop "
             f"(default: {DEFAULT_LOCAL_TRANSLATE_QUALITY_ENGLISH_HEAVY_THRESHOLD})."
         ),
     )
-    translate_local_parser.add_argument(
+    parser.add_argument(
         "--quality-unchanged-threshold",
-        type=float,
+        type=cli_non_negative_float,
         default=DEFAULT_LOCAL_TRANSLATE_QUALITY_UNCHANGED_THRESHOLD,
         help=(
             "Allowed unchanged_rate after quality loop "
             f"(default: {DEFAULT_LOCAL_TRANSLATE_QUALITY_UNCHANGED_THRESHOLD})."
         ),
     )
-    translate_local_parser.add_argument(
+    parser.add_argument(
         "--quality-audit-model",
         default=DEFAULT_LOCAL_TRANSLATE_QUALITY_AUDIT_MODEL,
         help=f"Quality audit model (default: {DEFAULT_LOCAL_TRANSLATE_QUALITY_AUDIT_MODEL})",
     )
-    translate_local_parser.add_argument(
+    parser.add_argument(
         "--quality-repair-model",
         default=DEFAULT_LOCAL_TRANSLATE_QUALITY_REPAIR_MODEL,
         help=f"Quality repair model (default: {DEFAULT_LOCAL_TRANSLATE_QUALITY_REPAIR_MODEL})",
     )
-    translate_local_parser.add_argument(
+    parser.add_argument(
         "--quality-audit-max-tokens",
-        type=int,
+        type=cli_positive_int,
         default=DEFAULT_LOCAL_TRANSLATE_QUALITY_AUDIT_MAX_TOKENS,
         help=(
             "Quality audit max_tokens "
             f"(default: {DEFAULT_LOCAL_TRANSLATE_QUALITY_AUDIT_MAX_TOKENS})."
         ),
     )
-    translate_local_parser.add_argument(
+    parser.add_argument(
         "--quality-repair-max-tokens",
-        type=int,
+        type=cli_positive_int,
         default=DEFAULT_LOCAL_TRANSLATE_QUALITY_REPAIR_MAX_TOKENS,
         help=(
             "Quality repair max_tokens "
             f"(default: {DEFAULT_LOCAL_TRANSLATE_QUALITY_REPAIR_MAX_TOKENS})."
         ),
     )
-    translate_local_parser.add_argument("--dry-run", action="store_true")
+    parser.add_argument("--dry-run", action="store_true")
 
-    ytdlp_check_parser = subparsers.add_parser(
-        "ytdlp-check",
-        help="Check whether configured yt-dlp is current and record the result",
-    )
-    ytdlp_check_parser.add_argument("--config", type=Path, default=DEFAULT_CONFIG)
-    ytdlp_check_parser.add_argument("--ledger-db", type=Path)
-    ytdlp_check_parser.add_argument(
+
+def add_ytdlp_check_command_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
         "--mode",
         choices=["auto", "uv", "brew", "off"],
         default="auto",
         help="Freshness check mode (default: auto).",
     )
-    ytdlp_check_parser.add_argument(
+    parser.add_argument(
         "--trigger",
         choices=["manual", "daily", "weekly", "sync", "backfill"],
         default="manual",
         help="Caller label stored in history (default: manual).",
     )
-    ytdlp_check_parser.add_argument(
+    parser.add_argument(
         "--fail-if-outdated",
         action="store_true",
         help="Return non-zero when yt-dlp is outdated.",
     )
 
-    ytdlp_update_parser = subparsers.add_parser(
-        "ytdlp-update",
-        help="Update configured yt-dlp runtime and record the result",
-    )
-    ytdlp_update_parser.add_argument("--config", type=Path, default=DEFAULT_CONFIG)
-    ytdlp_update_parser.add_argument("--ledger-db", type=Path)
-    ytdlp_update_parser.add_argument(
+
+def add_ytdlp_update_command_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
         "--mode",
         choices=["auto", "uv", "brew", "off"],
         default="auto",
         help="Update mode (default: auto).",
     )
-    ytdlp_update_parser.add_argument(
+    parser.add_argument(
         "--trigger",
         choices=["manual", "daily", "weekly", "sync", "backfill"],
         default="manual",
         help="Caller label stored in history (default: manual).",
     )
-    ytdlp_update_parser.add_argument(
+    parser.add_argument(
         "--uv-with-curl-cffi",
         dest="uv_with_curl_cffi",
         action="store_true",
         help="Install/update uv tool with curl-cffi support.",
     )
-    ytdlp_update_parser.add_argument(
+    parser.add_argument(
         "--no-uv-with-curl-cffi",
         dest="uv_with_curl_cffi",
         action="store_false",
         help="Install/update uv tool without curl-cffi.",
     )
-    ytdlp_update_parser.set_defaults(uv_with_curl_cffi=True)
+    parser.set_defaults(uv_with_curl_cffi=True)
+
 
-    web_parser = subparsers.add_parser(
-        "web",
-        help="Run local TikTok-style study web UI",
+def add_web_command_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--host", default=DEFAULT_WEB_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_WEB_PORT)
+    parser.add_argument(
+        "--max-workers",
+        type=cli_positive_int,
+        default=DEFAULT_WEB_MAX_WORKERS,
+        help=(
+            f"Request worker threads (default: {DEFAULT_WEB_MAX_WORKERS}). "
+            "Each open media stream holds one until the client stops reading."
+        ),
     )
-    web_parser.add_argument("--config", type=Path, default=DEFAULT_CONFIG)
-    web_parser.add_argument("--source", action="append", dest="sources")
-    web_parser.add_argument("--ledger-db", type=Path)
-    web_parser.add_argument("--host", default=DEFAULT_WEB_HOST)
-    web_parser.add_argument("--port", type=int, default=DEFAULT_WEB_PORT)
+    parser.add_argument(
+        "--reuse-port",
+        action="store_true",
+        help="Set SO_REUSEPORT so several web processes can share one port.",
+    )
+
+
+# Subcommand name -> (help text, argument builder, shared options). Only the invoked
+# command's arguments are registered, so a CLI call does not pay for building every
+# parser. Shared options come from CLI parent parsers (see build_cli_parser).
+CLI_COMMANDS: dict[str, tuple[str, Callable[[argparse.ArgumentParser], None], tuple[str, ...]]] = {
+    "sync": (
+        "Download updates and refresh ledger (incremental by default)",
+        add_sync_command_arguments,
+        ("config", "source", "ledger-db"),
+    ),
+    "backfill": (
+        "Fetch older playlist windows incrementally and advance per-source cursors",
+        add_backfill_command_arguments,
+        ("config", "source", "ledger-db"),
+    ),
+    "queue-worker": (
+        "Lease and process work_items with per-video stage workers",
+        add_queue_worker_command_arguments,
+        ("config", "source", "ledger-db"),
+    ),
+    "ledger": (
+        "Rebuild ledger only",
+        add_ledger_command_arguments,
+        ("config", "source", "ledger-db"),
+    ),
+    "asr": (
+        "Generate ASR subtitles incrementally from local media files",
+        add_asr_command_arguments,
+        ("config", "source", "ledger-db"),
+    ),
+    "downloads": (
+        "Show recent download run logs and pending failures",
+        add_downloads_command_arguments,
+        ("config", "source", "ledger-db"),
+    ),
+    "queue-status": (
+        "Show unresolved queue work items and recent queue failures",
+        add_queue_status_command_arguments,
+        ("config", "source", "ledger-db"),
+    ),
+    "queue-requeue": (
+        "Requeue selected queue work_items (default: status error/dead)",
+        add_queue_requeue_command_arguments,
+        ("config", "source", "ledger-db"),
+    ),
+    "queue-recover-known": (
+        "Requeue known recoverable queue failures with predefined filters",
+        add_queue_recover_known_command_arguments,
+        ("config", "source", "ledger-db"),
+    ),
+    "loudness": (
+        "Analyze per-video loudness and store normalization gain",
+        add_loudness_command_arguments,
+        ("config", "source", "ledger-db"),
+    ),
+    "dict-index": (
+        "Index EIJIRO dictionary entries into SQLite for hover lookup",
+        add_dict_index_command_arguments,
+        ("config", "source", "ledger-db"),
+    ),
+    "dict-bookmarks-export": (
+        "Export dictionary bookmarks for LLM/review workflows",
+        add_dict_bookmarks_export_command_arguments,
+        ("config", "source", "ledger-db"),
+    ),
+    "dict-bookmarks-import": (
+        "Import dictionary bookmarks from JSONL/CSV with duplicate policy control",
+        add_dict_bookmarks_import_command_arguments,
+        ("config", "source", "ledger-db"),
+    ),
+    "dict-bookmarks-curate": (
+        "Materialize curated dictionary bookmark views for review/study",
+        add_dict_bookmarks_curate_command_arguments,
+        ("config", "source", "ledger-db"),
+    ),
+    "notify": (
+        "Send local study notifications (review / LLM-updated unread)",
+        add_notify_command_arguments,
+        ("config", "source", "ledger-db"),
+    ),
+    "notify-install-macos": (
+        "Install periodic notification scheduler via macOS launchd",
+        add_notify_install_macos_command_arguments,
+        ("config", "source", "ledger-db"),
+    ),
+    "notify-uninstall-macos": (
+        "Uninstall periodic notification LaunchAgent on macOS",
+        add_notify_uninstall_macos_command_arguments,
+        ("config", "source"),
+    ),
+    "translate-local": (
+        "Translate subtitles with local multi-stage LLM pipeline (20b draft + 120b refinements)",
+        add_translate_local_command_arguments,
+        ("config", "source", "ledger-db"),
+    ),
+    "ytdlp-check": (
+        "Check whether configured yt-dlp is current and record the result",
+        add_ytdlp_check_command_arguments,
+        ("config", "ledger-db"),
+    ),
+    "ytdlp-update": (
+        "Update configured yt-dlp runtime and record the result",
+        add_ytdlp_update_command_arguments,
+        ("config", "ledger-db"),
+    ),
+    "web": (
+        "Run local TikTok-style study web UI",
+        add_web_command_arguments,
+        ("config", "source", "ledger-db"),
+    ),
+}
 
-    return parser.parse_args()
 
+def sniff_cli_command(argv: list[str]) -> str | None:
+    for token in argv:
+        if token.startswith("-"):
+            continue
+        return token if token in CLI_COMMANDS else None
+    return None
 
-def main() -> int:
-    args = parse_args()
 
-    if args.command == "notify-uninstall-macos":
-        try:
-            run_notify_uninstall_macos(
-                label=str(args.label),
-                plist_path=args.plist_path,
-            )
-            return 0
-        except (RuntimeError, OSError, ValueError) as exc:
-            print(f"error: {exc}", file=sys.stderr)
-            return 1
+# Built parsers keyed by the sniffed command (None = every command built).
+CLI_PARSER_CACHE: dict[str | None, argparse.ArgumentParser] = {}
 
-    try:
-        global_config, all_sources = load_config(args.config)
-        sources = select_sources(all_sources, getattr(args, "sources", None))
-        sources = apply_upstream_sub_langs_override(
-            sources,
-            getattr(args, "upstream_sub_langs_override", None),
-        )
-    except (FileNotFoundError, ValueError, KeyError) as exc:
-        print(f"error: {exc}", file=sys.stderr)
-        return 1
 
-    ledger_db_path = resolve_output_path(getattr(args, "ledger_db", None), global_config.ledger_db)
-    ledger_csv_path = resolve_output_path(getattr(args, "ledger_csv", None), global_config.ledger_csv)
+def clear_cli_parser_cache() -> None:
+    CLI_PARSER_CACHE.clear()
 
-    if args.command == "sync":
-        if bool(getattr(args, "require_current_ytdlp", False)):
-            try:
-                ensure_current_ytdlp(
-                    db_path=ledger_db_path,
-                    config_path=resolve_output_path(args.config, DEFAULT_CONFIG),
-                    mode=str(getattr(args, "ytdlp_check_mode", "auto") or "auto"),
-                    trigger="sync",
-                )
-            except RuntimeError as exc:
-                print(f"error: {exc}", file=sys.stderr)
-                return 1
-        source_order_mode = normalize_source_order_mode(
-            getattr(args, "source_order", None) or global_config.source_order,
-            fallback="random",
-        )
-        run_sources = order_sources_for_run(
-            sources=sources,
-            mode=source_order_mode,
-            command_name="sync",
-        )
-        effective_skip_media, _network_decision = resolve_skip_media_with_network_profile(
-            command_name="sync",
-            explicit_skip_media=bool(args.skip_media),
-            network_profile=str(args.network_profile or "normal"),
-            network_probe_url=str(args.network_probe_url or DEFAULT_NETWORK_PROBE_URL),
-            network_probe_timeout_sec=max(2, int(args.network_probe_timeout_sec)),
-            network_probe_bytes=max(1024, int(args.network_probe_bytes)),
-            weak_net_min_kbps=max(50.0, float(args.weak_net_min_kbps)),
-            weak_net_max_rtt_ms=max(50.0, float(args.weak_net_max_rtt_ms)),
-        )
-        metered_media_mode = normalize_metered_media_mode(
-            getattr(args, "metered_media_mode", DEFAULT_METERED_MEDIA_MODE),
-            DEFAULT_METERED_MEDIA_MODE,
+
+def build_cli_parser(selected_command: str | None) -> argparse.ArgumentParser:
+    cached = CLI_PARSER_CACHE.get(selected_command)
+    if cached is not None:
+        return cached
+
+    # argparse is only needed for CLI runs; importing the module for the web UI or
+    # tests should not pay for it.
+    import argparse
+
+    config_parent = argparse.ArgumentParser(add_help=False)
+    config_parent.add_argument("--config", type=Path, default=DEFAULT_CONFIG)
+    source_parent = argparse.ArgumentParser(add_help=False)
+    source_parent.add_argument("--source", action="append", dest="sources")
+    ledger_db_parent = argparse.ArgumentParser(add_help=False)
+    ledger_db_parent.add_argument("--ledger-db", type=Path)
+    parents_by_option = {
+        "config": config_parent,
+        "source": source_parent,
+        "ledger-db": ledger_db_parent,
+    }
+
+    parser = argparse.ArgumentParser(description="Substudy sync and ledger tool")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    for command_name, (help_text, add_arguments, shared_options) in CLI_COMMANDS.items():
+        if selected_command is not None and command_name != selected_command:
+            subparsers.add_parser(command_name, help=help_text)
+            continue
+        command_parser = subparsers.add_parser(
+            command_name,
+            help=help_text,
+            parents=[parents_by_option[option] for option in shared_options],
         )
-        metered_min_archive_ids = max(0, int(getattr(args, "metered_min_archive_ids", DEFAULT_METERED_MIN_ARCHIVE_IDS)))
-        metered_playlist_end = max(1, int(getattr(args, "metered_playlist_end", DEFAULT_METERED_PLAYLIST_END)))
-        execution_mode = str(getattr(args, "execution_mode", "legacy") or "legacy").strip().lower()
-        if execution_mode == "queue":
-            try:
-                lock_enabled = not bool(getattr(args, "no_producer_lock", False)) and not bool(
-                    args.dry_run
-                )
-                if bool(getattr(args, "no_producer_lock", False)) and not bool(args.dry_run):
-                    print("[producer-lock] disabled by --no-producer-lock")
-                with queue_producer_lock(
-                    get_queue_producer_lock_path(ledger_db_path),
-                    enabled=lock_enabled,
-                ):
-                    if args.dry_run:
-                        queue_db_path = ":memory:"
-                    else:
-                        ledger_db_path.parent.mkdir(parents=True, exist_ok=True)
-                        queue_db_path = str(ledger_db_path)
+        add_arguments(command_parser)
+    CLI_PARSER_CACHE[selected_command] = parser
+    return parser
 
-                    queue_connection = sqlite3.connect(queue_db_path, timeout=30)
-                    if queue_db_path != ":memory:":
-                        queue_connection.execute("PRAGMA journal_mode=WAL")
-                    create_schema(queue_connection)
-                    try:
-                        if bool(args.skip_media):
-                            print("[sync-queue] media discovery skipped by explicit --skip-media")
-                        else:
-                            source_priority_stride = max(1, len(run_sources))
-                            for source_index, source in enumerate(run_sources):
-                                source_playlist_end = source.playlist_end
-                                if metered_media_mode == "updates-only":
-                                    media_archive_count = len(read_archive_ids(source.media_archive))
-                                    (
-                                        skip_by_metered,
-                                        _force_break_on_existing,
-                                        source_playlist_end,
-                                        metered_reason,
-                                    ) = resolve_metered_media_policy(
-                                        source_id=source.id,
-                                        mode=metered_media_mode,
-                                        media_archive_count=media_archive_count,
-                                        configured_playlist_end=source.playlist_end,
-                                        min_archive_ids=metered_min_archive_ids,
-                                        metered_playlist_end=metered_playlist_end,
-                                    )
-                                    print(f"[sync-queue] {metered_reason}")
-                                    if skip_by_metered:
-                                        continue
-                                try:
-                                    enqueue_source_media_discovery(
-                                        connection=queue_connection,
-                                        source=source,
-                                        dry_run=bool(args.dry_run),
-                                        run_label="sync-queue",
-                                        playlist_start=1,
-                                        playlist_end=source_playlist_end,
-                                        enforce_poll_interval=True,
-                                        source_slot=source_index,
-                                        source_stride=source_priority_stride,
-                                    )
-                                except Exception as exc:
-                                    print(
-                                        f"[sync-queue] {source.id}: discovery failed ({exc})",
-                                        file=sys.stderr,
-                                    )
-                    finally:
-                        queue_connection.close()
-
-                if not args.skip_ledger and not args.dry_run:
-                    print("[sync-queue] skip ledger rebuild (no media/subs/meta files were downloaded)")
-                elif args.dry_run and not args.skip_ledger:
-                    print("dry-run: skip ledger rebuild")
-                return 0
-            except ProducerLockAcquisitionError as exc:
-                print(f"error: {exc}", file=sys.stderr)
-                return 2
-
-        sync_connection: sqlite3.Connection | None = None
-        if not args.dry_run:
-            ledger_db_path.parent.mkdir(parents=True, exist_ok=True)
-            sync_connection = sqlite3.connect(str(ledger_db_path), timeout=30)
-            sync_connection.execute("PRAGMA journal_mode=WAL")
-            create_schema(sync_connection)
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    raw_argv = sys.argv[1:] if argv is None else list(argv)
+    return build_cli_parser(sniff_cli_command(raw_argv)).parse_args(raw_argv)
+
+
+@dataclass
+class CliCommandContext:
+    global_config: GlobalConfig
+    sources: list[SourceConfig]
+    source_ids: list[str]
+    ledger_db_path: Path
+    ledger_csv_path: Path
+
+
+def run_sync_command(args: argparse.Namespace, context: CliCommandContext) -> int:
+    if bool(getattr(args, "require_current_ytdlp", False)):
         try:
-            sync_stage_limit = normalize_optional_stage_limit(getattr(args, "limit", None))
-            run_legacy_sync_sources(
-                sources=run_sources,
-                dry_run=bool(args.dry_run),
-                skip_media=bool(effective_skip_media),
-                skip_subs=bool(args.skip_subs),
-                skip_meta=bool(args.skip_meta),
-                connection=sync_connection,
-                metered_media_mode=metered_media_mode,
-                metered_min_archive_ids=metered_min_archive_ids,
-                metered_playlist_end=metered_playlist_end,
-                limit=sync_stage_limit,
-            )
-        finally:
-            if sync_connection is not None:
-                sync_connection.close()
-
-        if not args.skip_ledger and not args.dry_run:
-            build_ledger(
-                run_sources,
-                ledger_db_path,
-                ledger_csv_path,
-                incremental=not args.full_ledger,
+            ensure_current_ytdlp(
+                db_path=context.ledger_db_path,
+                config_path=resolve_output_path(args.config, DEFAULT_CONFIG),
+                mode=str(getattr(args, "ytdlp_check_mode", "auto") or "auto"),
+                trigger="sync",
             )
-        elif args.dry_run and not args.skip_ledger:
-            print("dry-run: skip ledger rebuild")
-        return 0
-
-    if args.command == "backfill":
-        if bool(getattr(args, "require_current_ytdlp", False)):
-            try:
-                ensure_current_ytdlp(
-                    db_path=ledger_db_path,
-                    config_path=resolve_output_path(args.config, DEFAULT_CONFIG),
-                    mode=str(getattr(args, "ytdlp_check_mode", "auto") or "auto"),
-                    trigger="backfill",
-                )
-            except RuntimeError as exc:
-                print(f"error: {exc}", file=sys.stderr)
-                return 1
-        source_order_mode = normalize_source_order_mode(
-            getattr(args, "source_order", None) or global_config.source_order,
-            fallback="random",
-        )
-        run_sources = order_sources_for_run(
-            sources=sources,
-            mode=source_order_mode,
-            command_name="backfill",
-        )
-        effective_skip_media, _network_decision = resolve_skip_media_with_network_profile(
-            command_name="backfill",
-            explicit_skip_media=bool(args.skip_media),
-            network_profile=str(args.network_profile or "normal"),
-            network_probe_url=str(args.network_probe_url or DEFAULT_NETWORK_PROBE_URL),
-            network_probe_timeout_sec=max(2, int(args.network_probe_timeout_sec)),
-            network_probe_bytes=max(1024, int(args.network_probe_bytes)),
-            weak_net_min_kbps=max(50.0, float(args.weak_net_min_kbps)),
-            weak_net_max_rtt_ms=max(50.0, float(args.weak_net_max_rtt_ms)),
-        )
-        metered_media_mode = normalize_metered_media_mode(
-            getattr(args, "metered_media_mode", DEFAULT_METERED_MEDIA_MODE),
-            DEFAULT_METERED_MEDIA_MODE,
-        )
-        metered_min_archive_ids = max(0, int(getattr(args, "metered_min_archive_ids", DEFAULT_METERED_MIN_ARCHIVE_IDS)))
-        metered_playlist_end = max(1, int(getattr(args, "metered_playlist_end", DEFAULT_METERED_PLAYLIST_END)))
-        execution_mode = str(getattr(args, "execution_mode", "legacy") or "legacy").strip().lower()
+        except RuntimeError as exc:
+            print(f"error: {exc}", file=sys.stderr)
+            return 1
+    source_order_mode = normalize_source_order_mode(
+        getattr(args, "source_order", None) or context.global_config.source_order,
+        fallback="random",
+    )
+    run_sources = order_sources_for_run(
+        sources=context.sources,
+        mode=source_order_mode,
+        command_name="sync",
+    )
+    effective_skip_media, _network_decision = resolve_skip_media_with_network_profile(
+        command_name="sync",
+        explicit_skip_media=args.skip_media,
+        network_profile=str(args.network_profile or "normal"),
+        network_probe_url=str(args.network_probe_url or DEFAULT_NETWORK_PROBE_URL),
+        network_probe_timeout_sec=max(2, args.network_probe_timeout_sec),
+        network_probe_bytes=max(1024, args.network_probe_bytes),
+        weak_net_min_kbps=max(50.0, args.weak_net_min_kbps),
+        weak_net_max_rtt_ms=max(50.0, args.weak_net_max_rtt_ms),
+    )
+    metered_media_mode = normalize_metered_media_mode(
+        getattr(args, "metered_media_mode", DEFAULT_METERED_MEDIA_MODE),
+        DEFAULT_METERED_MEDIA_MODE,
+    )
+    metered_min_archive_ids = max(0, int(getattr(args, "metered_min_archive_ids", DEFAULT_METERED_MIN_ARCHIVE_IDS)))
+    metered_playlist_end = max(1, int(getattr(args, "metered_playlist_end", DEFAULT_METERED_PLAYLIST_END)))
+    execution_mode = str(getattr(args, "execution_mode", "legacy") or "legacy").strip().lower()
+    if execution_mode == "queue":
         try:
-            lock_enabled = (
-                execution_mode == "queue"
-                and not bool(getattr(args, "no_producer_lock", False))
-                and not bool(args.dry_run)
+            lock_enabled = not bool(getattr(args, "no_producer_lock", False)) and not bool(
+                args.dry_run
             )
-            if execution_mode == "queue" and bool(getattr(args, "no_producer_lock", False)) and not bool(args.dry_run):
+            if bool(getattr(args, "no_producer_lock", False)) and not args.dry_run:
                 print("[producer-lock] disabled by --no-producer-lock")
             with queue_producer_lock(
-                get_queue_producer_lock_path(ledger_db_path),
+                get_queue_producer_lock_path(context.ledger_db_path),
                 enabled=lock_enabled,
             ):
-                run_backfill(
-                    sources=run_sources,
-                    db_path=ledger_db_path,
-                    csv_path=ledger_csv_path,
-                    dry_run=args.dry_run,
-                    skip_media=effective_skip_media,
-                    skip_subs=args.skip_subs,
-                    skip_meta=args.skip_meta,
-                    skip_ledger=args.skip_ledger,
-                    full_ledger=args.full_ledger,
-                    windows_override=args.windows,
-                    reset=args.reset,
-                    execution_mode=execution_mode,
-                    metered_media_mode=metered_media_mode,
-                    metered_min_archive_ids=metered_min_archive_ids,
-                    metered_playlist_end=metered_playlist_end,
-                )
+                if args.dry_run:
+                    queue_db_path = ":memory:"
+                else:
+                    context.ledger_db_path.parent.mkdir(parents=True, exist_ok=True)
+                    queue_db_path = str(context.ledger_db_path)
+
+                queue_connection = connect_ledger_writer(queue_db_path)
+                create_schema(queue_connection)
+                try:
+                    if args.skip_media:
+                        print("[sync-queue] media discovery skipped by explicit --skip-media")
+                    else:
+                        source_priority_stride = max(1, len(run_sources))
+                        for source_index, source in enumerate(run_sources):
+                            source_playlist_end = source.playlist_end
+                            if metered_media_mode == "updates-only":
+                                media_archive_count = len(read_archive_ids(source.media_archive))
+                                (
+                                    skip_by_metered,
+                                    _force_break_on_existing,
+                                    source_playlist_end,
+                                    metered_reason,
+                                ) = resolve_metered_media_policy(
+                                    source_id=source.id,
+                                    mode=metered_media_mode,
+                                    media_archive_count=media_archive_count,
+                                    configured_playlist_end=source.playlist_end,
+                                    min_archive_ids=metered_min_archive_ids,
+                                    metered_playlist_end=metered_playlist_end,
+                                )
+                                print(f"[sync-queue] {metered_reason}")
+                                if skip_by_metered:
+                                    continue
+                            try:
+                                enqueue_source_media_discovery(
+                                    connection=queue_connection,
+                                    source=source,
+                                    dry_run=args.dry_run,
+                                    run_label="sync-queue",
+                                    playlist_start=1,
+                                    playlist_end=source_playlist_end,
+                                    enforce_poll_interval=True,
+                                    source_slot=source_index,
+                                    source_stride=source_priority_stride,
+                                )
+                            except Exception as exc:
+                                print(
+                                    f"[sync-queue] {source.id}: discovery failed ({exc})",
+                                    file=sys.stderr,
+                                )
+                finally:
+                    queue_connection.close()
+
+            if not args.skip_ledger and not args.dry_run:
+                print("[sync-queue] skip ledger rebuild (no media/subs/meta files were downloaded)")
+            elif args.dry_run and not args.skip_ledger:
+                print("dry-run: skip ledger rebuild")
             return 0
         except ProducerLockAcquisitionError as exc:
             print(f"error: {exc}", file=sys.stderr)
             return 2
 
-    if args.command == "queue-worker":
-        run_queue_worker(
-            sources=sources,
-            db_path=ledger_db_path,
-            stages=getattr(args, "stages", None),
-            worker_id=getattr(args, "worker_id", None),
-            lease_seconds=max(30, int(args.lease_sec)),
-            poll_interval_sec=max(0.2, float(args.poll_sec)),
-            max_items=max(0, int(args.max_items)),
-            once=bool(args.once),
-            dry_run=bool(args.dry_run),
-            max_attempts=max(1, int(args.max_attempts)),
-            enqueue_downstream=not bool(getattr(args, "no_enqueue_downstream", False)),
-            translate_target_lang=str(getattr(args, "translate_target_lang", "ja-local") or "ja-local"),
-            translate_source_track=str(getattr(args, "translate_source_track", "auto") or "auto"),
-            translate_timeout_sec=max(10, int(getattr(args, "translate_timeout_sec", 60))),
+    sync_connection: sqlite3.Connection | None = None
+    if not args.dry_run:
+        context.ledger_db_path.parent.mkdir(parents=True, exist_ok=True)
+        sync_connection = connect_ledger_writer(context.ledger_db_path)
+        create_schema(sync_connection)
+    try:
+        sync_stage_limit = normalize_optional_stage_limit(getattr(args, "limit", None))
+        run_legacy_sync_sources(
+            sources=run_sources,
+            dry_run=args.dry_run,
+            skip_media=bool(effective_skip_media),
+            skip_subs=args.skip_subs,
+            skip_meta=args.skip_meta,
+            connection=sync_connection,
+            metered_media_mode=metered_media_mode,
+            metered_min_archive_ids=metered_min_archive_ids,
+            metered_playlist_end=metered_playlist_end,
+            limit=sync_stage_limit,
         )
-        return 0
+    finally:
+        if sync_connection is not None:
+            sync_connection.close()
 
-    if args.command == "ledger":
+    if not args.skip_ledger and not args.dry_run:
         build_ledger(
-            sources,
-            ledger_db_path,
-            ledger_csv_path,
-            incremental=args.incremental,
+            run_sources,
+            context.ledger_db_path,
+            context.ledger_csv_path,
+            incremental=not args.full_ledger,
         )
-        return 0
+    elif args.dry_run and not args.skip_ledger:
+        print("dry-run: skip ledger rebuild")
+    return 0
 
-    if args.command == "asr":
-        run_asr(
-            sources=sources,
-            db_path=ledger_db_path,
-            csv_path=ledger_csv_path,
-            dry_run=args.dry_run,
-            force=args.force,
-            max_per_source_override=args.max_per_source,
-        )
-        return 0
 
-    if args.command == "downloads":
-        show_download_report(
-            sources=sources,
-            db_path=ledger_db_path,
-            since_hours=max(1, args.since_hours),
-            limit=max(1, args.limit),
+def run_backfill_command(args: argparse.Namespace, context: CliCommandContext) -> int:
+    if bool(getattr(args, "require_current_ytdlp", False)):
+        try:
+            ensure_current_ytdlp(
+                db_path=context.ledger_db_path,
+                config_path=resolve_output_path(args.config, DEFAULT_CONFIG),
+                mode=str(getattr(args, "ytdlp_check_mode", "auto") or "auto"),
+                trigger="backfill",
+            )
+        except RuntimeError as exc:
+            print(f"error: {exc}", file=sys.stderr)
+            return 1
+    source_order_mode = normalize_source_order_mode(
+        getattr(args, "source_order", None) or context.global_config.source_order,
+        fallback="random",
+    )
+    run_sources = order_sources_for_run(
+        sources=context.sources,
+        mode=source_order_mode,
+        command_name="backfill",
+    )
+    effective_skip_media, _network_decision = resolve_skip_media_with_network_profile(
+        command_name="backfill",
+        explicit_skip_media=args.skip_media,
+        network_profile=str(args.network_profile or "normal"),
+        network_probe_url=str(args.network_probe_url or DEFAULT_NETWORK_PROBE_URL),
+        network_probe_timeout_sec=max(2, args.network_probe_timeout_sec),
+        network_probe_bytes=max(1024, args.network_probe_bytes),
+        weak_net_min_kbps=max(50.0, args.weak_net_min_kbps),
+        weak_net_max_rtt_ms=max(50.0, args.weak_net_max_rtt_ms),
+    )
+    metered_media_mode = normalize_metered_media_mode(
+        getattr(args, "metered_media_mode", DEFAULT_METERED_MEDIA_MODE),
+        DEFAULT_METERED_MEDIA_MODE,
+    )
+    metered_min_archive_ids = max(0, int(getattr(args, "metered_min_archive_ids", DEFAULT_METERED_MIN_ARCHIVE_IDS)))
+    metered_playlist_end = max(1, int(getattr(args, "metered_playlist_end", DEFAULT_METERED_PLAYLIST_END)))
+    execution_mode = str(getattr(args, "execution_mode", "legacy") or "legacy").strip().lower()
+    try:
+        lock_enabled = (
+            execution_mode == "queue"
+            and not bool(getattr(args, "no_producer_lock", False))
+            and not args.dry_run
         )
+        if execution_mode == "queue" and bool(getattr(args, "no_producer_lock", False)) and not args.dry_run:
+            print("[producer-lock] disabled by --no-producer-lock")
+        with queue_producer_lock(
+            get_queue_producer_lock_path(context.ledger_db_path),
+            enabled=lock_enabled,
+        ):
+            run_backfill(
+                sources=run_sources,
+                db_path=context.ledger_db_path,
+                csv_path=context.ledger_csv_path,
+                dry_run=args.dry_run,
+                skip_media=effective_skip_media,
+                skip_subs=args.skip_subs,
+                skip_meta=args.skip_meta,
+                skip_ledger=args.skip_ledger,
+                full_ledger=args.full_ledger,
+                windows_override=args.windows,
+                reset=args.reset,
+                execution_mode=execution_mode,
+                metered_media_mode=metered_media_mode,
+                metered_min_archive_ids=metered_min_archive_ids,
+                metered_playlist_end=metered_playlist_end,
+            )
         return 0
+    except ProducerLockAcquisitionError as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 2
 
-    if args.command == "queue-status":
-        show_queue_status_report(
-            sources=sources,
-            db_path=ledger_db_path,
-            limit=max(1, args.limit),
-            only_unresolved=bool(getattr(args, "only_unresolved", False)),
-        )
-        return 0
 
-    if args.command == "queue-requeue":
-        requeue_work_items(
-            sources=sources,
-            db_path=ledger_db_path,
-            stages=getattr(args, "stages", None),
-            statuses=getattr(args, "statuses", None),
-            error_contains=str(getattr(args, "error_contains", "") or "").strip() or None,
-            limit=max(0, int(args.limit)),
-            dry_run=bool(args.dry_run),
-            reset_attempts=bool(getattr(args, "reset_attempts", False)),
-        )
-        return 0
+def run_queue_worker_command(args: argparse.Namespace, context: CliCommandContext) -> int:
+    run_queue_worker(
+        sources=context.sources,
+        db_path=context.ledger_db_path,
+        stages=getattr(args, "stages", None),
+        worker_id=getattr(args, "worker_id", None),
+        lease_seconds=max(30, args.lease_sec),
+        poll_interval_sec=max(0.2, args.poll_sec),
+        max_items=args.max_items,
+        once=args.once,
+        dry_run=args.dry_run,
+        max_attempts=args.max_attempts,
+        enqueue_downstream=not bool(getattr(args, "no_enqueue_downstream", False)),
+        translate_target_lang=str(getattr(args, "translate_target_lang", "ja-local") or "ja-local"),
+        translate_source_track=str(getattr(args, "translate_source_track", "auto") or "auto"),
+        translate_timeout_sec=max(10, int(getattr(args, "translate_timeout_sec", 60))),
+    )
+    return 0
 
-    if args.command == "queue-recover-known":
-        run_queue_recover_known(
-            sources=sources,
-            db_path=ledger_db_path,
-            profiles=getattr(args, "profiles", None),
-            limit=max(0, int(args.limit)),
-            dry_run=bool(args.dry_run),
-            reset_attempts=bool(getattr(args, "reset_attempts", False)),
-        )
-        return 0
 
-    if args.command == "loudness":
-        try:
-            run_loudness(
-                sources=sources,
-                db_path=ledger_db_path,
-                target_lufs=float(args.target_lufs),
-                max_boost_db=max(0.0, float(args.max_boost_db)),
-                max_cut_db=max(0.0, float(args.max_cut_db)),
-                limit=max(1, int(args.limit)),
-                force=bool(args.force),
-                ffmpeg_bin=str(args.ffmpeg_bin),
-            )
-            return 0
-        except KeyboardInterrupt:
-            print(
-                "[loudness] interrupted by user. "
-                "Processed rows are already committed.",
-                file=sys.stderr,
-            )
-            return 130
+def run_ledger_command(args: argparse.Namespace, context: CliCommandContext) -> int:
+    build_ledger(
+        context.sources,
+        context.ledger_db_path,
+        context.ledger_csv_path,
+        incremental=args.incremental,
+    )
+    return 0
 
-    if args.command == "dict-index":
-        dictionary_path = resolve_output_path(
-            args.dictionary_path,
-            DEFAULT_DICT_PATH,
-        )
-        run_dict_index(
-            db_path=ledger_db_path,
-            dictionary_path=dictionary_path,
-            source_name=str(args.source_name),
-            encoding=str(args.encoding),
-            clear_existing=not bool(args.no_clear),
-            max_lines=None if int(args.max_lines) <= 0 else int(args.max_lines),
-        )
-        return 0
 
-    if args.command == "dict-bookmarks-export":
-        export_format = str(args.format).strip().lower()
-        entry_status = str(args.entry_status).strip().lower()
-        timestamp_utc = dt.datetime.now(dt.timezone.utc).strftime("%Y%m%dT%H%M%SZ")
-        default_output = DEFAULT_DICT_BOOKMARK_EXPORT_DIR / (
-            f"dictionary_bookmarks_{entry_status}_{timestamp_utc}.{export_format}"
-        )
-        output_path = resolve_output_path(args.output, default_output)
-        run_dict_bookmarks_export(
-            db_path=ledger_db_path,
-            source_ids=[source.id for source in sources],
-            output_path=output_path,
-            output_format=export_format,
-            entry_status=entry_status,
-            limit=max(0, int(args.limit)),
-            video_ids=args.video_ids,
-        )
-        return 0
+def run_asr_command(args: argparse.Namespace, context: CliCommandContext) -> int:
+    run_asr(
+        sources=context.sources,
+        db_path=context.ledger_db_path,
+        csv_path=context.ledger_csv_path,
+        dry_run=args.dry_run,
+        force=args.force,
+        max_per_source_override=args.max_per_source,
+    )
+    return 0
 
-    if args.command == "dict-bookmarks-import":
-        input_path = resolve_output_path(args.input, args.input)
-        run_dict_bookmarks_import(
-            db_path=ledger_db_path,
-            source_ids=[source.id for source in sources],
-            input_path=input_path,
-            input_format=str(args.format).strip().lower(),
-            on_duplicate=str(args.on_duplicate).strip().lower(),
-            dry_run=bool(args.dry_run),
-        )
-        return 0
 
-    if args.command == "dict-bookmarks-curate":
-        preset = str(args.preset).strip().lower()
-        output_format = str(args.format).strip().lower()
-        timestamp_utc = dt.datetime.now(dt.timezone.utc).strftime("%Y%m%dT%H%M%SZ")
-        default_output = DEFAULT_DICT_BOOKMARK_EXPORT_DIR / (
-            f"dictionary_bookmarks_{preset}_{timestamp_utc}.{output_format}"
-        )
-        output_path = resolve_output_path(args.output, default_output)
-        run_dict_bookmarks_curate(
-            db_path=ledger_db_path,
-            source_ids=[source.id for source in sources],
-            preset=preset,
-            output_path=output_path,
-            output_format=output_format,
-            limit=max(1, int(args.limit)),
-            min_bookmarks=max(1, int(args.min_bookmarks)),
-            min_videos=max(1, int(args.min_videos)),
-        )
-        return 0
+def run_downloads_command(args: argparse.Namespace, context: CliCommandContext) -> int:
+    show_download_report(
+        sources=context.sources,
+        db_path=context.ledger_db_path,
+        since_hours=args.since_hours,
+        limit=args.limit,
+    )
+    return 0
 
-    if args.command == "notify":
-        run_notify(
-            db_path=ledger_db_path,
-            source_ids=[source.id for source in sources],
-            kind=str(args.kind).strip().lower(),
-            web_url_base=str(args.web_url_base),
-            llm_lookback_hours=max(1, int(args.llm_lookback_hours)),
-            dry_run=bool(args.dry_run),
-        )
-        return 0
 
-    if args.command == "notify-install-macos":
-        try:
-            run_notify_install_macos(
-                label=str(args.label),
-                interval_minutes=max(1, int(args.interval_minutes)),
-                python_bin=str(args.python_bin),
-                script_path=resolve_output_path(args.script_path, Path(__file__).resolve()),
-                config_path=resolve_output_path(args.config, DEFAULT_CONFIG),
-                ledger_db_path=resolve_output_path(getattr(args, "ledger_db", None), ledger_db_path),
-                source_ids=[source.id for source in sources],
-                kind=str(args.kind).strip().lower(),
-                web_url_base=str(args.web_url_base),
-                llm_lookback_hours=max(1, int(args.llm_lookback_hours)),
-                plist_path=args.plist_path,
-                load_now=not bool(args.no_load),
-            )
-            return 0
-        except (RuntimeError, OSError, ValueError) as exc:
-            print(f"error: {exc}", file=sys.stderr)
-            return 1
+def run_queue_status_command(args: argparse.Namespace, context: CliCommandContext) -> int:
+    show_queue_status_report(
+        sources=context.sources,
+        db_path=context.ledger_db_path,
+        limit=args.limit,
+        only_unresolved=bool(getattr(args, "only_unresolved", False)),
+    )
+    return 0
+
+
+def run_queue_requeue_command(args: argparse.Namespace, context: CliCommandContext) -> int:
+    requeue_work_items(
+        sources=context.sources,
+        db_path=context.ledger_db_path,
+        stages=getattr(args, "stages", None),
+        statuses=getattr(args, "statuses", None),
+        error_contains=str(getattr(args, "error_contains", "") or "").strip() or None,
+        limit=args.limit,
+        dry_run=args.dry_run,
+        reset_attempts=bool(getattr(args, "reset_attempts", False)),
+    )
+    return 0
+
+
+def run_queue_recover_known_command(args: argparse.Namespace, context: CliCommandContext) -> int:
+    run_queue_recover_known(
+        sources=context.sources,
+        db_path=context.ledger_db_path,
+        profiles=getattr(args, "profiles", None),
+        limit=args.limit,
+        dry_run=args.dry_run,
+        reset_attempts=bool(getattr(args, "reset_attempts", False)),
+    )
+    return 0
 
-    if args.command == "translate-local":
-        run_translate_local(
-            db_path=ledger_db_path,
-            source_ids=[source.id for source in sources],
-            endpoint=str(args.endpoint),
-            api_key=str(args.api_key or "").strip() or None,
-            source_lang=str(args.source_lang or "en").strip().lower(),
-            target_lang=str(args.target_lang or "ja").strip().lower(),
-            draft_model=str(args.draft_model),
-            refine_model=str(args.refine_model),
-            global_model=str(args.global_model),
-            draft_max_tokens=max(1, int(args.draft_max_tokens)),
-            refine_max_tokens=max(1, int(args.refine_max_tokens)),
-            global_max_tokens=max(1, int(args.global_max_tokens)),
-            temperature=float(args.temperature),
-            top_p=float(args.top_p),
-            chunk_size=max(1, int(args.chunk_size)),
-            global_max_cues=max(1, int(args.global_max_cues)),
-            timeout_sec=max(3, int(args.timeout_sec)),
-            limit=max(0, int(args.limit)),
-            source_track=normalize_translation_source_track(str(args.source_track), "subtitle"),
-            include_translated=bool(args.include_translated),
-            overwrite=bool(args.overwrite),
-            dry_run=bool(args.dry_run),
-            agent=str(args.agent),
-            method=str(args.method),
-            method_version=str(args.method_version),
-            quality_enforce=bool(args.quality_enforce),
-            quality_loop_max_rounds=max(0, int(args.quality_loop_max_rounds)),
-            quality_json_fragment_threshold=max(0.0, float(args.quality_json_fragment_threshold)),
-            quality_english_heavy_threshold=max(0.0, float(args.quality_english_heavy_threshold)),
-            quality_unchanged_threshold=max(0.0, float(args.quality_unchanged_threshold)),
-            quality_audit_model=str(args.quality_audit_model),
-            quality_repair_model=str(args.quality_repair_model),
-            quality_audit_max_tokens=max(1, int(args.quality_audit_max_tokens)),
-            quality_repair_max_tokens=max(1, int(args.quality_repair_max_tokens)),
-            video_ids=args.video_ids,
+
+def run_loudness_command(args: argparse.Namespace, context: CliCommandContext) -> int:
+    try:
+        run_loudness(
+            sources=context.sources,
+            db_path=context.ledger_db_path,
+            target_lufs=args.target_lufs,
+            max_boost_db=args.max_boost_db,
+            max_cut_db=args.max_cut_db,
+            limit=args.limit,
+            force=args.force,
+            ffmpeg_bin=args.ffmpeg_bin,
         )
         return 0
-
-    if args.command == "ytdlp-check":
-        return run_ytdlp_check(
-            db_path=ledger_db_path,
-            config_path=resolve_output_path(args.config, DEFAULT_CONFIG),
-            mode=str(args.mode or "auto"),
-            trigger=str(args.trigger or "manual"),
-            fail_if_outdated=bool(getattr(args, "fail_if_outdated", False)),
+    except KeyboardInterrupt:
+        print(
+            "[loudness] interrupted by user. "
+            "Processed rows are already committed.",
+            file=sys.stderr,
         )
+        return 130
+
+
+def run_dict_index_command(args: argparse.Namespace, context: CliCommandContext) -> int:
+    dictionary_path = resolve_output_path(
+        args.dictionary_path,
+        DEFAULT_DICT_PATH,
+    )
+    run_dict_index(
+        db_path=context.ledger_db_path,
+        dictionary_path=dictionary_path,
+        source_name=args.source_name,
+        encoding=args.encoding,
+        clear_existing=not args.no_clear,
+        max_lines=None if args.max_lines <= 0 else args.max_lines,
+    )
+    return 0
+
+
+def run_dict_bookmarks_export_command(args: argparse.Namespace, context: CliCommandContext) -> int:
+    export_format = args.format
+    entry_status = args.entry_status
+    timestamp_utc = now_utc_compact_stamp()
+    default_output = DEFAULT_DICT_BOOKMARK_EXPORT_DIR / (
+        f"dictionary_bookmarks_{entry_status}_{timestamp_utc}.{export_format}"
+    )
+    output_path = resolve_output_path(args.output, default_output)
+    run_dict_bookmarks_export(
+        db_path=context.ledger_db_path,
+        source_ids=context.source_ids,
+        output_path=output_path,
+        output_format=export_format,
+        entry_status=entry_status,
+        limit=args.limit,
+        video_ids=args.video_ids,
+    )
+    return 0
+
 
-    if args.command == "ytdlp-update":
-        return run_ytdlp_update(
-            db_path=ledger_db_path,
+def run_dict_bookmarks_import_command(args: argparse.Namespace, context: CliCommandContext) -> int:
+    input_path = resolve_output_path(args.input, args.input)
+    run_dict_bookmarks_import(
+        db_path=context.ledger_db_path,
+        source_ids=context.source_ids,
+        input_path=input_path,
+        input_format=args.format,
+        on_duplicate=args.on_duplicate,
+        dry_run=args.dry_run,
+    )
+    return 0
+
+
+def run_dict_bookmarks_curate_command(args: argparse.Namespace, context: CliCommandContext) -> int:
+    preset = args.preset
+    output_format = args.format
+    timestamp_utc = now_utc_compact_stamp()
+    default_output = DEFAULT_DICT_BOOKMARK_EXPORT_DIR / (
+        f"dictionary_bookmarks_{preset}_{timestamp_utc}.{output_format}"
+    )
+    output_path = resolve_output_path(args.output, default_output)
+    run_dict_bookmarks_curate(
+        db_path=context.ledger_db_path,
+        source_ids=context.source_ids,
+        preset=preset,
+        output_path=output_path,
+        output_format=output_format,
+        limit=args.limit,
+        min_bookmarks=args.min_bookmarks,
+        min_videos=args.min_videos,
+    )
+    return 0
+
+
+def run_notify_command(args: argparse.Namespace, context: CliCommandContext) -> int:
+    run_notify(
+        db_path=context.ledger_db_path,
+        source_ids=context.source_ids,
+        kind=args.kind,
+        web_url_base=args.web_url_base,
+        llm_lookback_hours=args.llm_lookback_hours,
+        dry_run=args.dry_run,
+    )
+    return 0
+
+
+def run_notify_install_macos_command(args: argparse.Namespace, context: CliCommandContext) -> int:
+    try:
+        run_notify_install_macos(
+            label=args.label,
+            interval_minutes=args.interval_minutes,
+            python_bin=args.python_bin,
+            script_path=resolve_output_path(args.script_path, SCRIPT_PATH),
             config_path=resolve_output_path(args.config, DEFAULT_CONFIG),
-            mode=str(args.mode or "auto"),
-            trigger=str(args.trigger or "manual"),
-            uv_with_curl_cffi=bool(getattr(args, "uv_with_curl_cffi", True)),
+            ledger_db_path=resolve_output_path(getattr(args, "ledger_db", None), context.ledger_db_path),
+            source_ids=context.source_ids,
+            kind=args.kind,
+            web_url_base=args.web_url_base,
+            llm_lookback_hours=args.llm_lookback_hours,
+            plist_path=args.plist_path,
+            load_now=not args.no_load,
         )
+        return 0
+    except (RuntimeError, OSError, ValueError) as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 1
 
-    if args.command == "web":
-        run_web_ui(
-            db_path=ledger_db_path,
-            source_ids=[source.id for source in sources],
-            config_path=resolve_output_path(args.config, DEFAULT_CONFIG),
-            host=str(args.host),
-            port=max(1, min(65535, int(args.port))),
-            restrict_to_source_ids=bool(args.sources),
+
+def run_translate_local_command(args: argparse.Namespace, context: CliCommandContext) -> int:
+    run_translate_local(
+        db_path=context.ledger_db_path,
+        source_ids=context.source_ids,
+        endpoint=args.endpoint,
+        api_key=str(args.api_key or "").strip() or None,
+        source_lang=str(args.source_lang or "en").strip().lower(),
+        target_lang=str(args.target_lang or "ja").strip().lower(),
+        draft_model=args.draft_model,
+        refine_model=args.refine_model,
+        global_model=args.global_model,
+        draft_max_tokens=args.draft_max_tokens,
+        refine_max_tokens=args.refine_max_tokens,
+        global_max_tokens=args.global_max_tokens,
+        temperature=args.temperature,
+        top_p=args.top_p,
+        chunk_size=args.chunk_size,
+        global_max_cues=args.global_max_cues,
+        timeout_sec=max(3, args.timeout_sec),
+        limit=args.limit,
+        source_track=normalize_translation_source_track(args.source_track, "subtitle"),
+        include_translated=args.include_translated,
+        overwrite=args.overwrite,
+        dry_run=args.dry_run,
+        agent=args.agent,
+        method=args.method,
+        method_version=args.method_version,
+        quality_enforce=args.quality_enforce,
+        quality_loop_max_rounds=args.quality_loop_max_rounds,
+        quality_json_fragment_threshold=args.quality_json_fragment_threshold,
+        quality_english_heavy_threshold=args.quality_english_heavy_threshold,
+        quality_unchanged_threshold=args.quality_unchanged_threshold,
+        quality_audit_model=args.quality_audit_model,
+        quality_repair_model=args.quality_repair_model,
+        quality_audit_max_tokens=args.quality_audit_max_tokens,
+        quality_repair_max_tokens=args.quality_repair_max_tokens,
+        video_ids=args.video_ids,
+    )
+    return 0
+
+
+def run_ytdlp_check_command(args: argparse.Namespace, context: CliCommandContext) -> int:
+    return run_ytdlp_check(
+        db_path=context.ledger_db_path,
+        config_path=resolve_output_path(args.config, DEFAULT_CONFIG),
+        mode=args.mode,
+        trigger=args.trigger,
+        fail_if_outdated=bool(getattr(args, "fail_if_outdated", False)),
+    )
+
+
+def run_ytdlp_update_command(args: argparse.Namespace, context: CliCommandContext) -> int:
+    return run_ytdlp_update(
+        db_path=context.ledger_db_path,
+        config_path=resolve_output_path(args.config, DEFAULT_CONFIG),
+        mode=args.mode,
+        trigger=args.trigger,
+        uv_with_curl_cffi=bool(getattr(args, "uv_with_curl_cffi", True)),
+    )
+
+
+def run_web_command(args: argparse.Namespace, context: CliCommandContext) -> int:
+    run_web_ui(
+        db_path=context.ledger_db_path,
+        source_ids=context.source_ids,
+        config_path=resolve_output_path(args.config, DEFAULT_CONFIG),
+        host=args.host,
+        port=max(1, min(65535, args.port)),
+        restrict_to_source_ids=bool(args.sources),
+        max_workers=args.max_workers,
+        reuse_port=args.reuse_port,
+    )
+    return 0
+
+
+def run_notify_uninstall_macos_command(args: argparse.Namespace) -> int:
+    try:
+        run_notify_uninstall_macos(
+            label=args.label,
+            plist_path=args.plist_path,
         )
         return 0
+    except (RuntimeError, OSError, ValueError) as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 1
+
+
+# Commands that never touch the ledger run before load_config/source selection.
+CLI_CONFIGLESS_COMMAND_HANDLERS: dict[str, Callable[[argparse.Namespace], int]] = {
+    "notify-uninstall-macos": run_notify_uninstall_macos_command,
+}
+
+CLI_COMMAND_HANDLERS: dict[str, Callable[[argparse.Namespace, CliCommandContext], int]] = {
+    "sync": run_sync_command,
+    "backfill": run_backfill_command,
+    "queue-worker": run_queue_worker_command,
+    "ledger": run_ledger_command,
+    "asr": run_asr_command,
+    "downloads": run_downloads_command,
+    "queue-status": run_queue_status_command,
+    "queue-requeue": run_queue_requeue_command,
+    "queue-recover-known": run_queue_recover_known_command,
+    "loudness": run_loudness_command,
+    "dict-index": run_dict_index_command,
+    "dict-bookmarks-export": run_dict_bookmarks_export_command,
+    "dict-bookmarks-import": run_dict_bookmarks_import_command,
+    "dict-bookmarks-curate": run_dict_bookmarks_curate_command,
+    "notify": run_notify_command,
+    "notify-install-macos": run_notify_install_macos_command,
+    "translate-local": run_translate_local_command,
+    "ytdlp-check": run_ytdlp_check_command,
+    "ytdlp-update": run_ytdlp_update_command,
+    "web": run_web_command,
+}
+
+
+def main() -> int:
+    args = parse_args()
 
-    print("error: unsupported command", file=sys.stderr)
-    return 1
+    configless_handler = CLI_CONFIGLESS_COMMAND_HANDLERS.get(args.command)
+    if configless_handler is not None:
+        return configless_handler(args)
+
+    try:
+        global_config, all_sources = load_config(args.config)
+        sources = select_sources(all_sources, getattr(args, "sources", None))
+        sources = apply_upstream_sub_langs_override(
+            sources,
+            getattr(args, "upstream_sub_langs_override", None),
+        )
+    except (FileNotFoundError, ValueError, KeyError) as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 1
 
+    handler = CLI_COMMAND_HANDLERS.get(args.command)
+    if handler is None:
+        print("error: unsupported command", file=sys.stderr)
+        return 1
+    context = CliCommandContext(
+        global_config=global_config,
+        sources=sources,
+        source_ids=[source.id for source in sources],
+        ledger_db_path=resolve_output_path(getattr(args, "ledger_db", None), global_config.ledger_db),
+        ledger_csv_path=resolve_output_path(getattr(args, "ledger_csv", None), global_config.ledger_csv),
+    )
+    return handler(args, context)
 
 if __name__ == "__main__":
     try:
@@ -1,6 +1,8 @@
+import csv
 import importlib.util
 import io
 import json
+import os
 import sqlite3
 import sys
 import tempfile
@@ -38,6 +40,9 @@ class WorkspaceRegressionTests(unittest.TestCase):
         self.db_path = self.workspace_root / "data" / "master_ledger.sqlite"
         self.mod._YTDLP_IMPERSONATE_TARGETS_CACHE.clear()
         self.mod._YTDLP_IMPERSONATE_WARNED_KEYS.clear()
+        self.mod.clear_config_cache()
+        self.mod.clear_sync_scan_cache()
+        self.mod.FFMPEG_TOOL_CACHE.clear()
         connection = sqlite3.connect(str(self.db_path))
         try:
             self.mod.create_schema(connection)
@@ -125,6 +130,12 @@ class WorkspaceRegressionTests(unittest.TestCase):
                 source_id="storiesofcz",
                 video_id="7619999999999999999",
             )
+            connection.row_factory = sqlite3.Row
+            row_lookup = self.mod.build_translation_output_origin_lookup(
+                connection=connection,
+                source_id="storiesofcz",
+                video_id="7619999999999999999",
+            )
         finally:
             connection.close()
 
@@ -132,6 +143,55 @@ class WorkspaceRegressionTests(unittest.TestCase):
             lookup,
             {str(output_path): ("generated", "translate-local")},
         )
+        self.assertEqual(row_lookup, lookup)
+
+    def test_source_translation_output_origin_lookups_keep_latest_run_per_video(self):
+        connection = sqlite3.connect(str(self.db_path))
+        try:
+            self.mod.create_schema(connection)
+            source_path = self.workspace_root / "source.vtt"
+            output_path = self.workspace_root / "output.ja-local.vtt"
+            for video_id, agent, method_version in (
+                ("7610000000000000001", "codex", "source-track=subtitle"),
+                ("7610000000000000001", "local-llm", "source-track=asr"),
+                ("7610000000000000002", "local-llm", "source-track=subtitle"),
+            ):
+                self.mod.record_translation_run(
+                    connection=connection,
+                    source_id="storiesofcz",
+                    video_id=video_id,
+                    source_path=source_path,
+                    output_path=output_path,
+                    cue_count=1,
+                    cue_match=True,
+                    agent=agent,
+                    method="multi-stage",
+                    method_version=method_version,
+                    summary="ok",
+                    status="success",
+                )
+            connection.commit()
+
+            lookups = self.mod.build_source_translation_output_origin_lookups(
+                connection,
+                "storiesofcz",
+            )
+            per_video = {
+                video_id: self.mod.build_translation_output_origin_lookup(
+                    connection=connection,
+                    source_id="storiesofcz",
+                    video_id=video_id,
+                )
+                for video_id in lookups
+            }
+        finally:
+            connection.close()
+
+        self.assertEqual(lookups, per_video)
+        self.assertEqual(
+            lookups["7610000000000000001"],
+            {str(output_path): ("generated", "translate-local-asr")},
+        )
 
     def test_subtitle_language_matches_sub_langs_accepts_prefixed_labels(self):
         self.assertTrue(
@@ -321,6 +381,33 @@ data_dir = "{source_root}"
         self.assertEqual(plan.chunk_index, 1)
         self.assertIsNone(plan.error)
 
+    def test_plan_video_url_lookup_reuses_resolved_chunk_urls(self):
+        plan = self.mod.ChunkedYtdlpStagePlan(
+            source=mock.sentinel.source,
+            stage="meta",
+            active_urls_file=self.workspace_root / "urls.txt",
+            build_command=lambda: ["fake-ytdlp"],
+            command_template=["fake-ytdlp"],
+            url_chunks=[[("video-a", "https://example.test/a")], [("video-b", "https://example.test/b")]],
+            target_ids=["video-a", "video-b", "video-c"],
+            resolved_target_ids=["video-a", "video-b"],
+            unresolved_target_ids=["video-c"],
+            started_at="2026-03-10T00:00:00+00:00",
+            run_id=None,
+        )
+        fallback_calls: list[str] = []
+
+        def safe_video_url(video_id):
+            fallback_calls.append(video_id)
+            return None
+
+        lookup = self.mod.build_plan_video_url_lookup(plan, safe_video_url)
+
+        self.assertEqual(lookup("video-a"), "https://example.test/a")
+        self.assertEqual(lookup("video-b"), "https://example.test/b")
+        self.assertIsNone(lookup("video-c"))
+        self.assertEqual(fallback_calls, ["video-c"])
+
     def test_extract_requested_subtitles_unavailable_video_ids_tracks_current_video(self):
         candidate_ids = [
             "7579312035477916958",
@@ -1515,6 +1602,39 @@ enabled = true
             _, sources = self.mod.load_config(config_path)
         self.assertEqual(sources[0].ytdlp_bin, "/opt/homebrew/bin/yt-dlp")
 
+    def test_load_config_reuses_bundle_until_config_changes(self):
+        config_dir = self.workspace_root / "config"
+        config_dir.mkdir(parents=True, exist_ok=True)
+        config_path = config_dir / "sources.toml"
+        config_text = """
+[global]
+ledger_db = "data/master_ledger.sqlite"
+
+[[sources]]
+id = "storiesofcz"
+platform = "tiktok"
+url = "https://www.tiktok.com/@storiesofcz"
+        """.strip() + "\n"
+        config_path.write_text(config_text, encoding="utf-8")
+
+        first_global, first_sources = self.mod.load_config(config_path)
+        with mock.patch.object(self.mod, "load_config_uncached") as uncached:
+            second_global, second_sources = self.mod.load_config(config_path)
+        uncached.assert_not_called()
+        self.assertIs(second_global, first_global)
+        self.assertIs(second_sources[0], first_sources[0])
+        self.assertIsNot(second_sources, first_sources)
+        with self.assertRaises(AttributeError):
+            first_sources[0].enabled = False
+
+        config_path.write_text(
+            config_text.replace("storiesofcz", "otherhandle"),
+            encoding="utf-8",
+        )
+        _, reloaded_sources = self.mod.load_config(config_path)
+        self.assertEqual([source.id for source in reloaded_sources], ["otherhandle"])
+        self.assertEqual(len(self.mod.CONFIG_CACHE), 1)
+
     def test_source_target_api_upsert_and_remove(self):
         config_dir = self.workspace_root / "config"
         config_dir.mkdir(parents=True, exist_ok=True)
@@ -1910,6 +2030,563 @@ enabled = true
         self.assertIn("--retry-sleep", command)
         self.assertNotIn("--ignore-errors", command)
 
+    def test_read_archive_ids_streams_and_dedupes_in_order(self):
+        archive_path = self.workspace_root / "archives" / "media.txt"
+        archive_path.parent.mkdir(parents=True)
+        archive_path.write_text(
+            "# comment\n"
+            "tiktok 7622222222222222222\n"
+            "\n"
+            "tiktok 7611111111111111111\r\n"
+            "7633333333333333333\n"
+            "tiktok 7622222222222222222\n",
+            encoding="utf-8",
+        )
+
+        self.assertEqual(
+            self.mod.read_archive_ids(archive_path),
+            ["7622222222222222222", "7611111111111111111", "7633333333333333333"],
+        )
+        self.assertEqual(self.mod.read_archive_ids(archive_path.with_name("missing.txt")), [])
+        before_size = self.mod.get_archive_size(archive_path)
+        with archive_path.open("a", encoding="utf-8") as file:
+            file.write("tiktok 7644444444444444444\ntiktok 7611111111111111111\n")
+        self.assertEqual(
+            self.mod.read_archive_ids_appended_since(archive_path, before_size),
+            ["7644444444444444444", "7611111111111111111"],
+        )
+        self.assertIsNone(self.mod.read_archive_ids_appended_since(archive_path, before_size - 1))
+        self.assertIsNone(self.mod.read_archive_ids_appended_since(archive_path, before_size * 10))
+        self.assertEqual(self.mod.split_archive_line("tiktok\t7644444444444444444"), ("tiktok", "7644444444444444444"))
+        self.assertEqual(self.mod.split_archive_line("tiktok a b"), ("tiktok", "a"))
+
+    def test_scan_media_and_subtitle_ids_match_full_scans(self):
+        source = mock.Mock(
+            media_dir=self.workspace_root / "media",
+            subs_dir=self.workspace_root / "subs",
+            video_id_regex=r"_(\d{10,})_",
+        )
+        self.assertEqual(self.mod.scan_media_ids(source), set())
+        self.assertEqual(self.mod.scan_subtitle_ids(source), set())
+
+        source.media_dir.mkdir()
+        source.subs_dir.mkdir()
+        (source.media_dir / "a_7611111111111111111_x.mp4").write_bytes(b"1")
+        (source.media_dir / "a_7611111111111111111_x.m4a").write_bytes(b"12")
+        (source.media_dir / "7622222222222222222.mp4").write_bytes(b"1")
+        (source.media_dir / "notes.txt").write_bytes(b"1")
+        (source.media_dir / "a_7633333333333333333_dir").mkdir()
+        (source.subs_dir / "7611111111111111111.en.vtt").write_text("", encoding="utf-8")
+        (source.subs_dir / "7622222222222222222.ja-orig.vtt").write_text("", encoding="utf-8")
+        (source.subs_dir / "readme").write_text("", encoding="utf-8")
+        (source.subs_dir / "draft.en.vtt").write_text("", encoding="utf-8")
+
+        self.assertEqual(
+            self.mod.scan_media_ids(source),
+            set(self.mod.scan_media_files(source)),
+        )
+        self.assertEqual(
+            self.mod.scan_subtitle_ids(source),
+            set(self.mod.scan_subtitles(source)),
+        )
+        self.assertEqual(
+            self.mod.scan_subtitle_ids(source),
+            {"7611111111111111111", "7622222222222222222"},
+        )
+        self.assertEqual(
+            self.mod.scan_subtitles(source)["7622222222222222222"],
+            [("ja-orig", str(source.subs_dir / "7622222222222222222.ja-orig.vtt"), "vtt")],
+        )
+
+    def test_video_upsert_params_use_prefetched_description_ids(self):
+        meta_dir = self.workspace_root / "meta"
+        meta_dir.mkdir()
+        (meta_dir / "7611111111111111111.description").write_text(" hello \n", encoding="utf-8")
+        (meta_dir / "7611111111111111111.info.json").write_text("{}", encoding="utf-8")
+        source = mock.Mock(id="storiesofcz", meta_dir=meta_dir)
+
+        description_ids = self.mod.list_meta_description_ids(meta_dir)
+        self.assertEqual(description_ids, {"7611111111111111111"})
+        with mock.patch.object(self.mod, "build_video_url", return_value="https://example.com"):
+            prefetched = self.mod.build_video_upsert_params(
+                source=source,
+                video_id="7611111111111111111",
+                meta_path=None,
+                meta_data={},
+                media_path=None,
+                subtitle_records=[],
+                synced_at="now",
+                description_ids=description_ids,
+            )
+            probed = self.mod.build_video_upsert_params(
+                source=source,
+                video_id="7611111111111111111",
+                meta_path=None,
+                meta_data={},
+                media_path=None,
+                subtitle_records=[],
+                synced_at="now",
+            )
+        self.assertEqual(prefetched, probed)
+        self.assertEqual(prefetched[5], "hello")
+        self.assertEqual(
+            prefetched[18],
+            str(meta_dir / "7611111111111111111.description"),
+        )
+
+    def test_sync_scan_cache_reuses_reads_until_path_changes(self):
+        archive_path = self.workspace_root / "archive.txt"
+        meta_dir = self.workspace_root / "meta"
+        meta_dir.mkdir()
+        archive_path.write_text("tiktok 7611111111111111111\n", encoding="utf-8")
+        (meta_dir / "7611111111111111111.info.json").write_text("{}", encoding="utf-8")
+
+        with mock.patch.object(
+            self.mod,
+            "read_archive_ids",
+            wraps=self.mod.read_archive_ids,
+        ) as read_mock, mock.patch.object(
+            self.mod,
+            "list_meta_ids",
+            wraps=self.mod.list_meta_ids,
+        ) as list_mock:
+            first_ids = self.mod.cached_read_archive_ids(archive_path)
+            first_ids.append("mutated")
+            self.assertEqual(
+                self.mod.cached_read_archive_ids(archive_path),
+                ["7611111111111111111"],
+            )
+            self.assertEqual(
+                self.mod.cached_list_meta_ids(meta_dir),
+                {"7611111111111111111"},
+            )
+            self.assertEqual(
+                self.mod.cached_list_meta_ids(meta_dir),
+                {"7611111111111111111"},
+            )
+            self.assertEqual(read_mock.call_count, 1)
+            self.assertEqual(list_mock.call_count, 1)
+
+            with open(archive_path, "a", encoding="utf-8") as file:
+                file.write("tiktok 7622222222222222222\n")
+            self.assertEqual(
+                self.mod.cached_read_archive_ids(archive_path),
+                ["7611111111111111111", "7622222222222222222"],
+            )
+            self.assertEqual(read_mock.call_count, 2)
+
+            self.mod.clear_sync_scan_cache()
+            self.mod.cached_list_meta_ids(meta_dir)
+            self.assertEqual(list_mock.call_count, 2)
+
+    def test_filtered_existing_subtitle_ids_reuse_scan_until_subs_dir_changes(self):
+        subs_dir = self.workspace_root / "subs"
+        subs_dir.mkdir()
+        (subs_dir / "7611111111111111111.en.vtt").write_text("WEBVTT\n", encoding="utf-8")
+        (subs_dir / "7622222222222222222.ja.vtt").write_text("WEBVTT\n", encoding="utf-8")
+        source = mock.Mock(subs_dir=subs_dir)
+
+        with mock.patch.object(
+            self.mod,
+            "scan_subtitles",
+            wraps=self.mod.scan_subtitles,
+        ) as scan_mock:
+            for _ in range(2):
+                self.assertEqual(
+                    self.mod.scan_existing_subtitle_ids(source, match_langs="en.*"),
+                    {"7611111111111111111"},
+                )
+            self.assertEqual(scan_mock.call_count, 1)
+
+            (subs_dir / "7633333333333333333.en.vtt").write_text("WEBVTT\n", encoding="utf-8")
+            os.utime(subs_dir, ns=(0, 1))
+            self.assertEqual(
+                self.mod.scan_existing_subtitle_ids(source, match_langs="en.*"),
+                {"7611111111111111111", "7633333333333333333"},
+            )
+            self.assertEqual(scan_mock.call_count, 2)
+
+    def test_concurrent_chunked_stage_plans_overlap_subs_and_meta_groups(self):
+        barrier = threading.Barrier(2, timeout=5)
+        seen_groups: list[tuple[str, ...]] = []
+
+        def fake_run(plans, dry_run, stop_event=None):
+            barrier.wait()
+            seen_groups.append(tuple(plans))
+            self.assertIsNotNone(stop_event)
+
+        with mock.patch.object(
+            self.mod,
+            "run_interleaved_chunked_ytdlp_stage_plans",
+            side_effect=fake_run,
+        ):
+            self.mod.run_concurrent_chunked_ytdlp_stage_plans(
+                [["subs"], [], ["meta"]],
+                dry_run=False,
+            )
+        self.assertCountEqual(seen_groups, [("subs",), ("meta",)])
+
+        with mock.patch.object(
+            self.mod,
+            "run_interleaved_chunked_ytdlp_stage_plans",
+        ) as sequential_mock:
+            self.mod.run_concurrent_chunked_ytdlp_stage_plans(
+                [["subs"], ["meta"]],
+                dry_run=True,
+            )
+        self.assertEqual(
+            [call.args[0] for call in sequential_mock.call_args_list],
+            [["subs"], ["meta"]],
+        )
+
+    def test_concurrent_chunked_stage_plans_stop_on_first_group_failure(self):
+        stopped: list[bool] = []
+
+        def fake_run(plans, dry_run, stop_event=None):
+            if plans == ["meta"]:
+                raise RuntimeError("meta failed")
+            stopped.append(stop_event.wait(timeout=5))
+
+        with mock.patch.object(
+            self.mod,
+            "run_interleaved_chunked_ytdlp_stage_plans",
+            side_effect=fake_run,
+        ), mock.patch.object(self.mod, "terminate_active_command_processes") as terminate_mock:
+            with self.assertRaisesRegex(RuntimeError, "meta failed"):
+                self.mod.run_concurrent_chunked_ytdlp_stage_plans(
+                    [["subs"], ["meta"]],
+                    dry_run=False,
+                )
+        terminate_mock.assert_called_once_with()
+        self.assertEqual(stopped, [True])
+
+    def test_interleaved_chunked_stage_plan_records_urls_file_error(self):
+        plan = mock.Mock(
+            stage="subs",
+            source=mock.Mock(id="storiesofcz"),
+            command_template=["yt-dlp"],
+            url_chunks=[[("7611111111111111111", "https://example.invalid/v")]],
+            chunk_index=0,
+            error=None,
+            halt_reason=None,
+        )
+        with mock.patch.object(
+            self.mod,
+            "write_urls_file",
+            side_effect=OSError("disk full"),
+        ), mock.patch.object(self.mod, "run_command_with_output") as run_mock:
+            self.mod.run_interleaved_chunked_ytdlp_stage_plans([plan], dry_run=False)
+        run_mock.assert_not_called()
+        self.assertEqual(plan.error, "disk full")
+        self.assertEqual(plan.exit_code, 1)
+        self.assertEqual(plan.chunk_index, 1)
+
+    def test_interleaved_chunked_stage_plans_start_no_chunk_after_stop(self):
+        stop_event = threading.Event()
+        plans = [
+            mock.Mock(
+                stage="subs",
+                source=mock.Mock(id=source_id),
+                command_template=["yt-dlp"],
+                url_chunks=[[("7611111111111111111", "https://example.invalid/v")]],
+                chunk_index=0,
+                error=None,
+                halt_reason=None,
+            )
+            for source_id in ("first", "second")
+        ]
+
+        self.mod.SYNC_SCAN_CACHE[("archive", "stale")] = ((0, 0, 0), ())
+
+        def fake_run(command, dry_run):
+            stop_event.set()
+            return 0, ""
+
+        with mock.patch.object(self.mod, "write_urls_file"), mock.patch.object(
+            self.mod,
+            "run_command_with_output",
+            side_effect=fake_run,
+        ) as run_mock:
+            self.mod.run_interleaved_chunked_ytdlp_stage_plans(
+                plans,
+                dry_run=False,
+                stop_event=stop_event,
+            )
+        self.assertEqual(run_mock.call_count, 1)
+        self.assertEqual([plan.chunk_index for plan in plans], [1, 0])
+        self.assertEqual(self.mod.SYNC_SCAN_CACHE, {})
+
+    def test_write_urls_file_skips_identical_payload(self):
+        urls_path = self.workspace_root / "tmp" / "urls.txt"
+        urls = ["https://www.tiktok.com/@demo/video/7611111111111111111"]
+        self.mod.write_urls_file(urls_path, urls)
+        self.assertEqual(urls_path.read_text(encoding="utf-8"), f"{urls[0]}\n")
+
+        os.utime(urls_path, ns=(1_000_000_000, 1_000_000_000))
+        self.mod.write_urls_file(urls_path, urls)
+        self.assertEqual(urls_path.stat().st_mtime_ns, 1_000_000_000)
+
+        self.mod.write_urls_file(urls_path, [*urls, urls[0].replace("761", "762")])
+        self.assertEqual(len(urls_path.read_text(encoding="utf-8").splitlines()), 2)
+
+    def test_load_meta_records_parses_in_parallel_and_skips_broken_files(self):
+        meta_dir = self.workspace_root / "meta"
+        meta_dir.mkdir()
+        (meta_dir / "7611111111111111111.info.json").write_text(
+            '{"id": "7611111111111111111", "title": "字幕"}',
+            encoding="utf-8",
+        )
+        (meta_dir / "7622222222222222222.info.json").write_text(
+            '{"id": "7622222222222222222", "duration": NaN, "view_count": 18446744073709551616}',
+            encoding="utf-8",
+        )
+        (meta_dir / "7633333333333333333.info.json").write_text("{", encoding="utf-8")
+
+        stderr = io.StringIO()
+        with redirect_stderr(stderr):
+            records = self.mod.load_meta_records(meta_dir)
+
+        self.assertEqual(set(records), {"7611111111111111111", "7622222222222222222"})
+        self.assertEqual(records["7611111111111111111"][1]["title"], "字幕")
+        self.assertEqual(
+            records["7622222222222222222"][1]["view_count"],
+            18446744073709551616,
+        )
+        self.assertIn("7633333333333333333.info.json", stderr.getvalue())
+        self.assertEqual(
+            self.mod.load_meta_record_by_id(
+                mock.Mock(meta_dir=meta_dir),
+                "7611111111111111111",
+            ),
+            records["7611111111111111111"],
+        )
+
+    def test_iter_meta_records_streams_batches_in_requested_order(self):
+        meta_dir = self.workspace_root / "meta"
+        meta_dir.mkdir()
+        video_ids = ["7633333333333333333", "7611111111111111111", "7622222222222222222"]
+        for video_id in video_ids[:2]:
+            (meta_dir / f"{video_id}.info.json").write_text(
+                json.dumps({"id": video_id}),
+                encoding="utf-8",
+            )
+        (meta_dir / f"{video_ids[2]}.info.json").write_text("{", encoding="utf-8")
+
+        with mock.patch.object(self.mod, "META_LOAD_BATCH_SIZE", 2), redirect_stderr(io.StringIO()):
+            streamed = list(self.mod.iter_meta_records(meta_dir, video_ids))
+
+        self.assertEqual([video_id for video_id, _, _ in streamed], video_ids)
+        self.assertEqual(streamed[0][1], meta_dir / f"{video_ids[0]}.info.json")
+        self.assertEqual(streamed[1][2], {"id": video_ids[1]})
+        self.assertIsNone(streamed[2][2])
+
+    def test_prune_source_videos_full_rebuild_keeps_listed_ids_per_source(self):
+        connection = sqlite3.connect(str(self.db_path))
+        try:
+            self.mod.create_schema(connection)
+            for source_id in ("source-a", "source-b"):
+                for video_id in ("video-1", "video-2", "video-3"):
+                    connection.execute(
+                        """
+                        INSERT INTO videos(source_id, video_id, has_media, synced_at)
+                        VALUES (?, ?, 0, '2026-03-10T00:00:00+00:00')
+                        """,
+                        (source_id, video_id),
+                    )
+                    connection.execute(
+                        """
+                        INSERT INTO video_favorites(source_id, video_id, created_at)
+                        VALUES (?, ?, '2026-03-10T00:00:00+00:00')
+                        """,
+                        (source_id, video_id),
+                    )
+            self.mod.prune_source_videos_full_rebuild(
+                connection,
+                "source-a",
+                ["video-1", "video-3", "video-1"],
+            )
+            self.mod.prune_source_videos_full_rebuild(connection, "source-b", ["video-2"])
+            videos = connection.execute(
+                "SELECT source_id, video_id FROM videos ORDER BY source_id, video_id"
+            ).fetchall()
+            favorites = connection.execute(
+                "SELECT source_id, video_id FROM video_favorites ORDER BY source_id, video_id"
+            ).fetchall()
+            temp_tables = connection.execute(
+                "SELECT name FROM sqlite_temp_master WHERE type = 'table'"
+            ).fetchall()
+        finally:
+            connection.close()
+
+        expected = [
+            ("source-a", "video-1"),
+            ("source-a", "video-3"),
+            ("source-b", "video-2"),
+        ]
+        self.assertEqual(videos, expected)
+        self.assertEqual(favorites, expected)
+        self.assertEqual(temp_tables, [])
+
+    def test_rebuild_source_incremental_indexes_media_and_subtitles_once(self):
+        source_root = self.workspace_root / "incremental_source"
+        config_dir = self.workspace_root / "config"
+        config_dir.mkdir(parents=True, exist_ok=True)
+        config_path = config_dir / "sources.toml"
+        config_path.write_text(
+            f"""
+[global]
+ledger_db = "{self.db_path}"
+ledger_csv = "{self.workspace_root / 'data' / 'master_ledger.csv'}"
+
+[[sources]]
+id = "storiesofcz"
+platform = "tiktok"
+url = "https://www.tiktok.com/@storiesofcz"
+enabled = true
+data_dir = "{source_root}"
+            """.strip()
+            + "\n",
+            encoding="utf-8",
+        )
+        _, sources = self.mod.load_config(config_path)
+        source = sources[0]
+        for directory in (source.media_dir, source.subs_dir, source.meta_dir):
+            directory.mkdir(parents=True, exist_ok=True)
+        (source.media_dir / "a_7611111111111111111_x.mp4").write_bytes(b"1")
+        (source.media_dir / "a_7611111111111111111_x.f140.m4a").write_bytes(b"123")
+        (source.media_dir / "odd-7622222222222222222.mp4").write_bytes(b"12")
+        (source.subs_dir / "7611111111111111111.en.vtt").write_text("WEBVTT\n", encoding="utf-8")
+        (source.subs_dir / "7611111111111111111.ja.vtt").write_text("WEBVTT\n", encoding="utf-8")
+        for video_id in ("7611111111111111111", "7622222222222222222"):
+            (source.meta_dir / f"{video_id}.info.json").write_text(
+                json.dumps({"id": video_id, "title": video_id}),
+                encoding="utf-8",
+            )
+
+        connection = sqlite3.connect(str(self.db_path))
+        try:
+            self.mod.create_schema(connection)
+            with mock.patch.object(
+                self.mod,
+                "find_media_file_for_video",
+                side_effect=AssertionError("per-video media lookup"),
+            ), redirect_stdout(io.StringIO()):
+                self.mod.rebuild_source_incremental(
+                    connection,
+                    source,
+                    "2026-03-10T00:00:00+00:00",
+                )
+            media_paths = dict(
+                connection.execute(
+                    "SELECT video_id, media_path FROM videos WHERE source_id = ?",
+                    (source.id,),
+                ).fetchall()
+            )
+            subtitle_count = connection.execute(
+                "SELECT COUNT(*) FROM subtitles WHERE video_id = ?",
+                ("7611111111111111111",),
+            ).fetchone()[0]
+        finally:
+            connection.close()
+
+        self.assertTrue(media_paths["7611111111111111111"].endswith("a_7611111111111111111_x.f140.m4a"))
+        self.assertTrue(media_paths["7622222222222222222"].endswith("odd-7622222222222222222.mp4"))
+        self.assertEqual(subtitle_count, 2)
+
+    def test_find_media_files_for_videos_matches_single_video_lookup(self):
+        media_dir = self.workspace_root / "media"
+        (media_dir / ".audio_fallback").mkdir(parents=True)
+        (media_dir / "a_7611111111111111111_x.mp4").write_bytes(b"1")
+        (media_dir / "a_7611111111111111111_x.f140.m4a").write_bytes(b"123")
+        (media_dir / "b_7622222222222222222_x.mp4").write_bytes(b"12")
+        (media_dir / ".b_7622222222222222222_x.mp4").write_bytes(b"12345")
+        source = mock.Mock(media_dir=media_dir)
+        video_ids = ["7611111111111111111", "7622222222222222222", "7633333333333333333"]
+
+        found = self.mod.find_media_files_for_videos(source, video_ids)
+
+        self.assertEqual(
+            found,
+            {
+                "7611111111111111111": media_dir / "a_7611111111111111111_x.f140.m4a",
+                "7622222222222222222": media_dir / ".b_7622222222222222222_x.mp4",
+            },
+        )
+        self.assertEqual(
+            self.mod.find_media_file_for_video(source, video_ids[0]),
+            found[video_ids[0]],
+        )
+        self.assertIsNone(self.mod.find_media_file_for_video(source, video_ids[2]))
+
+        probed: list[str] = []
+
+        def fake_detect_audio_stream(media_path, ffprobe_bin):
+            probed.append(media_path.name)
+            return media_path.suffix == ".mp4", None
+
+        with mock.patch.object(self.mod, "detect_audio_stream", side_effect=fake_detect_audio_stream):
+            results = self.mod.detect_audio_streams(found, "ffprobe", max_workers=2)
+
+        self.assertEqual(
+            results,
+            {
+                "7611111111111111111": (False, None),
+                "7622222222222222222": (True, None),
+            },
+        )
+        self.assertEqual(sorted(probed), sorted(path.name for path in found.values()))
+
+    def test_find_media_files_for_videos_skips_listing_and_unusable_entries(self):
+        media_dir = self.workspace_root / "media"
+        media_dir.mkdir(parents=True)
+        (media_dir / "a_7611111111111111111_x.mp4").write_bytes(b"1")
+        (media_dir / "a_7611111111111111111_x.part").mkdir()
+        (media_dir / "b_7622222222222222222_x.mp4").symlink_to(media_dir / "missing.mp4")
+        source = mock.Mock(media_dir=media_dir)
+
+        with mock.patch.object(self.mod.os, "scandir") as scandir:
+            self.assertEqual(self.mod.find_media_files_for_videos(source, []), {})
+        scandir.assert_not_called()
+
+        self.assertEqual(
+            self.mod.find_media_file_for_video(source, "7611111111111111111"),
+            media_dir / "a_7611111111111111111_x.mp4",
+        )
+        self.assertIsNone(self.mod.find_media_file_for_video(source, "7622222222222222222"))
+
+    def test_detect_mp4_audio_track_reads_moov_handlers(self):
+        def box(box_type, payload=b""):
+            return (8 + len(payload)).to_bytes(4, "big") + box_type + payload
+
+        def trak(handler_type):
+            hdlr = box(b"hdlr", b"\x00" * 8 + handler_type + b"\x00" * 12)
+            return box(b"trak", box(b"tkhd", b"\x00" * 16) + box(b"mdia", box(b"mdhd") + hdlr))
+
+        ftyp = box(b"ftyp", b"isom\x00\x00\x02\x00")
+        large_mdat = (1).to_bytes(4, "big") + b"mdat" + (16 + 64).to_bytes(8, "big") + b"\x00" * 64
+        media_dir = self.workspace_root / "media"
+        media_dir.mkdir()
+        with_audio = media_dir / "with_audio.mp4"
+        with_audio.write_bytes(ftyp + large_mdat + box(b"moov", box(b"mvhd") + trak(b"vide") + trak(b"soun")))
+        video_only = media_dir / "video_only.mp4"
+        video_only.write_bytes(ftyp + box(b"moov", trak(b"vide")) + box(b"mdat", b"\x00" * 32))
+        webm = media_dir / "clip.webm"
+        webm.write_bytes(b"\x1a\x45\xdf\xa3" + b"\x00" * 60)
+        truncated = media_dir / "truncated.mp4"
+        truncated.write_bytes(ftyp + (4096).to_bytes(4, "big") + b"moov")
+
+        self.assertIs(self.mod.detect_mp4_audio_track(with_audio), True)
+        self.assertIs(self.mod.detect_mp4_audio_track(video_only), False)
+        self.assertIsNone(self.mod.detect_mp4_audio_track(webm))
+        self.assertIsNone(self.mod.detect_mp4_audio_track(truncated))
+
+        completed = mock.Mock(returncode=0, stdout="1\n", stderr="")
+        with mock.patch.object(self.mod.subprocess, "run", return_value=completed) as run:
+            self.assertEqual(self.mod.detect_audio_stream(video_only, "ffprobe"), (False, None))
+            run.assert_not_called()
+            self.assertEqual(self.mod.detect_audio_stream(webm, "ffprobe"), (True, None))
+            run.assert_called_once()
+
     def test_compute_effective_sleep_requests_seconds_respects_minimum_floor(self):
         source = self.mod.SourceConfig(
             id="storiesofcz",
@@ -2305,49 +2982,592 @@ enabled = true
             self.mod.is_source_network_cooldown_error(
                 "ERROR: [TikTok] Your IP address is blocked from accessing this post"
             )
-        )
-        self.assertFalse(
-            self.mod.is_source_network_cooldown_error(
-                "ERROR: [TikTok] 7611111111111111111: Unable to extract universal data for rehydration"
+        )
+        self.assertFalse(
+            self.mod.is_source_network_cooldown_error(
+                "ERROR: [TikTok] 7611111111111111111: Unable to extract universal data for rehydration"
+            )
+        )
+
+    def test_get_source_network_cooldown_state_clears_transient_webpage_cooldown(self):
+        connection = sqlite3.connect(str(self.db_path))
+        try:
+            self.mod.create_schema(connection)
+            future_block = "2026-03-12T00:00:00+00:00"
+            self.mod.upsert_source_access_state(
+                connection=connection,
+                source_id="storiesofcz",
+                blocked_until=future_block,
+                last_error=(
+                    "ERROR: [TikTok] 7611111111111111111: "
+                    "Unable to extract universal data for rehydration"
+                ),
+                updated_at="2026-03-11T00:00:00+00:00",
+            )
+            connection.commit()
+
+            active, remaining_hours, blocked_until, last_error = self.mod.get_source_network_cooldown_state(
+                connection=connection,
+                source_id="storiesofcz",
+                now_dt=dt.datetime(2026, 3, 11, 1, 0, tzinfo=dt.timezone.utc),
+            )
+
+            row = connection.execute(
+                "SELECT blocked_until FROM source_access_state WHERE source_id = ?",
+                ("storiesofcz",),
+            ).fetchone()
+        finally:
+            connection.close()
+
+        self.assertFalse(active)
+        self.assertEqual(remaining_hours, 0.0)
+        self.assertIsNone(blocked_until)
+        self.assertIn("rehydration", str(last_error).lower())
+        self.assertIsNotNone(row)
+        self.assertIsNone(row[0])
+
+    def test_upsert_stage_download_success_states_batches_rows(self):
+        connection = sqlite3.connect(str(self.db_path))
+        try:
+            self.mod.create_schema(connection)
+            self.mod.upsert_download_state(
+                connection=connection,
+                source_id="storiesofcz",
+                stage="media",
+                video_id="7611111111111111111",
+                status="error",
+                run_id=None,
+                attempt_at="2026-03-10T00:00:00+00:00",
+                last_error="timeout",
+                retry_count=3,
+            )
+            self.mod.upsert_stage_download_success_states(
+                connection=connection,
+                source_id="storiesofcz",
+                stage="media",
+                video_ids=["7611111111111111111", " ", "7622222222222222222"],
+                run_id=None,
+                attempt_at="2026-03-11T00:00:00+00:00",
+                safe_video_url=lambda video_id: f"https://example.test/{video_id}",
+            )
+            connection.commit()
+            rows = connection.execute(
+                """
+                SELECT video_id, status, retry_count, last_error, url, updated_at
+                FROM download_state
+                ORDER BY video_id
+                """
+            ).fetchall()
+        finally:
+            connection.close()
+
+        self.assertEqual(
+            rows,
+            [
+                (
+                    "7611111111111111111",
+                    "success",
+                    0,
+                    None,
+                    "https://example.test/7611111111111111111",
+                    "2026-03-11T00:00:00+00:00",
+                ),
+                (
+                    "7622222222222222222",
+                    "success",
+                    0,
+                    None,
+                    "https://example.test/7622222222222222222",
+                    "2026-03-11T00:00:00+00:00",
+                ),
+            ],
+        )
+
+    def test_download_state_batch_lookup_uses_covering_index(self):
+        connection = sqlite3.connect(str(self.db_path))
+        try:
+            self.mod.create_schema(connection)
+            plan = connection.execute(
+                """
+                EXPLAIN QUERY PLAN
+                SELECT video_id, status, retry_count, next_retry_at
+                FROM download_state
+                WHERE source_id = ? AND stage = ? AND video_id IN (?, ?)
+                """,
+                ("storiesofcz", "subs", "7611111111111111111", "7622222222222222222"),
+            ).fetchall()
+        finally:
+            connection.close()
+
+        self.assertIn(
+            "COVERING INDEX idx_download_state_retry_cover",
+            " ".join(str(row[-1]) for row in plan),
+        )
+
+    def test_run_asr_records_no_audio_video_without_running_state(self):
+        media_path = self.workspace_root / "7611111111111111111.mp4"
+        media_path.write_bytes(b"1")
+        connection = sqlite3.connect(str(self.db_path))
+        try:
+            self.mod.create_schema(connection)
+            connection.execute(
+                """
+                INSERT INTO videos(source_id, video_id, has_media, media_path, synced_at)
+                VALUES ('storiesofcz', '7611111111111111111', 1, ?, 'now')
+                """,
+                (str(media_path),),
+            )
+            connection.commit()
+        finally:
+            connection.close()
+        source = mock.Mock(
+            id="storiesofcz",
+            asr_enabled=True,
+            asr_command=["true"],
+            asr_max_per_run=0,
+            asr_dir=self.workspace_root / "asr",
+            asr_timeout_sec=0,
+        )
+        statements: list[str] = []
+        real_connect = sqlite3.connect
+
+        def traced_connect(*args, **kwargs):
+            traced = real_connect(*args, **kwargs)
+            traced.set_trace_callback(statements.append)
+            return traced
+
+        with mock.patch.object(self.mod.sqlite3, "connect", side_effect=traced_connect), mock.patch.object(
+            self.mod, "find_ffmpeg_tool", return_value="ffprobe"
+        ), mock.patch.object(
+            self.mod, "detect_audio_stream", return_value=(False, None)
+        ), mock.patch.object(
+            self.mod, "build_video_url", return_value="https://example.com"
+        ), redirect_stdout(io.StringIO()):
+            self.mod.run_asr([source], self.db_path, self.workspace_root / "ledger.csv")
+
+        connection = sqlite3.connect(str(self.db_path))
+        try:
+            status = connection.execute("SELECT status FROM asr_runs").fetchone()[0]
+        finally:
+            connection.close()
+        self.assertEqual(status, "success")
+        self.assertEqual(
+            [statement for statement in statements if "'running'" in statement and "UPDATE asr_runs" not in statement],
+            [],
+        )
+
+    def test_find_ffmpeg_tool_caches_only_resolved_paths(self):
+        with mock.patch.object(
+            self.mod,
+            "find_executable_command",
+            side_effect=[None, "/usr/local/bin/ffprobe"],
+        ) as lookup_mock:
+            self.assertIsNone(self.mod.find_ffmpeg_tool("ffprobe"))
+            self.assertEqual(self.mod.find_ffmpeg_tool("ffprobe"), "/usr/local/bin/ffprobe")
+            self.assertEqual(self.mod.find_ffmpeg_tool("ffprobe"), "/usr/local/bin/ffprobe")
+        self.assertEqual(lookup_mock.call_count, 2)
+
+    def test_ledger_write_pragmas_apply_per_connection(self):
+        connection = self.mod.connect_ledger_writer(self.db_path)
+        try:
+            settings = {
+                name: connection.execute(f"PRAGMA {name}").fetchone()[0]
+                for name in ("journal_mode", "synchronous", "wal_autocheckpoint")
+            }
+        finally:
+            connection.close()
+
+        self.assertEqual(
+            settings,
+            {"journal_mode": "wal", "synchronous": 1, "wal_autocheckpoint": 1000},
+        )
+
+    def test_build_ledger_raises_wal_autocheckpoint_for_rebuild_only(self):
+        statements: list[str] = []
+        connect_ledger_writer = self.mod.connect_ledger_writer
+
+        def traced_connect(db_path):
+            connection = connect_ledger_writer(db_path)
+            connection.set_trace_callback(statements.append)
+            return connection
+
+        with mock.patch.object(self.mod, "connect_ledger_writer", side_effect=traced_connect):
+            self.mod.build_ledger([], self.db_path, self.workspace_root / "data" / "ledger.csv")
+        self.assertEqual(
+            [statement for statement in statements if "wal_autocheckpoint" in statement],
+            [f"PRAGMA wal_autocheckpoint={self.mod.LEDGER_REBUILD_WAL_AUTOCHECKPOINT_PAGES}"],
+        )
+
+    def test_ledger_orphan_cleanup_probes_video_primary_key(self):
+        connection = sqlite3.connect(str(self.db_path))
+        try:
+            self.mod.create_schema(connection)
+            connection.executemany(
+                "INSERT INTO videos(source_id, video_id, synced_at) VALUES (?, ?, 'now')",
+                [("storiesofcz", "7611111111111111111"), ("other", "7622222222222222222")],
+            )
+            for video_id in ("7611111111111111111", "7622222222222222222"):
+                self.mod.upsert_download_state(
+                    connection=connection,
+                    source_id="storiesofcz",
+                    stage="subs",
+                    video_id=video_id,
+                    status="error",
+                    run_id=None,
+                    attempt_at="2026-03-10T00:00:00+00:00",
+                    last_error="timeout",
+                    retry_count=1,
+                    next_retry_at=None,
+                )
+            sql = self.mod.SQL_DELETE_SOURCE_ROWS_WITHOUT_VIDEO.format(table_name="download_state")
+            plan = connection.execute(f"EXPLAIN QUERY PLAN {sql}", ("storiesofcz",)).fetchall()
+            connection.execute(sql, ("storiesofcz",))
+            remaining = connection.execute(
+                "SELECT video_id FROM download_state ORDER BY video_id"
+            ).fetchall()
+        finally:
+            connection.close()
+
+        self.assertIn(
+            "sqlite_autoindex_videos_1 (source_id=? AND video_id=?)",
+            " ".join(str(row[-1]) for row in plan),
+        )
+        self.assertEqual(remaining, [("7611111111111111111",)])
+
+    def test_stage_download_error_states_and_retry_split_use_batched_lookups(self):
+        connection = sqlite3.connect(str(self.db_path))
+        try:
+            self.mod.create_schema(connection)
+            self.mod.upsert_download_state(
+                connection=connection,
+                source_id="storiesofcz",
+                stage="subs",
+                video_id="7611111111111111111",
+                status="error",
+                run_id=None,
+                attempt_at="2026-03-10T00:00:00+00:00",
+                last_error="timeout",
+                retry_count=2,
+                next_retry_at="2026-03-10T01:00:00+00:00",
+            )
+            with mock.patch.object(self.mod, "SQLITE_IN_CLAUSE_BATCH_SIZE", 1):
+                self.mod.upsert_stage_download_error_states(
+                    connection=connection,
+                    source_id="storiesofcz",
+                    stage="subs",
+                    video_ids=["7611111111111111111", "7622222222222222222", ""],
+                    run_id=None,
+                    attempt_at="2026-03-11T00:00:00+00:00",
+                    safe_video_url=lambda video_id: None,
+                    resolve_failure_reason=lambda video_id: "timeout",
+                )
+                retry_counts = dict(
+                    connection.execute(
+                        "SELECT video_id, retry_count FROM download_state WHERE stage = 'subs'"
+                    ).fetchall()
+                )
+                retryable, deferred = self.mod.split_retryable_ids(
+                    connection=connection,
+                    source_id="storiesofcz",
+                    stage="subs",
+                    candidate_ids=["7633333333333333333", "7611111111111111111"],
+                    now_iso="2026-03-11T00:00:00+00:00",
+                )
+        finally:
+            connection.close()
+
+        self.assertEqual(
+            retry_counts,
+            {"7611111111111111111": 3, "7622222222222222222": 1},
+        )
+        self.assertEqual(retryable, ["7633333333333333333"])
+        self.assertEqual(deferred, ["7611111111111111111"])
+
+    def test_lookup_dictionary_entries_batch_matches_single_lookups(self):
+        connection = sqlite3.connect(str(self.db_path))
+        connection.row_factory = sqlite3.Row
+        try:
+            self.mod.ensure_dictionary_schema(connection)
+            entries = [
+                ("running", "走ること"),
+                ("run", "走る"),
+                ("run", "経営する"),
+                ("runs", "run の三単現"),
+                ("make up", "作り上げる"),
+                ("make-up", "化粧"),
+                ("studies", "研究"),
+                ("study", "勉強"),
+            ]
+            connection.executemany(
+                """
+                INSERT INTO dict_entries (source_name, term, term_norm, definition, created_at)
+                VALUES ('test', ?, ?, ?, '2026-03-10T00:00:00+00:00')
+                """,
+                [
+                    (term, self.mod.normalize_dictionary_term(term), definition)
+                    for term, definition in entries
+                ],
+            )
+            terms = ["Running", "runs", "make-up", "studies", "zzz"]
+            for exact_only in (True, False):
+                for limit in (1, 2, 5):
+                    self.assertEqual(
+                        self.mod.lookup_dictionary_entries_batch(
+                            connection,
+                            terms,
+                            limit=limit,
+                            exact_only=exact_only,
+                            fts_mode="off",
+                        ),
+                        [
+                            self.mod.lookup_dictionary_entries(
+                                connection,
+                                term,
+                                limit=limit,
+                                exact_only=exact_only,
+                                fts_mode="off",
+                            )
+                            for term in terms
+                        ],
+                    )
+        finally:
+            connection.close()
+
+    def test_dictionary_lookup_variants_are_cached_without_sharing_lists(self):
+        first = self.mod.dictionary_lookup_variants("Studies")
+        first.append("mutated")
+        self.assertEqual(
+            self.mod.dictionary_lookup_variants("studies"),
+            ["studies", "study", "studi", "studie"],
+        )
+        self.assertEqual(self.mod.dictionary_lookup_variants("!!!"), [])
+
+    def test_normalize_dictionary_lookup_path_parses_ids_and_caps_items(self):
+        path = self.mod.normalize_dictionary_lookup_path(
+            [
+                {"term": "Take", "node_id": 3, "parent_id": "2", "level": " 2 "},
+                {"term": "off", "node_id": "x", "parent_id": -1, "level": 0},
+                "",
+            ]
+            + ["word"] * 30
+        )
+        self.assertEqual(
+            path[:2],
+            [
+                {"level": 2, "term": "Take", "term_norm": "take", "source": "", "node_id": 3, "parent_id": 2},
+                {"level": 2, "term": "off", "term_norm": "off", "source": ""},
+            ],
+        )
+        self.assertEqual(len(path), self.mod.DICTIONARY_LOOKUP_PATH_MAX_ITEMS)
+
+    def test_dictionary_lookup_batch_probes_fts_table_once(self):
+        connection = sqlite3.connect(str(self.db_path))
+        try:
+            self.mod.ensure_dictionary_schema(connection)
+            statements: list[str] = []
+            connection.set_trace_callback(statements.append)
+            terms = ["alpha", "beta", "gamma"]
+            self.mod.lookup_dictionary_entries_batch(connection, terms, limit=3)
+            batch_probes = sum("sqlite_master" in statement for statement in statements)
+            statements.clear()
+            self.mod.lookup_dictionary_entries_batch(
+                connection,
+                terms,
+                limit=3,
+                fts_available=False,
+            )
+            known_probes = sum("sqlite_master" in statement for statement in statements)
+        finally:
+            connection.close()
+
+        self.assertEqual(batch_probes, 1)
+        self.assertEqual(known_probes, 0)
+
+    def test_dictionary_fts_lookup_plan_is_driven_by_match_index(self):
+        connection = sqlite3.connect(str(self.db_path))
+        try:
+            self.mod.ensure_dictionary_schema(connection)
+            fts_available = connection.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'dict_entries_fts'"
+            ).fetchone()
+            if fts_available is None:
+                self.skipTest("SQLite build without FTS5")
+            plan = " | ".join(
+                str(row[-1])
+                for row in connection.execute(
+                    "EXPLAIN QUERY PLAN " + self.mod.SQL_SELECT_DICTIONARY_FTS_MATCHES,
+                    ("take", 8),
+                ).fetchall()
+            )
+        finally:
+            connection.close()
+
+        self.assertRegex(plan, r"VIRTUAL TABLE INDEX 0:M\d")
+        self.assertIn("USING INTEGER PRIMARY KEY", plan)
+
+    def test_dictionary_lookup_prefix_tier_seeks_term_norm_range(self):
+        connection = sqlite3.connect(str(self.db_path))
+        try:
+            self.mod.ensure_dictionary_schema(connection)
+            entries = [
+                ("take", "取る"),
+                ("take", "連れて行く"),
+                ("take off", "離陸する"),
+                ("takeover", "乗っ取り"),
+                ("taken", "take の過去分詞"),
+                ("takf", "範囲外"),
+                ("tak_e", "範囲外"),
+            ]
+            connection.executemany(
+                """
+                INSERT INTO dict_entries (source_name, term, term_norm, definition, created_at)
+                VALUES ('test', ?, ?, ?, '2026-03-10T00:00:00+00:00')
+                """,
+                [
+                    (term, self.mod.normalize_dictionary_term(term), definition)
+                    for term, definition in entries
+                ],
+            )
+            result = self.mod.lookup_dictionary_entries(
+                connection,
+                "Take",
+                limit=4,
+                fts_mode="off",
+            )
+            exact_only = self.mod.lookup_dictionary_entries(
+                connection,
+                "Take",
+                limit=4,
+                exact_only=True,
+                fts_mode="off",
+            )
+            plan = " | ".join(
+                str(row[-1])
+                for row in connection.execute(
+                    "EXPLAIN QUERY PLAN " + self.mod.SQL_SELECT_DICTIONARY_PREFIX_MATCHES,
+                    ("take", "takf", 3),
+                ).fetchall()
+            )
+        finally:
+            connection.close()
+
+        self.assertEqual(
+            [entry["definition"] for entry in result["results"]],
+            ["取る", "連れて行く", "take の過去分詞", "離陸する"],
+        )
+        self.assertEqual(
+            [entry["definition"] for entry in exact_only["results"]],
+            ["取る", "連れて行く"],
+        )
+        self.assertIn("idx_dict_entries_term_norm (term_norm>? AND term_norm<?)", plan)
+
+    def test_create_schema_adds_missing_columns_in_one_migration(self):
+        connection = sqlite3.connect(str(self.workspace_root / "legacy.db"))
+        try:
+            connection.executescript(
+                """
+                CREATE TABLE subtitles (
+                    source_id TEXT NOT NULL,
+                    video_id TEXT NOT NULL,
+                    subtitle_path TEXT NOT NULL,
+                    language TEXT,
+                    ext TEXT,
+                    PRIMARY KEY (source_id, video_id, subtitle_path)
+                );
+                INSERT INTO subtitles VALUES ('src', '7611111111111111111', 'a.en.vtt', 'en', 'vtt');
+                """
+            )
+            self.mod.create_schema(connection)
+            columns = {
+                row[1]
+                for row in connection.execute("PRAGMA table_info(subtitles)").fetchall()
+            }
+            self.assertTrue({"origin_kind", "origin_detail"}.issubset(columns))
+            self.assertEqual(
+                connection.execute("SELECT origin_kind, origin_detail FROM subtitles").fetchone(),
+                ("upstream", "tiktok"),
+            )
+            self.assertFalse(connection.in_transaction)
+
+            statements: list[str] = []
+            connection.set_trace_callback(statements.append)
+            self.mod.ensure_table_columns(
+                connection,
+                {
+                    "subtitles": self.mod.SUBTITLES_ORIGIN_COLUMNS,
+                    "videos": self.mod.VIDEOS_LOUDNESS_COLUMNS,
+                    "missing_table": {"extra": "TEXT"},
+                },
             )
-        )
+            connection.set_trace_callback(None)
+            self.assertFalse(any("ALTER TABLE" in statement for statement in statements))
+        finally:
+            connection.close()
 
-    def test_get_source_network_cooldown_state_clears_transient_webpage_cooldown(self):
+    def test_fetch_retry_plan_matches_split_and_due_queries(self):
+        now_iso = "2026-03-11T00:00:00+00:00"
+        states = [
+            ("7611111111111111111", "error", "2026-03-12T00:00:00+00:00", "2026-03-10T00:00:01+00:00"),
+            ("7622222222222222222", "error", "2026-03-10T00:00:00+00:00", "2026-03-10T00:00:02+00:00"),
+            ("7633333333333333333", "success", None, "2026-03-10T00:00:03+00:00"),
+            ("7644444444444444444", "error", None, "2026-03-10T00:00:00+00:00"),
+        ]
         connection = sqlite3.connect(str(self.db_path))
         try:
             self.mod.create_schema(connection)
-            future_block = "2026-03-12T00:00:00+00:00"
-            self.mod.upsert_source_access_state(
+            for video_id, status, next_retry_at, updated_at in states:
+                self.mod.upsert_download_state(
+                    connection=connection,
+                    source_id="storiesofcz",
+                    stage="meta",
+                    video_id=video_id,
+                    status=status,
+                    run_id=None,
+                    attempt_at=updated_at,
+                    retry_count=1,
+                    next_retry_at=next_retry_at,
+                )
+            candidate_ids = [
+                "7611111111111111111",
+                "7622222222222222222",
+                "7633333333333333333",
+                "7655555555555555555",
+            ]
+            expected_split = self.mod.split_retryable_ids(
                 connection=connection,
                 source_id="storiesofcz",
-                blocked_until=future_block,
-                last_error=(
-                    "ERROR: [TikTok] 7611111111111111111: "
-                    "Unable to extract universal data for rehydration"
-                ),
-                updated_at="2026-03-11T00:00:00+00:00",
+                stage="meta",
+                candidate_ids=candidate_ids,
+                now_iso=now_iso,
             )
-            connection.commit()
-
-            active, remaining_hours, blocked_until, last_error = self.mod.get_source_network_cooldown_state(
-                connection=connection,
-                source_id="storiesofcz",
-                now_dt=dt.datetime(2026, 3, 11, 1, 0, tzinfo=dt.timezone.utc),
+            expected_due = self.mod.get_due_retry_ids(
+                connection, "storiesofcz", "meta", now_iso=now_iso
             )
-
-            row = connection.execute(
-                "SELECT blocked_until FROM source_access_state WHERE source_id = ?",
-                ("storiesofcz",),
-            ).fetchone()
+            plan = self.mod.fetch_retry_plan(
+                connection, "storiesofcz", "meta", candidate_ids, now_iso=now_iso
+            )
+            scoped_plan = self.mod.fetch_retry_plan(
+                connection,
+                "storiesofcz",
+                "meta",
+                candidate_ids,
+                include_due_retries=False,
+                now_iso=now_iso,
+            )
+            with mock.patch.object(self.mod, "SQLITE_IN_CLAUSE_BATCH_SIZE", 2):
+                chunked_plan = self.mod.fetch_retry_plan(
+                    connection, "storiesofcz", "meta", candidate_ids, limit=1, now_iso=now_iso
+                )
         finally:
             connection.close()
 
-        self.assertFalse(active)
-        self.assertEqual(remaining_hours, 0.0)
-        self.assertIsNone(blocked_until)
-        self.assertIn("rehydration", str(last_error).lower())
-        self.assertIsNotNone(row)
-        self.assertIsNone(row[0])
+        self.assertEqual((plan.retryable_ids, plan.deferred_ids), expected_split)
+        self.assertEqual(plan.due_retry_ids, expected_due)
+        self.assertEqual(plan.due_retry_ids, ["7644444444444444444", "7622222222222222222"])
+        self.assertEqual(scoped_plan.due_retry_ids, [])
+        self.assertEqual((scoped_plan.retryable_ids, scoped_plan.deferred_ids), expected_split)
+        self.assertEqual((chunked_plan.retryable_ids, chunked_plan.deferred_ids), expected_split)
+        self.assertEqual(chunked_plan.due_retry_ids, ["7644444444444444444"])
 
     def test_show_queue_status_report_summarizes_due_wait_dead(self):
         source_root = self.workspace_root / "storiesofcz_queue_status"
@@ -4854,6 +6074,59 @@ data_dir = "{source_root}"
         self.assertEqual(result, 0)
         self.assertEqual(run_sync_mock.call_args.kwargs["limit"], None)
 
+    def test_parse_args_builds_only_the_invoked_command_parser(self):
+        self.mod.clear_cli_parser_cache()
+        self.addCleanup(self.mod.clear_cli_parser_cache)
+        sync_help, _sync_builder, sync_shared_options = self.mod.CLI_COMMANDS["sync"]
+        sync_builder = mock.Mock()
+        with mock.patch.dict(
+            self.mod.CLI_COMMANDS,
+            {"sync": (sync_help, sync_builder, sync_shared_options)},
+        ):
+            args = self.mod.parse_args(["web", "--port", "9000"])
+            sync_builder.assert_not_called()
+            with self.assertRaises(SystemExit), mock.patch("sys.stderr", io.StringIO()):
+                self.mod.parse_args(["bogus"])
+            sync_builder.assert_called_once()
+
+        self.assertEqual(args.command, "web")
+        self.assertEqual(args.port, 9000)
+        self.assertEqual(args.host, self.mod.DEFAULT_WEB_HOST)
+        self.assertEqual(args.config, self.mod.DEFAULT_CONFIG)
+        self.assertIsNone(args.sources)
+        self.assertIsNone(args.ledger_db)
+        web_parser = self.mod.build_cli_parser("web")
+        self.assertIs(self.mod.build_cli_parser("web"), web_parser)
+        self.assertEqual(self.mod.parse_args(["web"]).port, self.mod.DEFAULT_WEB_PORT)
+
+    def test_parse_args_normalizes_choice_case_and_clamps_counts(self):
+        args = self.mod.parse_args(
+            ["dict-bookmarks-curate", "--preset", "Review_Cards", "--format", " CSV ", "--limit", "0"]
+        )
+        self.assertEqual(args.preset, "review_cards")
+        self.assertEqual(args.format, "csv")
+        self.assertEqual(args.limit, 1)
+
+        args = self.mod.parse_args(["loudness", "--max-boost-db", "-3", "--limit", "-5"])
+        self.assertEqual(args.max_boost_db, 0.0)
+        self.assertEqual(args.limit, 1)
+
+    def test_notify_uninstall_main_skips_config_loading(self):
+        with (
+            mock.patch.object(
+                self.mod.sys,
+                "argv",
+                ["substudy.py", "notify-uninstall-macos", "--label", "com.example.notify"],
+            ),
+            mock.patch.object(self.mod, "load_config") as load_config_mock,
+            mock.patch.object(self.mod, "run_notify_uninstall_macos") as uninstall_mock,
+        ):
+            result = self.mod.main()
+
+        self.assertEqual(result, 0)
+        load_config_mock.assert_not_called()
+        uninstall_mock.assert_called_once_with(label="com.example.notify", plist_path=None)
+
     def test_sync_source_skips_retry_subtitle_when_local_file_exists(self):
         source_root = self.workspace_root / "storiesofcz_subs_retry_existing"
         source_root.mkdir(parents=True, exist_ok=True)
@@ -6145,6 +7418,378 @@ enabled = true
             payload = json.loads(response.read().decode("utf-8"))
         self.assertFalse(payload["videos"][0]["is_favorite"])
 
+    def test_json_dumps_compact_matches_stdlib_with_and_without_orjson(self):
+        value = [{"level": 1, "term": "気楽", "term_norm": "take it easy", "source": "dictionary"}]
+        expected = json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+        self.assertEqual(self.mod.json_dumps_compact(value), expected)
+        self.assertEqual(json.loads(self.mod.encode_json_response_body({"value": value})), {"value": value})
+        with mock.patch.object(self.mod, "orjson", None):
+            self.assertEqual(self.mod.json_dumps_compact(value), expected)
+            self.assertEqual(
+                self.mod.encode_json_response_body({1: "x"}),
+                json.dumps({1: "x"}, ensure_ascii=False).encode("utf-8"),
+            )
+
+    def test_write_records_as_jsonl_or_csv_round_trips(self):
+        records = [
+            {"term": "気楽", "missing_entry": True, "lookup_path": ["take", "it"]},
+            {"term": "easy", "missing_entry": False, "lookup_path": []},
+        ]
+        jsonl_path = self.workspace_root / "exports" / "records.jsonl"
+        self.mod.write_records_as_jsonl_or_csv(records, jsonl_path, "jsonl")
+        lines = jsonl_path.read_text(encoding="utf-8").splitlines()
+        self.assertEqual([json.loads(line) for line in lines], records)
+        self.assertIn("気楽", lines[0])
+
+        csv_path = self.workspace_root / "exports" / "records.csv"
+        self.mod.write_records_as_jsonl_or_csv(records, csv_path, "csv")
+        with csv_path.open(encoding="utf-8", newline="") as handle:
+            rows = list(csv.DictReader(handle))
+        self.assertEqual([row["term"] for row in rows], ["気楽", "easy"])
+
+    def test_dict_bookmark_export_writes_same_lookup_path_json_for_jsonl_and_csv(self):
+        lookup_path = [{"level": 1, "term": "気楽", "term_norm": "気楽"}]
+        connection = sqlite3.connect(str(self.db_path))
+        try:
+            connection.execute(
+                """
+                INSERT INTO dictionary_bookmarks(
+                    source_id, video_id, track, cue_start_ms, cue_end_ms, cue_text,
+                    dict_entry_id, dict_source_name, lookup_term, term, term_norm,
+                    definition, missing_entry, lookup_path_json, lookup_path_label,
+                    created_at, updated_at
+                )
+                VALUES ('storiesofcz', '7611111111111111111', 'en', 0, 1000, 'cue',
+                        1, 'eijiro', '気楽', '気楽', '気楽', 'easy', 0, ?, '気楽',
+                        '2026-03-10T00:00:00+00:00', '2026-03-10T00:00:00+00:00')
+                """,
+                (json.dumps(lookup_path, ensure_ascii=False),),
+            )
+            connection.commit()
+        finally:
+            connection.close()
+
+        exports_dir = self.workspace_root / "exports"
+        for output_format in ("jsonl", "csv"):
+            self.mod.run_dict_bookmarks_export(
+                db_path=self.db_path,
+                source_ids=["storiesofcz"],
+                output_path=exports_dir / f"bookmarks.{output_format}",
+                output_format=output_format,
+                entry_status="all",
+                limit=0,
+            )
+        self.mod.run_dict_bookmarks_curate(
+            db_path=self.db_path,
+            source_ids=["storiesofcz"],
+            preset="recent_saved",
+            output_path=exports_dir / "bookmarks_recent.jsonl",
+            output_format="jsonl",
+            limit=10,
+            min_bookmarks=1,
+            min_videos=1,
+        )
+
+        jsonl_line = (exports_dir / "bookmarks.jsonl").read_text(encoding="utf-8").strip()
+        with (exports_dir / "bookmarks.csv").open(encoding="utf-8", newline="") as handle:
+            csv_rows = list(csv.DictReader(handle))
+        self.assertEqual(len(csv_rows), 1)
+        self.assertIn("気楽", csv_rows[0]["lookup_path_json"])
+        self.assertIn(f'"lookup_path":{csv_rows[0]["lookup_path_json"]},', jsonl_line)
+        self.assertTrue((exports_dir / "bookmarks_recent.jsonl").read_text(encoding="utf-8"))
+
+    def test_decode_json_request_body_with_and_without_orjson(self):
+        raw_body = json.dumps({"term": "気楽", "cue_start_ms": 1200}, ensure_ascii=False).encode("utf-8")
+        expected = {"term": "気楽", "cue_start_ms": 1200}
+        self.assertEqual(self.mod.decode_json_request_body(raw_body), expected)
+        with self.assertRaises(ValueError):
+            self.mod.decode_json_request_body(b"\xff{")
+        with mock.patch.object(self.mod, "orjson", None):
+            self.assertEqual(self.mod.decode_json_request_body(raw_body), expected)
+            with self.assertRaises(ValueError):
+                self.mod.decode_json_request_body(b"\xff{")
+
+    def test_probe_video_track_matches_collect_video_tracks(self):
+        subtitle_path = self.workspace_root / "probe.en.vtt"
+        subtitle_path.write_text("WEBVTT\n", encoding="utf-8")
+        stale_subtitle_path = self.workspace_root / "stale.en.vtt"
+        asr_path = self.workspace_root / "probe.asr.srt"
+        asr_path.write_text("", encoding="utf-8")
+        now_iso = dt.datetime(2026, 3, 10, 0, 0, tzinfo=dt.timezone.utc).isoformat()
+
+        connection = sqlite3.connect(str(self.db_path))
+        try:
+            connection.execute(
+                "INSERT INTO videos(source_id, video_id, title, has_media, synced_at) VALUES (?, ?, ?, ?, ?)",
+                ("storiesofcz", "probe-video", "probe", 0, now_iso),
+            )
+            for path in (subtitle_path, stale_subtitle_path):
+                connection.execute(
+                    "INSERT INTO subtitles(source_id, video_id, language, subtitle_path, ext) VALUES (?, ?, ?, ?, ?)",
+                    ("storiesofcz", "probe-video", "en", str(path), "vtt"),
+                )
+            connection.execute(
+                "INSERT INTO asr_runs(source_id, video_id, status, output_path, updated_at) VALUES (?, ?, ?, ?, ?)",
+                ("storiesofcz", "probe-video", "success", str(asr_path), now_iso),
+            )
+            connection.commit()
+
+            tracks = self.mod.collect_video_tracks(connection, "storiesofcz", "probe-video")
+            self.assertEqual(len(tracks), 2)
+            for track in tracks:
+                self.assertEqual(
+                    self.mod.probe_video_track(connection, "storiesofcz", "probe-video", track["track_id"]),
+                    (True, True),
+                )
+            stale_track_id = f"subtitle:{self.mod.encode_path_token(stale_subtitle_path)}"
+            self.assertEqual(
+                self.mod.probe_video_track(connection, "storiesofcz", "probe-video", stale_track_id),
+                (True, False),
+            )
+            self.assertEqual(
+                self.mod.probe_video_track(connection, "storiesofcz", "probe-video", "subtitle:not-a-token"),
+                (True, False),
+            )
+            self.assertEqual(
+                self.mod.probe_video_track(connection, "storiesofcz", "missing-video", tracks[0]["track_id"]),
+                (False, False),
+            )
+        finally:
+            connection.close()
+
+    def test_dictionary_bookmark_toggle_saves_then_removes(self):
+        now_iso = dt.datetime(2026, 3, 10, 0, 0, tzinfo=dt.timezone.utc).isoformat()
+        connection = sqlite3.connect(str(self.db_path))
+        try:
+            connection.execute(
+                """
+                INSERT INTO videos(source_id, video_id, title, has_media, synced_at)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                ("storiesofcz", "7611111111111111777", "dict", 0, now_iso),
+            )
+            connection.commit()
+        finally:
+            connection.close()
+
+        handler_class = self.mod.build_web_handler(
+            db_path=self.db_path,
+            static_dir=self.mod.WEB_STATIC_DIR,
+            allowed_source_ids=set(),
+            restrict_to_source_ids=False,
+        )
+        server = self.mod.ThreadingHTTPServer(("127.0.0.1", 0), handler_class)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        self.addCleanup(lambda: thread.join(timeout=3))
+
+        host, port = server.server_address
+        toggle_url = f"http://{host}:{port}/api/dictionary-bookmarks/toggle"
+        toggle_body = json.dumps(
+            {
+                "source_id": "storiesofcz",
+                "video_id": "7611111111111111777",
+                "cue_start_ms": 2000,
+                "cue_end_ms": 1000,
+                "cue_text": "take it easy",
+                "dict_entry_id": 42,
+                "term": "take it easy",
+                "definition": "気楽にやる",
+            }
+        ).encode("utf-8")
+
+        def post_toggle() -> dict:
+            request = urllib.request.Request(
+                toggle_url,
+                data=toggle_body,
+                headers={"Content-Type": "application/json"},
+                method="POST",
+            )
+            with urllib.request.urlopen(request, timeout=5) as response:
+                self.assertEqual(response.status, 200)
+                return json.loads(response.read().decode("utf-8"))
+
+        saved_payload = post_toggle()
+        self.assertEqual(saved_payload["status"], "saved")
+        self.assertEqual(saved_payload["bookmark"]["cue_start_ms"], 1000)
+        self.assertEqual(saved_payload["bookmark"]["cue_end_ms"], 2000)
+        self.assertEqual(saved_payload["bookmark"]["term"], "take it easy")
+
+        removed_payload = post_toggle()
+        self.assertEqual(removed_payload["status"], "removed")
+        self.assertEqual(removed_payload["bookmark"]["id"], saved_payload["bookmark"]["id"])
+
+        connection = sqlite3.connect(str(self.db_path))
+        try:
+            remaining = connection.execute("SELECT COUNT(*) FROM dictionary_bookmarks").fetchone()[0]
+        finally:
+            connection.close()
+        self.assertEqual(remaining, 0)
+
+    def test_bookmarks_post_accepts_array_payload(self):
+        now_iso = dt.datetime(2026, 3, 10, 0, 0, tzinfo=dt.timezone.utc).isoformat()
+        connection = sqlite3.connect(str(self.db_path))
+        try:
+            connection.execute(
+                """
+                INSERT INTO videos(source_id, video_id, title, has_media, synced_at)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                ("storiesofcz", "7611111111111111666", "batch", 0, now_iso),
+            )
+            connection.commit()
+        finally:
+            connection.close()
+
+        handler_class = self.mod.build_web_handler(
+            db_path=self.db_path,
+            static_dir=self.mod.WEB_STATIC_DIR,
+            allowed_source_ids=set(),
+            restrict_to_source_ids=False,
+        )
+        server = self.mod.ThreadingHTTPServer(("127.0.0.1", 0), handler_class)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        self.addCleanup(lambda: thread.join(timeout=3))
+
+        host, port = server.server_address
+        bookmarks_url = f"http://{host}:{port}/api/bookmarks"
+
+        def post_bookmarks(body: object) -> urllib.request.Request:
+            return urllib.request.Request(
+                bookmarks_url,
+                data=json.dumps(body).encode("utf-8"),
+                headers={"Content-Type": "application/json"},
+                method="POST",
+            )
+
+        rows = [
+            {"source_id": "storiesofcz", "video_id": "7611111111111111666", "start_ms": 100, "end_ms": 900, "text": "one"},
+            {"source_id": "storiesofcz", "video_id": "7611111111111111666", "start_ms": 2500, "end_ms": 2000, "text": "two"},
+        ]
+        with urllib.request.urlopen(post_bookmarks(rows), timeout=5) as response:
+            self.assertEqual(response.status, 201)
+            payload = json.loads(response.read().decode("utf-8"))
+        self.assertEqual([item["text"] for item in payload["bookmarks"]], ["one", "two"])
+        self.assertEqual(payload["bookmarks"][1]["start_ms"], 2000)
+        self.assertEqual(payload["bookmarks"][1]["end_ms"], 2500)
+
+        invalid_rows = [
+            {"source_id": "storiesofcz", "video_id": "7611111111111111666", "start_ms": 1, "end_ms": 2},
+            {"source_id": "storiesofcz", "video_id": "missing-video", "start_ms": 1, "end_ms": 2},
+        ]
+        with self.assertRaises(urllib.error.HTTPError) as ctx:
+            urllib.request.urlopen(post_bookmarks(invalid_rows), timeout=5)
+        self.assertEqual(ctx.exception.code, 404)
+        body = json.loads(ctx.exception.read().decode("utf-8"))
+        self.assertEqual(body.get("error"), "bookmarks[1]: Video not found.")
+        ctx.exception.close()
+
+        connection = sqlite3.connect(str(self.db_path))
+        try:
+            count = connection.execute("SELECT COUNT(*) FROM subtitle_bookmarks").fetchone()[0]
+        finally:
+            connection.close()
+        self.assertEqual(count, 2)
+
+    def test_substudy_web_server_serves_requests_on_worker_pool(self):
+        handler_class = self.mod.build_web_handler(
+            db_path=self.db_path,
+            static_dir=self.mod.WEB_STATIC_DIR,
+            allowed_source_ids=set(),
+            restrict_to_source_ids=False,
+        )
+        server = self.mod.SubstudyWebServer(("127.0.0.1", 0), handler_class, max_workers=2)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        self.addCleanup(lambda: thread.join(timeout=3))
+
+        host, port = server.server_address
+        feed_url = f"http://{host}:{port}/api/feed?limit=5&offset=0"
+        for _ in range(4):
+            with urllib.request.urlopen(feed_url, timeout=5) as response:
+                self.assertEqual(response.status, 200)
+                payload = json.loads(response.read().decode("utf-8"))
+            self.assertEqual(payload.get("count"), 0)
+
+    def test_substudy_web_server_close_shuts_down_queued_requests(self):
+        handler_class = self.mod.build_web_handler(
+            db_path=self.db_path,
+            static_dir=self.mod.WEB_STATIC_DIR,
+            allowed_source_ids=set(),
+            restrict_to_source_ids=False,
+        )
+        server = self.mod.SubstudyWebServer(("127.0.0.1", 0), handler_class, max_workers=1)
+        release = threading.Event()
+        self.addCleanup(release.set)
+        server._executor.submit(release.wait, 5)
+        queued_request = mock.Mock()
+
+        with mock.patch.object(server, "process_request_thread") as thread_mock, mock.patch.object(
+            server,
+            "shutdown_request",
+        ) as shutdown_mock:
+            server.process_request(queued_request, ("127.0.0.1", 1))
+            server.server_close()
+            release.set()
+
+        thread_mock.assert_not_called()
+        shutdown_mock.assert_called_once_with(queued_request)
+        self.assertEqual(server._pending_requests, {})
+
+    def test_list_endpoints_stream_json_without_orjson(self):
+        now_iso = dt.datetime(2026, 3, 10, 0, 0, tzinfo=dt.timezone.utc).isoformat()
+        connection = sqlite3.connect(str(self.db_path))
+        try:
+            connection.execute(
+                "INSERT INTO videos(source_id, video_id, title, has_media, synced_at) VALUES (?, ?, ?, ?, ?)",
+                ("storiesofcz", "7611111111111111555", "stream", 0, now_iso),
+            )
+            connection.executemany(
+                """
+                INSERT INTO subtitle_bookmarks(source_id, video_id, start_ms, end_ms, text, note, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                [
+                    ("storiesofcz", "7611111111111111555", index, index + 1, "字幕" * 200, "", now_iso)
+                    for index in range(300)
+                ],
+            )
+            connection.commit()
+        finally:
+            connection.close()
+
+        handler_class = self.mod.build_web_handler(
+            db_path=self.db_path,
+            static_dir=self.mod.WEB_STATIC_DIR,
+            allowed_source_ids=set(),
+            restrict_to_source_ids=False,
+        )
+        server = self.mod.ThreadingHTTPServer(("127.0.0.1", 0), handler_class)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        self.addCleanup(lambda: thread.join(timeout=3))
+
+        host, port = server.server_address
+        bookmarks_url = (
+            f"http://{host}:{port}/api/bookmarks?source_id=storiesofcz&video_id=7611111111111111555&limit=500"
+        )
+        with mock.patch.object(self.mod, "orjson", None):
+            with urllib.request.urlopen(bookmarks_url, timeout=5) as response:
+                self.assertEqual(response.status, 200)
+                self.assertIsNone(response.headers.get("Content-Length"))
+                payload = json.loads(response.read().decode("utf-8"))
+        self.assertEqual(len(payload["bookmarks"]), 300)
+        self.assertEqual(payload["bookmarks"][0]["text"], "字幕" * 200)
+
     def test_media_endpoint_serves_registered_video_file(self):
         media_path = self.workspace_root / "registered.mp4"
         media_bytes = b"registered-media"
@@ -6576,7 +8221,7 @@ enabled = true
             )
 
             insert_video(no_ja_video_id, "video-no-ja.mp4")
-            self.mod.ensure_subtitles_origin_columns(connection)
+            self.mod.create_schema(connection)
             connection.commit()
         finally:
             connection.close()
@@ -6783,7 +8428,7 @@ enabled = true
                 """,
                 ("alpha", "video-stale", "ja", str(stale_subtitle_path), "vtt"),
             )
-            self.mod.ensure_subtitles_origin_columns(connection)
+            self.mod.create_schema(connection)
             connection.commit()
         finally:
             connection.close()
@@ -6893,7 +8538,7 @@ enabled = true
                 started_at=now_iso,
                 finished_at=now_iso,
             )
-            self.mod.ensure_subtitles_origin_columns(connection)
+            self.mod.create_schema(connection)
             connection.commit()
         finally:
             connection.close()
@@ -7051,7 +8696,7 @@ enabled = true
                 started_at=now_iso,
                 finished_at=now_iso,
             )
-            self.mod.ensure_subtitles_origin_columns(connection)
+            self.mod.create_schema(connection)
             connection.commit()
         finally:
             connection.close()